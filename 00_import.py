@@ -1,25 +1,74 @@
 import os
 import json 
 import asyncio 
-from datetime import datetime , timedelta
-from typing import Annotated, Any, Optional, List , Dict , TypedDict, Literal, Union
+from datetime import date, datetime , timedelta
+from typing import Annotated, Any, Optional, List , Dict , TypedDict, Literal, Union, Iterable, Iterator, AsyncIterator, Awaitable, Callable
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field, asdict
+from contextlib import contextmanager
+import contextlib
+import contextvars
 from pathlib import Path
+from array import array
+import csv
 import hashlib
-from collections import defaultdict
+import io
+import itertools
+import operator
+import pickle
+import random
+import zipfile
+from urllib.parse import unquote
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+import zlib
+from collections import defaultdict, deque
 from enum import Enum
 import logging
 import structlog 
 
+# HTTP clients (Proxycurl) and the error types retries classify
+import httpx
+import openai
+import requests
+from requests.adapters import HTTPAdapter
+
+# Optional: vectorized analytics engine
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional: peak RSS in benchmarks (Unix only)
+try:
+    import resource
+except ImportError:
+    resource = None
+
 #reuse data models 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 from enum import Enum
 
 # LangGraph imports
 from langgraph.graph import StateGraph, END
+from langgraph.graph.message import add_messages
+from langgraph.checkpoint.base import BaseCheckpointSaver, ChannelVersions, Checkpoint, CheckpointMetadata, CheckpointTuple, WRITES_IDX_MAP, get_checkpoint_id, get_checkpoint_metadata, writes_sort_key
+from langgraph.config import get_stream_writer
+from langgraph.runtime import get_runtime
+from langgraph.types import RetryPolicy
 from langgraph.prebuilt.tool_node import ToolNode
 from langchain_core.tools import tool
 from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
 from langchain_openai import AzureChatOpenAI
 
 #load environment variables 
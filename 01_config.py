@@ -1,25 +1,74 @@
 import os
 import json 
 import asyncio 
-from datetime import datetime , timedelta
-from typing import Annotated, Any, Optional, List , Dict , TypedDict, Literal, Union
+from datetime import date, datetime , timedelta
+from typing import Annotated, Any, Optional, List , Dict , TypedDict, Literal, Union, Iterable, Iterator, AsyncIterator, Awaitable, Callable
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field, asdict
+from contextlib import contextmanager
+import contextlib
+import contextvars
 from pathlib import Path
+from array import array
+import csv
 import hashlib
-from collections import defaultdict
+import io
+import itertools
+import operator
+import pickle
+import random
+import zipfile
+from urllib.parse import unquote
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+import zlib
+from collections import defaultdict, deque
 from enum import Enum
 import logging
 import structlog 
 
+# HTTP clients (Proxycurl) and the error types retries classify
+import httpx
+import openai
+import requests
+from requests.adapters import HTTPAdapter
+
+# Optional: vectorized analytics engine
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional: peak RSS in benchmarks (Unix only)
+try:
+    import resource
+except ImportError:
+    resource = None
+
 #reuse data models 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 from enum import Enum
 
 # LangGraph imports
 from langgraph.graph import StateGraph, END
+from langgraph.graph.message import add_messages
+from langgraph.checkpoint.base import BaseCheckpointSaver, ChannelVersions, Checkpoint, CheckpointMetadata, CheckpointTuple, WRITES_IDX_MAP, get_checkpoint_id, get_checkpoint_metadata, writes_sort_key
+from langgraph.config import get_stream_writer
+from langgraph.runtime import get_runtime
+from langgraph.types import RetryPolicy
 from langgraph.prebuilt.tool_node import ToolNode
 from langchain_core.tools import tool
 from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
 from langchain_openai import AzureChatOpenAI
 
 #load environment variables 
@@ -39,6 +88,18 @@ AZURE_OPENAI_API_KEY = os.getenv("AI_FOUNDRY_API_KEY")
 AZURE_OPENAI_DEPLOYMENT = os.getenv("AI_FOUNDRY_DEPLOYMENT_NAME", "gpt-4.1")
 AZURE_OPENAI_API_VERSION = os.getenv("AI_FOUNDRY_API_VERSION", "2024-12-01-preview")
 
+#LLM gateway: per-deployment RPM/TPM quotas, adaptive concurrency, retries and circuit breaking.
+#Extra deployments: JSON list of {"endpoint", "api_key", "deployment", "api_version", "rpm", "tpm"}; omitted keys use the values above
+LLM_EXTRA_DEPLOYMENTS = json.loads(os.getenv("LAIE_LLM_DEPLOYMENTS", "[]"))
+LLM_RPM_LIMIT = int(os.getenv("LAIE_LLM_RPM_LIMIT", "300"))
+LLM_TPM_LIMIT = int(os.getenv("LAIE_LLM_TPM_LIMIT", "150000"))
+LLM_MAX_CONCURRENCY = int(os.getenv("LAIE_LLM_MAX_CONCURRENCY", "16"))
+LLM_MAX_RETRIES = int(os.getenv("LAIE_LLM_MAX_RETRIES", "4"))
+LLM_BACKOFF_SECONDS = float(os.getenv("LAIE_LLM_BACKOFF_SECONDS", "1.0"))
+LLM_REQUEST_TIMEOUT_SECONDS = float(os.getenv("LAIE_LLM_REQUEST_TIMEOUT_SECONDS", "60"))
+LLM_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("LAIE_LLM_CIRCUIT_FAILURE_THRESHOLD", "5"))
+LLM_CIRCUIT_RESET_SECONDS = float(os.getenv("LAIE_LLM_CIRCUIT_RESET_SECONDS", "30"))
+
 
 #linkedin data sources 
 LINKEDIN_EMAIL = os.getenv("LINKEDIN_EMAIL")
@@ -46,6 +107,106 @@ LINKEDIN_PASSWORD = os.getenv("LINKEDIN_PASSWORD")
 LINKEDIN_LI_AT = os.getenv("LINKEDIN_LI_AT")
 PROXYCURL_API_KEY = os.getenv("PROXYCURL_API_KEY")
 
-#Analysis Time window 
-ANALYSIS_START_DATE = datetime(2025, 1, 1)
-ANALYSIS_END_DATE = datetime(2026, 1, 1)
+#Analysis Time window: [start, end) from LAIE_ANALYSIS_START_DATE / LAIE_ANALYSIS_END_DATE (ISO dates),
+#or the trailing LAIE_ANALYSIS_ROLLING_DAYS days up to and including today when that is set
+ANALYSIS_ROLLING_DAYS = int(os.getenv("LAIE_ANALYSIS_ROLLING_DAYS", "0"))
+if ANALYSIS_ROLLING_DAYS > 0:
+    ANALYSIS_END_DATE = datetime.combine(date.today() + timedelta(days=1), datetime.min.time())
+    ANALYSIS_START_DATE = ANALYSIS_END_DATE - timedelta(days=ANALYSIS_ROLLING_DAYS)
+else:
+    ANALYSIS_START_DATE = datetime.fromisoformat(os.getenv("LAIE_ANALYSIS_START_DATE", "2025-01-01"))
+    ANALYSIS_END_DATE = datetime.fromisoformat(os.getenv("LAIE_ANALYSIS_END_DATE", "2026-01-01"))
+
+#Monthly note generation: number of LLM calls in flight at once (1 = sequential)
+MONTHLY_NOTE_CONCURRENCY = int(os.getenv("LAIE_MONTHLY_NOTE_CONCURRENCY", "6"))
+
+#Monthly note mode: "per_month" (one call per month) or "multi_month" (several months per call, sized to a token budget)
+MONTHLY_NOTES_MODE = os.getenv("LAIE_MONTHLY_NOTES_MODE", "per_month")
+MONTHLY_BATCH_TOKEN_BUDGET = int(os.getenv("LAIE_MONTHLY_BATCH_TOKEN_BUDGET", "8000"))
+MONTHLY_BATCH_MAX_MONTHS = int(os.getenv("LAIE_MONTHLY_BATCH_MAX_MONTHS", "12"))
+MONTHLY_NOTE_COMPLETION_TOKENS = int(os.getenv("LAIE_MONTHLY_NOTE_COMPLETION_TOKENS", "350"))
+
+#LLM response cache (content-addressed, stored on local disk)
+LLM_CACHE_ENABLED = os.getenv("LAIE_LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_PATH = Path(os.getenv("LAIE_LLM_CACHE_PATH", ".laie_cache/llm_cache.sqlite"))
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LAIE_LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LAIE_LLM_CACHE_MAX_ENTRIES", "50000"))
+
+#Single-flight: concurrent identical LLM requests (same deployment, temperature and prompt) share one upstream call
+LLM_SINGLE_FLIGHT_ENABLED = os.getenv("LAIE_LLM_SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+
+#Incremental re-analysis: last successful outputs per profile
+ANALYSIS_STORE_PATH = Path(os.getenv("LAIE_ANALYSIS_STORE_PATH", ".laie_cache/analysis_store.sqlite"))
+
+#Analytics engine: "columnar" (NumPy), "python" (per-post objects) or "auto" (columnar when NumPy is installed)
+ANALYTICS_ENGINE = os.getenv("LAIE_ANALYTICS_ENGINE", "auto")
+
+#Batch analysis: profiles in flight at once, and worker processes for analytics
+BATCH_MAX_CONCURRENCY = int(os.getenv("LAIE_BATCH_MAX_CONCURRENCY", "8"))
+BATCH_ANALYTICS_WORKERS = int(os.getenv("LAIE_BATCH_ANALYTICS_WORKERS", str(os.cpu_count() or 1)))
+
+#GDPR export parsing: rows mapped to LinkedInPost per chunk while streaming the archive
+GDPR_CHUNK_SIZE = int(os.getenv("LAIE_GDPR_CHUNK_SIZE", "1000"))
+
+#linkedin-api paginated fetching
+LINKEDIN_API_PAGE_SIZE = int(os.getenv("LAIE_LINKEDIN_API_PAGE_SIZE", "50"))
+LINKEDIN_API_MAX_PAGES = int(os.getenv("LAIE_LINKEDIN_API_MAX_PAGES", "200"))
+LINKEDIN_API_RATE_PER_SECOND = float(os.getenv("LAIE_LINKEDIN_API_RATE_PER_SECOND", "0.5"))
+LINKEDIN_API_BURST = int(os.getenv("LAIE_LINKEDIN_API_BURST", "3"))
+FETCH_CHECKPOINT_PATH = Path(os.getenv("LAIE_FETCH_CHECKPOINT_PATH", ".laie_cache/fetch_checkpoints.sqlite"))
+#Checkpoints older than this are dropped: the feed has shifted since, so their offsets no longer line up
+FETCH_CHECKPOINT_MAX_AGE_SECONDS = int(os.getenv("LAIE_FETCH_CHECKPOINT_MAX_AGE_SECONDS", str(6 * 3600)))
+
+#Proxycurl source: pooled connections, retries on 429/5xx, local response cache per public_id
+PROXYCURL_POOL_SIZE = int(os.getenv("LAIE_PROXYCURL_POOL_SIZE", "16"))
+PROXYCURL_MAX_RETRIES = int(os.getenv("LAIE_PROXYCURL_MAX_RETRIES", "4"))
+PROXYCURL_BACKOFF_SECONDS = float(os.getenv("LAIE_PROXYCURL_BACKOFF_SECONDS", "1.0"))
+#Longest Retry-After honoured; a server asking for more fails the request instead of stalling the run
+PROXYCURL_MAX_RETRY_AFTER_SECONDS = float(os.getenv("LAIE_PROXYCURL_MAX_RETRY_AFTER_SECONDS", "60"))
+PROXYCURL_CACHE_PATH = Path(os.getenv("LAIE_PROXYCURL_CACHE_PATH", ".laie_cache/proxycurl_cache.sqlite"))
+PROXYCURL_CACHE_TTL_SECONDS = int(os.getenv("LAIE_PROXYCURL_CACHE_TTL_SECONDS", str(24 * 3600)))
+
+#Ingestion store: normalized profiles/posts per user and month, served while younger than the staleness bound
+INGESTION_STORE_ENABLED = os.getenv("LAIE_INGESTION_STORE_ENABLED", "true").lower() == "true"
+INGESTION_STORE_PATH = Path(os.getenv("LAIE_INGESTION_STORE_PATH", ".laie_cache/ingestion_store.sqlite"))
+INGESTION_MAX_AGE_SECONDS = int(os.getenv("LAIE_INGESTION_MAX_AGE_SECONDS", str(12 * 3600)))
+
+#Benchmarks: where run_benchmarks writes its JSON results / baseline
+BENCHMARK_BASELINE_PATH = Path(os.getenv("LAIE_BENCHMARK_BASELINE_PATH", "benchmarks/baseline.json"))
+
+#Telemetry: rolling window per stage for p50/p95, and optional OTLP/HTTP span export (e.g. http://localhost:4318/v1/traces)
+TELEMETRY_WINDOW = int(os.getenv("LAIE_TELEMETRY_WINDOW", "500"))
+TELEMETRY_OTLP_ENDPOINT = os.getenv("LAIE_OTLP_ENDPOINT") or os.getenv("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT")
+
+#Prompt compaction: tiktoken encoding for token counts and hard per-prompt budgets
+TOKEN_ENCODING = os.getenv("LAIE_TOKEN_ENCODING", "o200k_base")
+SUMMARY_PROMPT_TOKEN_BUDGET = int(os.getenv("LAIE_SUMMARY_PROMPT_TOKEN_BUDGET", "900"))
+PROMPT_MAX_MONTH_ROWS = int(os.getenv("LAIE_PROMPT_MAX_MONTH_ROWS", "12"))
+
+#Structured output: repair retries when an LLM reply does not validate against its JSON schema
+STRUCTURED_OUTPUT_MAX_REPAIRS = int(os.getenv("LAIE_STRUCTURED_OUTPUT_MAX_REPAIRS", "2"))
+
+#Durable graph checkpoints (SQLite) so failed or interrupted runs can resume instead of starting over
+CHECKPOINT_ENABLED = os.getenv("LAIE_CHECKPOINT_ENABLED", "true").lower() == "true"
+CHECKPOINT_PATH = Path(os.getenv("LAIE_CHECKPOINT_PATH", ".laie_cache/checkpoints.sqlite"))
+#Unfinished runs are deleted once a newer run of the same profile starts, and any run after this long
+CHECKPOINT_MAX_AGE_SECONDS = int(os.getenv("LAIE_CHECKPOINT_MAX_AGE_SECONDS", str(7 * 24 * 3600)))
+
+#Retries: transient LLM failures (throttling, timeouts, 5xx, dropped connections) are retried by the LLM gateway and a node
+#that still fails transiently is re-run by the graph with jittered backoff; an LLM call whose reply stays unusable after its
+#repairs (one month's note, the recommendations) is asked again up to CALL_RETRY_ATTEMPTS times
+CALL_RETRY_ATTEMPTS = int(os.getenv("LAIE_CALL_RETRY_ATTEMPTS", "3"))
+NODE_RETRY_MAX_ATTEMPTS = int(os.getenv("LAIE_NODE_RETRY_MAX_ATTEMPTS", "3"))
+RETRY_INITIAL_SECONDS = float(os.getenv("LAIE_RETRY_INITIAL_SECONDS", "1.0"))
+RETRY_MAX_SECONDS = float(os.getenv("LAIE_RETRY_MAX_SECONDS", "30.0"))
+
+#Activity routing: months with at most TRIVIAL_MONTH_MAX_POSTS posts get a templated note instead of an LLM call;
+#profiles with at most LOW_ACTIVITY_MAX_POSTS posts skip the LLM entirely, and profiles with none skip analytics too
+TRIVIAL_MONTH_MAX_POSTS = int(os.getenv("LAIE_TRIVIAL_MONTH_MAX_POSTS", "1"))
+LOW_ACTIVITY_MAX_POSTS = int(os.getenv("LAIE_LOW_ACTIVITY_MAX_POSTS", "6"))
+
+#Daily rollups: per-user daily totals kept across runs, so rolling windows and year-over-year deltas are
+#prefix-sum range queries instead of re-scans of the posts
+ROLLUP_STORE_ENABLED = os.getenv("LAIE_ROLLUP_STORE_ENABLED", "true").lower() == "true"
+ROLLUP_STORE_PATH = Path(os.getenv("LAIE_ROLLUP_STORE_PATH", ".laie_cache/daily_rollups.sqlite"))
+ROLLING_WINDOW_DAYS = [int(days) for days in os.getenv("LAIE_ROLLING_WINDOW_DAYS", "7,30,90,365").split(",")]
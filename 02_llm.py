@@ -1,8 +1,805 @@
-llm = AzureChatOpenAI(
+class Telemetry:
+    """Structured spans for graph nodes and LLM calls.
+
+    Each span is logged through structlog with its monotonic start/end times and attributes,
+    feeds a rolling latency window per span name (for p50/p95), and is mirrored as an
+    OpenTelemetry span when an OTLP endpoint is configured. LLM call counts, token counts,
+    cache hits, coalesced calls and retries roll up from child spans into their enclosing span.
+    """
+
+    ROLLUP_KEYS = ("llm_calls", "prompt_tokens", "completion_tokens", "cache_hits", "coalesced", "retries")
+
+    def __init__(self, window: int, otlp_endpoint: Optional[str] = None):
+        self.window = window
+        self._durations = defaultdict(lambda: deque(maxlen=window))
+        self._lock = threading.Lock()
+        self._current = contextvars.ContextVar("laie_span", default=None)
+        self.otel_tracer = self._setup_otel(otlp_endpoint) if otlp_endpoint else None
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """Time the enclosed block as a span; yields a dict callers can add attributes to."""
+        parent = self._current.get()
+        span = {"span": name, **attributes, **{key: 0 for key in self.ROLLUP_KEYS}, "start": time.monotonic()}
+
+        otel_context = self.otel_tracer.start_as_current_span(name) if self.otel_tracer else contextlib.nullcontext()
+        with otel_context as otel_span:
+            token = self._current.set(span)
+            try:
+                yield span
+            except Exception as e:
+                span["error"] = str(e)
+                raise
+            finally:
+                self._current.reset(token)
+                self._finish(span, parent, otel_span)
+
+    def count_retry(self):
+        """Attribute one retry to the innermost active span (no-op outside spans)."""
+        span = self._current.get()
+        if span is not None:
+            with self._lock:
+                span["retries"] += 1
+
+    def percentiles(self) -> Dict[str, Dict[str, float]]:
+        """Rolling count, p50 and p95 duration (ms) per span name."""
+        with self._lock:
+            windows = {name: sorted(durations) for name, durations in self._durations.items()}
+        return {
+            name: {
+                "count": len(values),
+                "p50_ms": round(values[int(0.50 * (len(values) - 1))], 2),
+                "p95_ms": round(values[int(0.95 * (len(values) - 1))], 2)
+            }
+            for name, values in windows.items() if values
+        }
+
+    def _finish(self, span: Dict[str, Any], parent: Optional[Dict[str, Any]], otel_span: Any):
+        span["end"] = time.monotonic()
+        span["duration_ms"] = round((span["end"] - span["start"]) * 1000, 2)
+
+        with self._lock:
+            self._durations[span["span"]].append(span["duration_ms"])
+            if parent is not None:
+                for key in self.ROLLUP_KEYS:
+                    parent[key] += span[key]
+
+        logger.info("span", **span)
+        if otel_span is not None:
+            for key, value in span.items():
+                if isinstance(value, (str, bool, int, float)):
+                    otel_span.set_attribute(f"laie.{key}", value)
+
+    def _setup_otel(self, endpoint: str) -> Any:
+        """OTLP/HTTP tracer for endpoint, or None when the OpenTelemetry packages are missing."""
+        try:
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError as e:
+            logger.warning(f"OpenTelemetry export disabled, packages not installed: {e}")
+            return None
+
+        provider = TracerProvider(resource=Resource.create({"service.name": "laie"}))
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint)))
+        return provider.get_tracer("laie")
+
+
+telemetry = Telemetry(TELEMETRY_WINDOW, TELEMETRY_OTLP_ENDPOINT)
+
+
+azure_llm = AzureChatOpenAI(
     azure_endpoint=AZURE_OPENAI_ENDPOINT,
     api_key=AZURE_OPENAI_API_KEY,
     api_version=AZURE_OPENAI_API_VERSION,
     model=AZURE_OPENAI_DEPLOYMENT,
     temperature=0.3,
-    max_tokens=2000
+    max_tokens=2000,
+    timeout=LLM_REQUEST_TIMEOUT_SECONDS,
+    max_retries=0  # retries, backoff and failover are LLMGateway's job
 )
+
+
+class LLMResponseCache:
+    """SQLite-backed cache of LLM completions keyed by deployment, temperature and prompt."""
+
+    def __init__(self, path: Path, ttl_seconds: int, max_entries: int):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                content TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache(accessed_at)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(deployment: str, temperature: Optional[float], messages: List[BaseMessage], **kwargs) -> str:
+        """Hash the deployment, temperature and rendered prompt into a cache key."""
+        payload = {
+            "deployment": deployment,
+            "temperature": temperature,
+            "messages": [[message.type, message.content] for message in messages],
+            "kwargs": {k: repr(v) for k, v in sorted(kwargs.items())}
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return cached content for key, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or now - row[1] > self.ttl_seconds:
+                if row is not None:
+                    self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, content: str):
+        """Store content under key and evict expired / least recently used entries."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, content, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, content, now, now)
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def delete(self, key: str):
+        """Drop one entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self):
+        """Remove all cached entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache size and hit/miss counters."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        return {"entries": entries, "hits": self.hits, "misses": self.misses, "path": str(self.path)}
+
+    def _evict(self, now: float):
+        """Drop expired rows, then trim the oldest-accessed rows above max_entries."""
+        self._conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+        overflow = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN (SELECT key FROM llm_cache ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,)
+            )
+
+
+class _AbandonedFlight(Exception):
+    """Outcome of an async flight whose leader was cancelled; its followers retry the call themselves."""
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls: the first caller for a key runs the call, later ones wait for its result.
+
+    Only calls in flight are shared; once the leader finishes the key is free again (repeats after
+    that are the response cache's job). Sync callers share across threads, async callers within
+    their event loop. Errors reach every waiter, so each applies its own retry policy.
+    """
+
+    def __init__(self):
+        self.leaders = 0
+        self.followers = 0
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+        self._acalls: Dict[tuple, asyncio.Future] = {}
+
+    def do(self, key: str, call: Callable[[], Any]) -> tuple:
+        """Return (result, coalesced), running call only if no identical call is in flight."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self.leaders += 1
+            else:
+                self.followers += 1
+        if not leader:
+            return future.result(), True
+
+        try:
+            result = call()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def ado(self, key: str, call: Callable[[], Awaitable[Any]]) -> tuple:
+        """Async variant of do."""
+        loop = asyncio.get_running_loop()
+        flight = (id(loop), key)
+        while (future := self._acalls.get(flight)) is not None:
+            self.followers += 1
+            try:
+                # shield: a cancelled follower must not cancel the leader's call
+                return await asyncio.shield(future), True
+            except _AbandonedFlight:
+                # The leader was cancelled, not us: try again, leading the call if nobody else has
+                self.followers -= 1
+
+        future = self._acalls[flight] = loop.create_future()
+        # Nobody may be waiting; mark the outcome retrieved so asyncio does not log it
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self.leaders += 1
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.set_exception(_AbandonedFlight())
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            del self._acalls[flight]
+
+    def stats(self) -> Dict[str, int]:
+        return {"upstream_calls": self.leaders, "coalesced_calls": self.followers}
+
+
+class CachedChatModel(Runnable):
+    """Chat model wrapper that records a telemetry span per call, serves repeated prompts from an LLMResponseCache
+    and, with a SingleFlight, shares one upstream call between concurrent identical prompts."""
+
+    def __init__(self, model: Any, cache: Optional[LLMResponseCache], deployment: str,
+                 single_flight: Optional[SingleFlight] = None):
+        self.model = model
+        self.cache = cache
+        self.deployment = deployment
+        self.single_flight = single_flight
+
+    def _cache_keys(self, messages: List[BaseMessage], **kwargs) -> Dict[str, str]:
+        """Cache key per deployment that may serve this prompt, primary first.
+
+        Behind an LLMGateway a reply may come from any pool deployment, so it is cached under the
+        one that served it and looked up under each of them.
+        """
+        temperature = kwargs.pop("temperature", getattr(self.model, "temperature", None))
+        deployments = self.model.deployment_names() if isinstance(self.model, LLMGateway) else [self.deployment]
+        return {
+            deployment: LLMResponseCache.make_key(deployment, temperature, messages, **kwargs)
+            for deployment in deployments
+        }
+
+    def _flight_key(self, messages: List[BaseMessage], **kwargs) -> str:
+        """Single-flight key: the prompt as requested, whichever deployment ends up serving it."""
+        temperature = kwargs.pop("temperature", getattr(self.model, "temperature", None))
+        return LLMResponseCache.make_key(self.deployment, temperature, messages, **kwargs)
+
+    def invoke(self, input: List[BaseMessage], config: Optional[RunnableConfig] = None, **kwargs) -> AIMessage:
+        with telemetry.span("llm.call", deployment=self.deployment) as span:
+            keys = self._cache_keys(input, **kwargs) if self.cache else {}
+            cached = self._cached(keys, span)
+            if cached is not None:
+                return cached
+
+            if not self.single_flight:
+                response = self.model.invoke(input, config, **kwargs)
+                self._record_response(keys, response, span)
+                return response
+
+            response, coalesced = self.single_flight.do(
+                self._flight_key(input, **kwargs), lambda: self.model.invoke(input, config, **kwargs)
+            )
+            return self._shared_response(keys, response, coalesced, span)
+
+    async def ainvoke(self, input: List[BaseMessage], config: Optional[RunnableConfig] = None, **kwargs) -> AIMessage:
+        with telemetry.span("llm.call", deployment=self.deployment) as span:
+            keys = self._cache_keys(input, **kwargs) if self.cache else {}
+            cached = self._cached(keys, span)
+            if cached is not None:
+                return cached
+
+            if not self.single_flight:
+                response = await self.model.ainvoke(input, config, **kwargs)
+                self._record_response(keys, response, span)
+                return response
+
+            response, coalesced = await self.single_flight.ado(
+                self._flight_key(input, **kwargs), lambda: self.model.ainvoke(input, config, **kwargs)
+            )
+            return self._shared_response(keys, response, coalesced, span)
+
+    def _shared_response(self, keys: Dict[str, str], response: AIMessage, coalesced: bool,
+                         span: Dict[str, Any]) -> AIMessage:
+        """Record a single-flight result; the leader's usage and cache entry already cover coalesced callers."""
+        if not coalesced:
+            self._record_response(keys, response, span)
+            return response
+        span["coalesced"] = 1
+        return AIMessage(content=response.content, response_metadata={"coalesced": True})
+
+    def _cached(self, keys: Dict[str, str], span: Dict[str, Any]) -> Optional[AIMessage]:
+        span["llm_calls"] = 1
+        for deployment, key in keys.items():
+            cached = self.cache.get(key)
+            if cached is not None:
+                span["cache_hits"] = 1
+                return AIMessage(content=cached, response_metadata={"cache_hit": True, "deployment": deployment})
+        return None
+
+    def _record_response(self, keys: Dict[str, str], response: AIMessage, span: Dict[str, Any]):
+        """Copy token usage onto the span and cache the completion under the deployment that served it."""
+        metadata = getattr(response, "response_metadata", None) or {}
+        usage = getattr(response, "usage_metadata", None) or {}
+        token_usage = metadata.get("token_usage") or {}
+        span["prompt_tokens"] = usage.get("input_tokens") or token_usage.get("prompt_tokens") or 0
+        span["completion_tokens"] = usage.get("output_tokens") or token_usage.get("completion_tokens") or 0
+        key = keys.get(metadata.get("deployment", self.deployment))
+        if key and self.cache:
+            self.cache.set(key, response.content)
+
+    def forget(self, messages: List[BaseMessage], **kwargs):
+        """Drop the cached completion for this prompt, e.g. one that failed validation."""
+        if self.cache:
+            for key in self._cache_keys(messages, **kwargs).values():
+                self.cache.delete(key)
+
+    def with_structured_output(self, schema: type, max_repairs: int = STRUCTURED_OUTPUT_MAX_REPAIRS) -> "StructuredChatModel":
+        """Cached, instrumented runnable that returns validated schema instances."""
+        return StructuredChatModel(self, schema, max_repairs)
+
+    def __getattr__(self, name: str) -> Any:
+        # Anything not cached (bind, with_tools, ...) goes to the wrapped model
+        if name == "model":
+            raise AttributeError(name)
+        return getattr(self.model, name)
+
+
+class StructuredOutputError(ValueError):
+    """Raised when a structured-output reply is still invalid after its repair retries."""
+
+
+class StructuredChatModel(Runnable):
+    """Requests JSON matching a pydantic schema (response_format=json_schema) and validates it.
+
+    An invalid reply is dropped from the cache and, up to max_repairs times, sent back with its
+    validation errors for a corrected reply; each repair counts as a retry on the active span.
+    """
+
+    def __init__(self, model: CachedChatModel, schema: type, max_repairs: int):
+        self.model = model
+        self.schema = schema
+        self.max_repairs = max_repairs
+        self.response_format = {
+            "type": "json_schema",
+            "json_schema": {"name": schema.__name__, "schema": schema.model_json_schema(), "strict": False}
+        }
+
+    def invoke(self, input: List[BaseMessage], config: Optional[RunnableConfig] = None, **kwargs) -> BaseModel:
+        messages = list(input)
+        for attempt in range(self.max_repairs + 1):
+            response = self.model.invoke(messages, config, response_format=self.response_format, **kwargs)
+            try:
+                return self._validate(response)
+            except ValidationError as e:
+                self.model.forget(messages, response_format=self.response_format, **kwargs)
+                if attempt == self.max_repairs:
+                    raise StructuredOutputError(f"{self.schema.__name__} invalid after {self.max_repairs} repairs: {e}") from e
+                messages = self._repair_messages(messages, response, e)
+
+    async def ainvoke(self, input: List[BaseMessage], config: Optional[RunnableConfig] = None, **kwargs) -> BaseModel:
+        messages = list(input)
+        for attempt in range(self.max_repairs + 1):
+            response = await self.model.ainvoke(messages, config, response_format=self.response_format, **kwargs)
+            try:
+                return self._validate(response)
+            except ValidationError as e:
+                self.model.forget(messages, response_format=self.response_format, **kwargs)
+                if attempt == self.max_repairs:
+                    raise StructuredOutputError(f"{self.schema.__name__} invalid after {self.max_repairs} repairs: {e}") from e
+                messages = self._repair_messages(messages, response, e)
+
+    def _validate(self, response: AIMessage) -> BaseModel:
+        content = response.content.strip()
+        if content.startswith("```"):
+            # Models without response_format support tend to fence their JSON
+            content = content.strip("`").removeprefix("json").strip()
+        return self.schema.model_validate_json(content)
+
+    def _repair_messages(self, messages: List[BaseMessage], response: AIMessage, error: ValidationError) -> List[BaseMessage]:
+        """Append the invalid reply and a repair request listing what failed."""
+        telemetry.count_retry()
+        problems = "; ".join(
+            f"{'.'.join(str(part) for part in problem['loc']) or 'reply'}: {problem['msg']}"
+            for problem in error.errors()[:5]
+        )
+        logger.warning(f"{self.schema.__name__} reply failed validation, requesting repair: {problems}")
+        return [
+            *messages,
+            AIMessage(content=response.content),
+            HumanMessage(content=f"That reply does not match the JSON schema ({problems}). Reply with only the corrected JSON object.")
+        ]
+
+
+_token_encoding = None
+
+
+def _get_token_encoding() -> Any:
+    """tiktoken encoding for the deployment, or False when tiktoken or its BPE file is unavailable."""
+    global _token_encoding
+    if _token_encoding is None:
+        try:
+            import tiktoken
+            _token_encoding = tiktoken.get_encoding(TOKEN_ENCODING)
+        except Exception as e:
+            logger.warning(f"tiktoken unavailable, estimating tokens at 4 characters each: {e}")
+            _token_encoding = False
+    return _token_encoding
+
+
+def count_tokens(text: str) -> int:
+    """Prompt tokens in text (exact with tiktoken, ~4 characters per token without it)."""
+    encoding = _get_token_encoding()
+    if encoding:
+        return len(encoding.encode(text))
+    return (len(text) + 3) // 4
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text down to at most max_tokens tokens."""
+    if count_tokens(text) <= max_tokens:
+        return text
+    encoding = _get_token_encoding()
+    if encoding:
+        return encoding.decode(encoding.encode(text)[:max_tokens])
+    return text[:max_tokens * 4]
+
+
+TRANSIENT_STATUSES = {408, 409, 429, 500, 502, 503, 504}
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Whether error is worth retrying: throttling, timeouts, 5xx and dropped connections, not bad input or bad data.
+    
+    Errors re-raised with `raise ... from e` are judged by their cause chain.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+        if status is not None:
+            return status in TRANSIENT_STATUSES
+        if isinstance(error, (
+            openai.APIConnectionError, httpx.TransportError,
+            requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+            TimeoutError, ConnectionError
+        )):
+            return True
+        error = error.__cause__
+    return False
+
+
+def is_output_error(error: Exception) -> bool:
+    """Whether error means the reply itself was unusable (invalid structured output), so asking again may help."""
+    return isinstance(error, (StructuredOutputError, ValidationError, json.JSONDecodeError))
+
+
+def _retry_or_raise(error: Exception, label: str, attempt: int, attempts: int):
+    """Re-raise error unless it is an unusable reply with attempts left; otherwise count the retry."""
+    if attempt >= attempts or not is_output_error(error):
+        raise error
+    telemetry.count_retry()
+    logger.warning(f"Re-requesting {label} (attempt {attempt}/{attempts - 1}): {type(error).__name__} {error}")
+
+
+def call_with_retry(call: Callable[[], Any], label: str, attempts: int = CALL_RETRY_ATTEMPTS) -> Any:
+    """Run call, re-running it when its reply is unusable.
+    
+    Transient errors were already retried by the gateway (and may re-run the node), so they are
+    raised straight away like any other error; retrying them here as well would multiply the
+    upstream attempts during a throttling storm.
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return call()
+        except Exception as e:
+            _retry_or_raise(e, label, attempt, attempts)
+
+
+async def acall_with_retry(call: Callable[[], Awaitable[Any]], label: str, attempts: int = CALL_RETRY_ATTEMPTS) -> Any:
+    """Async variant of call_with_retry."""
+    for attempt in range(1, attempts + 1):
+        try:
+            return await call()
+        except Exception as e:
+            _retry_or_raise(e, label, attempt, attempts)
+
+
+class LLMDeployment:
+    """One chat deployment in the gateway pool, with its own quotas, concurrency limit and circuit breaker.
+    
+    Requests and tokens per minute are token buckets refilled continuously. The concurrency
+    limit is AIMD: +1/limit per success, halved on a 429. The circuit opens after
+    failure_threshold consecutive transient failures, then lets a single trial request
+    through once reset_seconds have passed.
+    """
+    
+    def __init__(self, name: str, model: Any, rpm: int, tpm: int, max_concurrency: int,
+                 failure_threshold: int = LLM_CIRCUIT_FAILURE_THRESHOLD, reset_seconds: float = LLM_CIRCUIT_RESET_SECONDS):
+        self.name = name
+        self.model = model
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_concurrency = max_concurrency
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        
+        self.concurrency_limit = float(max_concurrency)
+        self.in_flight = 0
+        self.circuit = "closed"
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.blocked_until = 0.0
+        self.stats = {"requests": 0, "throttled": 0, "failures": 0, "circuit_opens": 0}
+        
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def try_acquire(self, tokens: int, now: float) -> float:
+        """Take a request slot and `tokens` of quota and return 0, or return seconds to wait before trying again."""
+        with self._lock:
+            if self.circuit == "open":
+                if now < self.open_until:
+                    return self.open_until - now
+                self.circuit = "half_open"
+            elif self.circuit == "half_open" and self.in_flight:
+                return self.reset_seconds  # trial request still running
+            if now < self.blocked_until:
+                return self.blocked_until - now
+            if self.in_flight >= int(self.concurrency_limit):
+                return 0.05
+            
+            elapsed, self._updated = now - self._updated, now
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+            tokens = min(tokens, self.tpm)  # a prompt larger than the quota still gets through on a full bucket
+            if self._requests < 1:
+                return (1 - self._requests) * 60 / self.rpm
+            if self._tokens < tokens:
+                return (tokens - self._tokens) * 60 / self.tpm
+            
+            self._requests -= 1
+            self._tokens -= tokens
+            self.in_flight += 1
+            self.stats["requests"] += 1
+            return 0.0
+    
+    def release(self, outcome: str, retry_after: Optional[float] = None):
+        """Record how the request ended: "ok", "throttled" (429), "failed" (transient) or "error" (not the deployment's fault)."""
+        now = time.monotonic()
+        with self._lock:
+            self.in_flight -= 1
+            if outcome == "ok":
+                self.concurrency_limit = min(float(self.max_concurrency), self.concurrency_limit + 1 / self.concurrency_limit)
+                self.consecutive_failures = 0
+                self.circuit = "closed"
+            elif outcome == "throttled":
+                self.stats["throttled"] += 1
+                self.concurrency_limit = max(1.0, self.concurrency_limit / 2)
+                self.blocked_until = max(self.blocked_until, now + (retry_after or 1.0))
+            elif outcome == "failed":
+                self.stats["failures"] += 1
+                self.consecutive_failures += 1
+                if self.circuit == "half_open" or self.consecutive_failures >= self.failure_threshold:
+                    if self.circuit != "open":
+                        self.stats["circuit_opens"] += 1
+                        logger.warning(f"LLM deployment {self.name} circuit open for {self.reset_seconds:.0f}s")
+                    self.circuit = "open"
+                    self.open_until = now + self.reset_seconds
+    
+    def load(self) -> float:
+        return self.in_flight / max(self.concurrency_limit, 1.0)
+    
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "circuit": self.circuit,
+                "in_flight": self.in_flight,
+                "concurrency_limit": round(self.concurrency_limit, 2)
+            }
+
+
+class LLMGateway(Runnable):
+    """Chat model facade over a pool of LLMDeployments.
+    
+    Each call goes to the least-loaded deployment with quota left, waiting when none has.
+    429s block that deployment for Retry-After and are retried (usually elsewhere); timeouts,
+    connection errors and 5xx are retried with jittered exponential backoff up to max_retries.
+    Other errors (bad request, content filter) are raised straight away.
+    """
+    
+    def __init__(self, deployments: List[LLMDeployment], max_retries: int = LLM_MAX_RETRIES,
+                 backoff_seconds: float = LLM_BACKOFF_SECONDS):
+        if not deployments:
+            raise ValueError("LLMGateway needs at least one deployment")
+        self.deployments = deployments
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+    
+    def invoke(self, input: List[BaseMessage], config: Optional[RunnableConfig] = None, **kwargs) -> AIMessage:
+        prompt_tokens = self._prompt_tokens(input)
+        for attempt in range(self.max_retries + 1):
+            deployment = self._acquire(prompt_tokens, kwargs.get("max_tokens"))
+            # Cancellation and interrupts still free the slot, without counting against the deployment
+            outcome = ("error", None)
+            try:
+                response = deployment.model.invoke(input, config, **kwargs)
+                outcome = ("ok", None)
+                return self._tag(response, deployment)
+            except Exception as e:
+                outcome = self._outcome(e)
+                delay = self._retry_delay(deployment, e, attempt)
+            finally:
+                deployment.release(*outcome)
+            time.sleep(delay)
+    
+    async def ainvoke(self, input: List[BaseMessage], config: Optional[RunnableConfig] = None, **kwargs) -> AIMessage:
+        prompt_tokens = self._prompt_tokens(input)
+        for attempt in range(self.max_retries + 1):
+            deployment = await self._aacquire(prompt_tokens, kwargs.get("max_tokens"))
+            outcome = ("error", None)
+            try:
+                response = await deployment.model.ainvoke(input, config, **kwargs)
+                outcome = ("ok", None)
+                return self._tag(response, deployment)
+            except Exception as e:
+                outcome = self._outcome(e)
+                delay = self._retry_delay(deployment, e, attempt)
+            finally:
+                deployment.release(*outcome)
+            await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _tag(response: AIMessage, deployment: LLMDeployment) -> AIMessage:
+        """Record which deployment served the reply, so callers can key caches on it."""
+        response.response_metadata["deployment"] = deployment.name
+        return response
+    
+    def deployment_names(self) -> List[str]:
+        """Names of the pool deployments, primary first."""
+        return [deployment.name for deployment in self.deployments]
+    
+    def _acquire(self, prompt_tokens: int, max_tokens: Optional[int]) -> LLMDeployment:
+        while True:
+            deployment, wait = self._try_acquire(prompt_tokens, max_tokens)
+            if deployment:
+                return deployment
+            time.sleep(min(wait, 1.0))
+    
+    async def _aacquire(self, prompt_tokens: int, max_tokens: Optional[int]) -> LLMDeployment:
+        while True:
+            deployment, wait = self._try_acquire(prompt_tokens, max_tokens)
+            if deployment:
+                return deployment
+            await asyncio.sleep(min(wait, 1.0))
+    
+    def _try_acquire(self, prompt_tokens: int, max_tokens: Optional[int]) -> tuple:
+        """(deployment, 0) for the least-loaded deployment that admits the request, else (None, shortest wait)."""
+        now = time.monotonic()
+        waits = []
+        for deployment in sorted(self.deployments, key=lambda d: d.load()):
+            wait = deployment.try_acquire(self._estimate_tokens(deployment, prompt_tokens, max_tokens), now)
+            if wait <= 0:
+                return deployment, 0.0
+            waits.append(wait)
+        return None, min(waits)
+    
+    def _outcome(self, error: Exception) -> tuple:
+        """(outcome, retry_after) to release the deployment with after a failed call."""
+        if getattr(error, "status_code", None) == 429:
+            return "throttled", self._retry_after(error)
+        return ("failed" if is_transient_error(error) else "error"), None
+    
+    def _retry_delay(self, deployment: LLMDeployment, error: Exception, attempt: int) -> float:
+        """Delay before retrying a failed call, or raise error when it is not retryable or retries are used up."""
+        status = getattr(error, "status_code", None)
+        if not is_transient_error(error) or attempt >= self.max_retries:
+            raise error
+        
+        telemetry.count_retry()
+        logger.warning(f"Retrying LLM call on {deployment.name} (attempt {attempt + 1}/{self.max_retries}): {type(error).__name__} {status or ''}")
+        # Throttled deployments are skipped until Retry-After passes, so retry right away on the others
+        return 0.0 if status == 429 else random.uniform(0, self.backoff_seconds * (2 ** attempt))
+    
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        """Seconds from the retry-after-ms / Retry-After headers of a 429, if present and numeric."""
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+            try:
+                return float(headers[header]) * scale
+            except (KeyError, TypeError, ValueError):
+                continue
+        return None
+    
+    @staticmethod
+    def _prompt_tokens(messages: List[BaseMessage]) -> int:
+        return count_tokens("".join(str(message.content) for message in messages))
+    
+    @staticmethod
+    def _estimate_tokens(deployment: LLMDeployment, prompt_tokens: int, max_tokens: Optional[int]) -> int:
+        # Quotas count the prompt plus the completion the request may use; without a per-call
+        # max_tokens that is the deployment model's own limit, which Azure reserves against TPM
+        return prompt_tokens + (max_tokens or getattr(deployment.model, "max_tokens", None) or 0)
+    
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        return {deployment.name: deployment.status() for deployment in self.deployments}
+    
+    def __getattr__(self, name: str) -> Any:
+        # temperature, max_tokens, ... come from the primary deployment
+        if name == "deployments":
+            raise AttributeError(name)
+        return getattr(self.deployments[0].model, name)
+
+
+def _build_llm_deployments() -> List[LLMDeployment]:
+    """The primary Azure deployment plus any from LAIE_LLM_DEPLOYMENTS."""
+    deployments = [LLMDeployment(AZURE_OPENAI_DEPLOYMENT, azure_llm, LLM_RPM_LIMIT, LLM_TPM_LIMIT, LLM_MAX_CONCURRENCY)]
+    for extra in LLM_EXTRA_DEPLOYMENTS:
+        model = AzureChatOpenAI(
+            azure_endpoint=extra.get("endpoint", AZURE_OPENAI_ENDPOINT),
+            api_key=extra.get("api_key", AZURE_OPENAI_API_KEY),
+            api_version=extra.get("api_version", AZURE_OPENAI_API_VERSION),
+            model=extra.get("deployment", AZURE_OPENAI_DEPLOYMENT),
+            temperature=azure_llm.temperature,
+            max_tokens=azure_llm.max_tokens,
+            timeout=LLM_REQUEST_TIMEOUT_SECONDS,
+            max_retries=0
+        )
+        name = f"{extra.get('deployment', AZURE_OPENAI_DEPLOYMENT)}@{extra.get('endpoint', AZURE_OPENAI_ENDPOINT)}"
+        deployments.append(LLMDeployment(
+            name, model, int(extra.get("rpm", LLM_RPM_LIMIT)), int(extra.get("tpm", LLM_TPM_LIMIT)), LLM_MAX_CONCURRENCY
+        ))
+    return deployments
+
+
+llm_gateway = LLMGateway(_build_llm_deployments())
+
+# Shared LLM used by every agent: gateway-routed, cached unless LAIE_LLM_CACHE_ENABLED=false, concurrent identical
+# prompts coalesced unless LAIE_LLM_SINGLE_FLIGHT_ENABLED=false, always instrumented
+llm_cache = LLMResponseCache(LLM_CACHE_PATH, LLM_CACHE_TTL_SECONDS, LLM_CACHE_MAX_ENTRIES) if LLM_CACHE_ENABLED else None
+llm_single_flight = SingleFlight() if LLM_SINGLE_FLIGHT_ENABLED else None
+llm = CachedChatModel(llm_gateway, llm_cache, AZURE_OPENAI_DEPLOYMENT, llm_single_flight)
@@ -1,37 +1,249 @@
+# Compact post container passed between agents
+class PostBatch:
+    """Struct-of-arrays container for one profile's posts.
+    
+    Engagement counts and timestamps live in typed arrays and content types are coded
+    against a small per-batch vocabulary, so a batch costs a fraction of the equivalent
+    list of dicts, pickles cheaply to worker processes and feeds NumPy without per-post
+    conversion. Values are validated once, in append; LinkedInPost views are built on demand.
+    """
+    
+    __slots__ = ("post_id", "user_id", "content", "content_type", "content_types", "published_us",
+                 "likes_count", "comments_count", "reposts_count", "impressions")
+    
+    EPOCH = datetime(1970, 1, 1)
+    COUNT_FIELDS = ("likes_count", "comments_count", "reposts_count", "impressions")
+    
+    def __init__(self):
+        self.post_id = []
+        self.user_id = []
+        self.content = []
+        self.content_type = array("B")     # index into content_types
+        self.content_types = []
+        self.published_us = array("q")     # microseconds since 1970-01-01 (naive, like LinkedInPost)
+        self.likes_count = array("q")
+        self.comments_count = array("q")
+        self.reposts_count = array("q")
+        self.impressions = array("q")
+    
+    @classmethod
+    def from_posts(cls, posts: Iterable[Any]) -> "PostBatch":
+        """Build a batch from LinkedInPost objects or post dicts."""
+        if isinstance(posts, cls):
+            return posts
+        
+        batch = cls()
+        for post in posts:
+            fields = post if isinstance(post, dict) else vars(post)
+            batch.append(**fields)
+        return batch
+    
+    def append(self, post_id: str, user_id: str, content: str, content_type: Any, published_at: Any,
+               likes_count: int = 0, comments_count: int = 0, reposts_count: int = 0, impressions: int = 0):
+        """Validate and add one post."""
+        content_type = ContentType(content_type).value
+        if isinstance(published_at, str):
+            published_at = datetime.fromisoformat(published_at)
+        if not isinstance(published_at, datetime):
+            raise TypeError(f"published_at must be a datetime, got {type(published_at).__name__}")
+        
+        if content_type not in self.content_types:
+            self.content_types.append(content_type)
+        
+        self.post_id.append(str(post_id))
+        self.user_id.append(str(user_id))
+        self.content.append(str(content))
+        self.content_type.append(self.content_types.index(content_type))
+        self.published_us.append((published_at.replace(tzinfo=None) - self.EPOCH) // timedelta(microseconds=1))
+        self.likes_count.append(int(likes_count or 0))
+        self.comments_count.append(int(comments_count or 0))
+        self.reposts_count.append(int(reposts_count or 0))
+        self.impressions.append(int(impressions or 0))
+    
+    def __len__(self) -> int:
+        return len(self.post_id)
+    
+    def __iter__(self) -> Iterator[Any]:
+        return (self.view(i) for i in range(len(self)))
+    
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state: tuple):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+    
+    def published_at(self, i: int) -> datetime:
+        return self.EPOCH + timedelta(microseconds=self.published_us[i])
+    
+    def content_type_values(self) -> List[str]:
+        """Per-post content type values ("text", "image", ...)."""
+        return [self.content_types[code] for code in self.content_type]
+    
+    def month_keys(self) -> List[str]:
+        """Per-post "%Y-%m" labels."""
+        return [self.published_at(i).strftime("%Y-%m") for i in range(len(self))]
+    
+    def record(self, i: int) -> Dict[str, Any]:
+        """Post i as a plain dict with the LinkedInPost fields."""
+        return {
+            "post_id": self.post_id[i],
+            "user_id": self.user_id[i],
+            "content": self.content[i],
+            "content_type": self.content_types[self.content_type[i]],
+            "published_at": self.published_at(i),
+            "likes_count": self.likes_count[i],
+            "comments_count": self.comments_count[i],
+            "reposts_count": self.reposts_count[i],
+            "impressions": self.impressions[i]
+        }
+    
+    def records(self) -> List[Dict[str, Any]]:
+        return [self.record(i) for i in range(len(self))]
+    
+    def view(self, i: int) -> "LinkedInPost":
+        """Post i as a LinkedInPost, without re-running validation."""
+        fields = self.record(i)
+        fields["content_type"] = ContentType(fields["content_type"])
+        return LinkedInPost.model_construct(**fields)
+
+
+# Bulky per-run payloads live outside the graph state
+class PostStore:
+    """Process-local registry of each run's posts, addressed by a short handle.
+    
+    LAIEState carries only the handle (posts_ref), so no node copies or checkpoints the
+    post list itself.
+    """
+    
+    def __init__(self):
+        self._posts = {}
+        self._lock = threading.Lock()
+    
+    def new_handle(self, public_id: str) -> str:
+        return f"posts:{public_id}:{uuid.uuid4().hex}"
+    
+    def put(self, handle: str, posts: PostBatch):
+        with self._lock:
+            self._posts[handle] = posts
+    
+    def get(self, handle: Optional[str]) -> PostBatch:
+        """Return the posts stored under handle (an empty batch when unknown or released)."""
+        with self._lock:
+            posts = self._posts.get(handle) if handle else None
+        return posts if posts is not None else PostBatch()
+    
+    def release(self, handle: Optional[str]):
+        """Drop a finished run's posts."""
+        with self._lock:
+            self._posts.pop(handle, None)
+    
+    def __contains__(self, handle: Optional[str]) -> bool:
+        with self._lock:
+            return handle in self._posts
+    
+    def __len__(self) -> int:
+        return len(self._posts)
+
+
+post_store = PostStore()
+
+
+class CredentialStore:
+    """Process-local registry of each run's data-source secrets, addressed by a short handle.
+    
+    The Proxycurl API key and LinkedIn credentials (password, li_at cookie) are split out of
+    data_sources before a run starts; LAIEState carries only the handle (credentials_ref), so
+    no checkpoint ever holds them.
+    """
+    
+    SECRET_KEYS = ("proxycurl_api_key", "linkedin_credentials")
+    
+    def __init__(self):
+        self._secrets = {}
+        self._lock = threading.Lock()
+    
+    def split(self, public_id: str, data_sources: Dict[str, Any]) -> tuple:
+        """(data_sources without its secrets, handle to the secrets or None when it has none)."""
+        public = {key: value for key, value in data_sources.items() if key not in self.SECRET_KEYS}
+        secrets = self.secrets_of(data_sources)
+        if not secrets:
+            return public, None
+        handle = f"credentials:{public_id}:{uuid.uuid4().hex}"
+        self.put(handle, secrets)
+        return public, handle
+    
+    def secrets_of(self, data_sources: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: data_sources[key] for key in self.SECRET_KEYS if data_sources.get(key)}
+    
+    def put(self, handle: str, secrets: Dict[str, Any]):
+        with self._lock:
+            self._secrets[handle] = secrets
+    
+    def resolve(self, data_sources: Dict[str, Any], handle: Optional[str]) -> Dict[str, Any]:
+        """data_sources with the secrets stored under handle merged back in."""
+        with self._lock:
+            secrets = self._secrets.get(handle, {}) if handle else {}
+        return {**data_sources, **secrets}
+    
+    def release(self, handle: Optional[str]):
+        """Drop a finished run's secrets."""
+        with self._lock:
+            self._secrets.pop(handle, None)
+    
+    def __contains__(self, handle: Optional[str]) -> bool:
+        with self._lock:
+            return handle in self._secrets
+
+
+credential_store = CredentialStore()
+
+
 # Define the state schema for LangGraph
 class LAIEState(TypedDict):
     """State schema for the LAIE multi-agent system."""
     # Input parameters
     public_id: str
-    data_sources: Dict[str, Any]
+    data_sources: Dict[str, Any]  # without secrets; see credentials_ref
+    credentials_ref: Optional[str]  # handle into credential_store
+    run_id: Optional[str]  # checkpoint thread id; None when the run is not checkpointed
     
     # Data collection results
     raw_profile: Optional[Dict[str, Any]]
-    raw_posts: Optional[List[Dict[str, Any]]]
+    posts_ref: Optional[str]  # handle into post_store
     data_quality_score: float
+    activity_level: Optional[str]  # ActivityLevel value; picks which stages run and which use the LLM
     
     # Analytics results
     monthly_analytics: Optional[List[Dict[str, Any]]]
     content_performance: Optional[Dict[str, Any]]
     temporal_patterns: Optional[Dict[str, Any]]
+    period_metrics: Optional[Dict[str, Any]]  # analysis window, rolling windows and year-over-year, from daily rollups
+    
+    # Incremental re-analysis
+    previous_analysis: Optional[Dict[str, Any]]
+    month_fingerprints: Optional[Dict[str, str]]
+    changed_months: Optional[List[str]]
     
     # AI-generated content
+    report_skeleton: Optional[Dict[str, Any]]
     monthly_notes: Optional[List[Dict[str, Any]]]
     executive_summary: Optional[str]
     recommendations: Optional[List[str]]
+    narrative_fallback: Optional[bool]  # summary or recommendations fell back to generic text; regenerated next run
     
     # Agent communication
-    messages: List[BaseMessage]
+    messages: Annotated[List[BaseMessage], add_messages]
     current_agent: str
     next_agent: Optional[str]
     
     # Error handling
-    errors: List[str]
+    errors: Annotated[List[str], operator.add]
     retry_count: int
     
     # Final output
     final_report: Optional[Dict[str, Any]]
-    audit_trail: List[Dict[str, Any]]
+    audit_trail: Annotated[List[Dict[str, Any]], operator.add]
 
 
 # define agent response types 
@@ -52,3 +264,4 @@ class MonthlyNote(TypedDict):
     engagement_highlights: List[str]
     recommendations: List[str]
     ai_insights: str
+    fallback: bool  # generic note written because the LLM call failed; never reused by a later run
@@ -14,6 +14,19 @@ class EngagementType(str, Enum):
     REPOST = "repost"
     IMPRESSION = "impression"
 
+class ActivityLevel(str, Enum):
+    EMPTY = "empty"    # no posts: profile-only report, analytics and monthly notes are skipped
+    LOW = "low"        # a handful of posts: templated notes and narrative, no LLM calls
+    ACTIVE = "active"  # LLM notes for every month above TRIVIAL_MONTH_MAX_POSTS
+    
+    @classmethod
+    def for_posts(cls, posts_count: int) -> "ActivityLevel":
+        if posts_count == 0:
+            return cls.EMPTY
+        if posts_count <= LOW_ACTIVITY_MAX_POSTS:
+            return cls.LOW
+        return cls.ACTIVE
+
 
 # Profile Models (simplified for multi-agent use)
 class LinkedInProfile(BaseModel):
@@ -45,3 +58,27 @@ class MonthlyActivity(BaseModel):
     total_likes: int = 0
     engagement_rate: float = 0.0
     content_types: Dict[str, int] = Field(default_factory=dict)
+
+
+# Structured LLM output (JSON schema sent with the request; month is filled in by the agent)
+class MonthlyNoteOutput(BaseModel):
+    activity_summary: str = Field(min_length=1, description="2-3 sentence overview of the month's LinkedIn activity")
+    key_achievements: List[str] = Field(min_length=1, description="3-4 most important accomplishments or engagement moments")
+    content_performance: Dict[str, str] = Field(description='{"analysis": which content types performed best and why}')
+    engagement_highlights: List[str] = Field(description="Up to 3 notable engagement patterns or viral moments")
+    recommendations: List[str] = Field(min_length=1, description="2-3 actionable suggestions for the next month")
+    ai_insights: str = Field(description="Strategic observations about audience behavior and content strategy")
+
+class MonthlyNoteItemOutput(MonthlyNoteOutput):
+    month: str = Field(description="Month the note is for, as YYYY-MM")
+
+class MonthlyNotesOutput(BaseModel):
+    # Items are validated one by one by the agent, so one bad month does not void the others
+    notes: List[Dict[str, Any]] = Field(
+        min_length=1,
+        description="One note per requested month",
+        json_schema_extra={"items": MonthlyNoteItemOutput.model_json_schema()}
+    )
+
+class RecommendationsOutput(BaseModel):
+    recommendations: List[str] = Field(min_length=1, description="5-7 specific, actionable recommendations")
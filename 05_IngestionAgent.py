@@ -1,55 +1,663 @@
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter: `rate` tokens per second, bursts up to `capacity`."""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: float = 1.0):
+        """Block until `tokens` are available, then take them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class LinkedinPostsClient:
+    """Rate-limited adapter over an authenticated linkedin_api.Linkedin client."""
+    
+    def __init__(self, api: Any, limiter: TokenBucket):
+        self.api = api
+        self.limiter = limiter
+    
+    def get_profile(self, public_id: str) -> Dict[str, Any]:
+        self.limiter.acquire()
+        return self.api.get_profile(public_id)
+    
+    def get_profile_posts_page(self, urn_id: str, start: int, count: int,
+                               pagination_token: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch one page of the member share feed (same endpoint linkedin_api paginates over)."""
+        self.limiter.acquire()
+        params = {
+            "count": count,
+            "start": start,
+            "q": "memberShareFeed",
+            "moduleKey": "member-shares:phone",
+            "includeLongTermHistory": True,
+            "profileUrn": f"urn:li:fsd_profile:{urn_id}"
+        }
+        if pagination_token:
+            params["paginationToken"] = pagination_token
+        
+        data = self.api._fetch("/identity/profileUpdatesV2", params=params).json()
+        return {
+            "elements": data.get("elements", []),
+            "paginationToken": data.get("metadata", {}).get("paginationToken")
+        }
+
+
+class RecordedLinkedinClient:
+    """Offline stand-in for LinkedinPostsClient that replays recorded responses from a JSON file.
+    
+    File layout: {"profiles": {public_id: profile}, "pages": {urn_id: [page, ...]}}, where each
+    page is {"elements": [...], "paginationToken": ...} as returned by get_profile_posts_page.
+    """
+    
+    def __init__(self, replay_file: str):
+        with open(replay_file, encoding="utf-8") as f:
+            self.recording = json.load(f)
+        self.calls = 0
+    
+    def get_profile(self, public_id: str) -> Dict[str, Any]:
+        self.calls += 1
+        return self.recording["profiles"][public_id]
+    
+    def get_profile_posts_page(self, urn_id: str, start: int, count: int,
+                               pagination_token: Optional[str] = None) -> Dict[str, Any]:
+        self.calls += 1
+        pages = self.recording["pages"].get(urn_id, [])
+        page_index = start // count if count else 0
+        return pages[page_index] if page_index < len(pages) else {"elements": [], "paginationToken": None}
+
+
+class LinkedinSessionPool:
+    """Keeps one authenticated, rate-limited client per credential set so runs reuse sessions."""
+    
+    def __init__(self, rate_per_second: float, burst: int):
+        self.limiter = TokenBucket(rate_per_second, burst)
+        self._clients = {}
+        self._lock = threading.Lock()
+    
+    def get(self, credentials: Dict[str, Any]) -> Any:
+        """Return a cached client for these credentials, authenticating on first use."""
+        if credentials.get("replay_file"):
+            return RecordedLinkedinClient(credentials["replay_file"])
+        
+        email = credentials.get("email") or os.getenv("LINKEDIN_EMAIL")
+        password = credentials.get("password") or os.getenv("LINKEDIN_PASSWORD")
+        li_at = credentials.get("li_at") or os.getenv("LINKEDIN_LI_AT")
+        key = f"li_at:{hashlib.sha256(li_at.encode()).hexdigest()}" if li_at else f"email:{email}"
+        
+        with self._lock:
+            if key not in self._clients:
+                from linkedin_api import Linkedin
+                
+                if li_at:
+                    # Use li_at cookie for authentication
+                    api = Linkedin("", "", cookies={"li_at": li_at})
+                elif email and password:
+                    # Use email/password authentication
+                    api = Linkedin(email, password)
+                else:
+                    raise ValueError("No valid LinkedIn credentials provided")
+                
+                self._clients[key] = LinkedinPostsClient(api, self.limiter)
+            return self._clients[key]
+
+
+class FetchCheckpointStore:
+    """SQLite checkpoints of in-progress paginated fetches, so interrupted fetches resume.
+    
+    Checkpoints older than max_age_seconds are discarded instead of resumed, and posts repeated
+    across pages (the feed shifting under the offsets) are only returned once.
+    """
+    
+    def __init__(self, path: Path, max_age_seconds: int = FETCH_CHECKPOINT_MAX_AGE_SECONDS):
+        self.path = Path(path)
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS fetch_cursors (
+                fetch_key TEXT PRIMARY KEY,
+                next_start INTEGER NOT NULL,
+                pagination_token TEXT,
+                updated_at TEXT NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS fetch_pages (
+                fetch_key TEXT NOT NULL,
+                page_start INTEGER NOT NULL,
+                posts TEXT NOT NULL,
+                PRIMARY KEY (fetch_key, page_start)
+            )"""
+        )
+        self._conn.commit()
+    
+    def load(self, fetch_key: str) -> tuple:
+        """Return (next_start, pagination_token, posts collected so far); (0, None, []) if none or stale."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT next_start, pagination_token, updated_at FROM fetch_cursors WHERE fetch_key = ?", (fetch_key,)
+            ).fetchone()
+            if cursor is None:
+                return 0, None, []
+            pages = self._conn.execute(
+                "SELECT posts FROM fetch_pages WHERE fetch_key = ? ORDER BY page_start", (fetch_key,)
+            ).fetchall()
+        
+        age = (datetime.utcnow() - datetime.fromisoformat(cursor[2])).total_seconds()
+        if age > self.max_age_seconds:
+            logger.info(f"Discarding fetch checkpoint {fetch_key}: {age:.0f}s old")
+            self.clear(fetch_key)
+            return 0, None, []
+        
+        posts = {}
+        for (page,) in pages:
+            for post in json.loads(page):
+                posts.setdefault(post["post_id"], post)
+        return cursor[0], cursor[1], [LinkedInPost(**post) for post in posts.values()]
+    
+    def save_page(self, fetch_key: str, page_start: int, posts: List[LinkedInPost],
+                  next_start: int, pagination_token: Optional[str]):
+        """Record one fetched page and the cursor for the next one, atomically."""
+        page = json.dumps([post.model_dump(mode="json") for post in posts])
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fetch_pages (fetch_key, page_start, posts) VALUES (?, ?, ?)",
+                (fetch_key, page_start, page)
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fetch_cursors (fetch_key, next_start, pagination_token, updated_at) VALUES (?, ?, ?, ?)",
+                (fetch_key, next_start, pagination_token, datetime.utcnow().isoformat())
+            )
+            self._conn.commit()
+    
+    def clear(self, fetch_key: str):
+        """Drop a finished fetch's checkpoint."""
+        with self._lock:
+            self._conn.execute("DELETE FROM fetch_pages WHERE fetch_key = ?", (fetch_key,))
+            self._conn.execute("DELETE FROM fetch_cursors WHERE fetch_key = ?", (fetch_key,))
+            self._conn.commit()
+
+
+class ProxycurlResponseCache:
+    """SQLite cache of Proxycurl profile responses keyed by public_id, with validators for conditional refreshes."""
+    
+    def __init__(self, path: Path, ttl_seconds: int):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS proxycurl_profiles (
+                public_id TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL
+            )"""
+        )
+        self._conn.commit()
+    
+    def get(self, public_id: str) -> Optional[Dict[str, Any]]:
+        """Return {"data", "etag", "last_modified", "fresh"} for public_id, or None if never fetched."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, etag, last_modified, fetched_at FROM proxycurl_profiles WHERE public_id = ?", (public_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "data": json.loads(row[0]),
+            "etag": row[1],
+            "last_modified": row[2],
+            "fresh": time.time() - row[3] <= self.ttl_seconds
+        }
+    
+    def set(self, public_id: str, data: Dict[str, Any], etag: Optional[str] = None, last_modified: Optional[str] = None):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO proxycurl_profiles (public_id, data, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (public_id, json.dumps(data), etag, last_modified, time.time())
+            )
+            self._conn.commit()
+    
+    def touch(self, public_id: str):
+        """Mark a cached response as fresh again (the server answered 304 Not Modified)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE proxycurl_profiles SET fetched_at = ? WHERE public_id = ?", (time.time(), public_id)
+            )
+            self._conn.commit()
+
+
+class ProxycurlClient:
+    """Shared Proxycurl client: pooled keep-alive connections, jittered retries on 429/5xx and a response cache.
+    
+    Fresh cached profiles are served without a request; stale ones are revalidated with
+    If-None-Match / If-Modified-Since when the previous response carried validators.
+    """
+    
+    PROFILE_URL = "https://nubela.co/proxycurl/api/v2/linkedin"
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    
+    def __init__(self, cache: ProxycurlResponseCache, pool_size: int, max_retries: int, backoff_seconds: float,
+                 max_retry_after: float = PROXYCURL_MAX_RETRY_AFTER_SECONDS):
+        self.cache = cache
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_retry_after = max_retry_after
+        self.stats = {"requests": 0, "retries": 0, "cache_hits": 0, "not_modified": 0}
+        self._session = None
+        self._async_sessions: Dict[asyncio.AbstractEventLoop, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def fetch_profile(self, public_id: str, api_key: str) -> Dict[str, Any]:
+        """Return the Proxycurl profile for public_id, from cache when fresh."""
+        cached = self._cached(public_id)
+        if cached and cached["fresh"]:
+            return cached["data"]
+        
+        session = self._get_session()
+        headers, params = self._request_args(public_id, api_key, cached)
+        for attempt in range(self.max_retries + 1):
+            self.stats["requests"] += 1
+            try:
+                response = session.get(self.PROFILE_URL, headers=headers, params=params, timeout=30)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == self.max_retries:
+                    raise
+                self._count_retry(public_id, attempt, str(e))
+                time.sleep(self._retry_delay(attempt))
+                continue
+            
+            delay = self._status_retry_delay(public_id, response, attempt)
+            if delay is not None:
+                time.sleep(delay)
+                continue
+            
+            return self._handle_response(public_id, response, cached)
+    
+    async def afetch_profile(self, public_id: str, api_key: str) -> Dict[str, Any]:
+        """Async variant of fetch_profile on the async_session's pooled httpx.AsyncClient (a one-off one outside a session)."""
+        cached = self._cached(public_id)
+        if cached and cached["fresh"]:
+            return cached["data"]
+        
+        async with self._async_client() as client:
+            return await self._afetch_with_retries(client, public_id, api_key, cached)
+    
+    async def _afetch_with_retries(self, client: Any, public_id: str, api_key: str,
+                                   cached: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        headers, params = self._request_args(public_id, api_key, cached)
+        for attempt in range(self.max_retries + 1):
+            self.stats["requests"] += 1
+            try:
+                response = await client.get(self.PROFILE_URL, headers=headers, params=params)
+            except httpx.TransportError as e:
+                if attempt == self.max_retries:
+                    raise
+                self._count_retry(public_id, attempt, str(e))
+                await asyncio.sleep(self._retry_delay(attempt))
+                continue
+            
+            delay = self._status_retry_delay(public_id, response, attempt)
+            if delay is not None:
+                await asyncio.sleep(delay)
+                continue
+            
+            return self._handle_response(public_id, response, cached)
+    
+    def _cached(self, public_id: str) -> Optional[Dict[str, Any]]:
+        cached = self.cache.get(public_id) if self.cache else None
+        if cached and cached["fresh"]:
+            self.stats["cache_hits"] += 1
+            logger.info(f"Serving Proxycurl profile for public_id={public_id} from cache")
+        return cached
+    
+    def _request_args(self, public_id: str, api_key: str, cached: Optional[Dict[str, Any]]) -> tuple:
+        headers = {
+            'Authorization': f'Bearer {api_key}'
+        }
+        if cached and cached["etag"]:
+            headers['If-None-Match'] = cached["etag"]
+        if cached and cached["last_modified"]:
+            headers['If-Modified-Since'] = cached["last_modified"]
+        params = {
+            'url': f'https://www.linkedin.com/in/{public_id}',
+            'fallback_to_cache': 'on-error'
+        }
+        return headers, params
+    
+    def _handle_response(self, public_id: str, response: Any, cached: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Turn a final (non-retried) response into profile data, refreshing the cache."""
+        if response.status_code == 304 and cached:
+            self.stats["not_modified"] += 1
+            self.cache.touch(public_id)
+            return cached["data"]
+        
+        response.raise_for_status()
+        data = response.json()
+        if self.cache:
+            self.cache.set(public_id, data, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return data
+    
+    def _status_retry_delay(self, public_id: str, response: Any, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying a 429/5xx response, or None to hand it to _handle_response."""
+        if response.status_code not in self.RETRY_STATUSES or attempt == self.max_retries:
+            return None
+        delay = self._retry_delay(attempt, response.headers.get("Retry-After"))
+        if delay is None:
+            logger.warning(f"Not retrying Proxycurl request for public_id={public_id}: "
+                           f"Retry-After {response.headers.get('Retry-After')}s exceeds {self.max_retry_after:g}s")
+            return None
+        self._count_retry(public_id, attempt, f"HTTP {response.status_code}")
+        return delay
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """Server-provided Retry-After if numeric, else exponential backoff with full jitter.
+        
+        None when Retry-After exceeds max_retry_after: waiting that long is treated as a failure.
+        """
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                pass
+            else:
+                return max(delay, 0.0) if delay <= self.max_retry_after else None
+        return random.uniform(0, self.backoff_seconds * (2 ** attempt))
+    
+    def _count_retry(self, public_id: str, attempt: int, reason: str):
+        self.stats["retries"] += 1
+        telemetry.count_retry()
+        logger.warning(f"Retrying Proxycurl request for public_id={public_id} (attempt {attempt + 1}/{self.max_retries}): {reason}")
+    
+    def _get_session(self) -> Any:
+        """Lazily build one keep-alive requests.Session sized for concurrent batch runs."""
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size))
+                self._session = session
+            return self._session
+    
+    @contextlib.asynccontextmanager
+    async def async_session(self) -> AsyncIterator[None]:
+        """Share one pooled httpx.AsyncClient between afetch_profile calls on this event loop.
+        
+        Sessions nest; the client (its pool is bound to the loop) is created on first use and
+        closed when the outermost session on the loop exits.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            session = self._async_sessions.setdefault(loop, {"client": None, "users": 0})
+            session["users"] += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                session["users"] -= 1
+                closing = session["users"] == 0
+                if closing:
+                    del self._async_sessions[loop]
+            if closing and session["client"] is not None:
+                await session["client"].aclose()
+    
+    @contextlib.asynccontextmanager
+    async def _async_client(self) -> AsyncIterator[Any]:
+        """The current async_session's client, or a one-off client closed after the call."""
+        session = self._async_sessions.get(asyncio.get_running_loop())
+        if session is None:
+            async with self._new_async_client() as client:
+                yield client
+            return
+        if session["client"] is None:
+            session["client"] = self._new_async_client()
+        yield session["client"]
+    
+    def _new_async_client(self) -> Any:
+        return httpx.AsyncClient(
+            timeout=30,
+            limits=httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size)
+        )
+
+
+class IngestionStore:
+    """SQLite store of normalized LinkedInProfile / LinkedInPost records, partitioned by user and month.
+    
+    Each profile row remembers which source filled it and when, so _collect_data can serve
+    re-runs from here and merge only what a refresh brings back.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS profiles (
+                public_id TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                profile TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS posts (
+                public_id TEXT NOT NULL,
+                month TEXT NOT NULL,
+                post_id TEXT NOT NULL,
+                published_at TEXT NOT NULL,
+                post TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (public_id, post_id)
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_user_month ON posts(public_id, month)")
+        self._conn.commit()
+    
+    def freshness(self, public_id: str) -> Optional[Dict[str, Any]]:
+        """Return {"source", "fetched_at"} for public_id, or None if it was never stored."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT source, fetched_at FROM profiles WHERE public_id = ?", (public_id,)
+            ).fetchone()
+        return {"source": row[0], "fetched_at": row[1]} if row else None
+    
+    def latest_post_date(self, public_id: str) -> Optional[datetime]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(published_at) FROM posts WHERE public_id = ?", (public_id,)
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row and row[0] else None
+    
+    def load(self, public_id: str) -> Optional[tuple]:
+        """Return (profile, PostBatch of posts inside the analysis window, oldest first), or None."""
+        start_month = ANALYSIS_START_DATE.strftime("%Y-%m")
+        end_month = (ANALYSIS_END_DATE - timedelta(days=1)).strftime("%Y-%m")
+        with self._lock:
+            row = self._conn.execute("SELECT profile FROM profiles WHERE public_id = ?", (public_id,)).fetchone()
+            if row is None:
+                return None
+            post_rows = self._conn.execute(
+                """SELECT post FROM posts
+                   WHERE public_id = ? AND month BETWEEN ? AND ? AND published_at >= ? AND published_at < ?
+                   ORDER BY published_at""",
+                (public_id, start_month, end_month, ANALYSIS_START_DATE.isoformat(), ANALYSIS_END_DATE.isoformat())
+            ).fetchall()
+        
+        profile = LinkedInProfile(**json.loads(row[0]))
+        posts = PostBatch.from_posts(json.loads(post) for (post,) in post_rows)
+        return profile, posts
+    
+    def merge(self, public_id: str, source: str, profile: LinkedInProfile, posts: List[LinkedInPost]) -> int:
+        """Upsert the profile and the fetched posts; posts already stored but not re-fetched are kept.
+        
+        Returns the number of posts that were not in the store before.
+        """
+        now = time.time()
+        with self._lock:
+            before = self._conn.execute("SELECT COUNT(*) FROM posts WHERE public_id = ?", (public_id,)).fetchone()[0]
+            self._conn.execute(
+                "INSERT OR REPLACE INTO profiles (public_id, source, profile, fetched_at) VALUES (?, ?, ?, ?)",
+                (public_id, source, json.dumps(profile.model_dump(mode="json")), now)
+            )
+            # Re-fetched posts overwrite their stored copy so engagement counts stay current
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO posts (public_id, month, post_id, published_at, post, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (public_id, post.published_at.strftime("%Y-%m"), post.post_id, post.published_at.isoformat(),
+                     json.dumps(post.model_dump(mode="json")), now)
+                    for post in posts
+                ]
+            )
+            after = self._conn.execute("SELECT COUNT(*) FROM posts WHERE public_id = ?", (public_id,)).fetchone()[0]
+            self._conn.commit()
+        return after - before
+    
+    def invalidate(self, public_id: str):
+        """Forget everything stored for public_id."""
+        with self._lock:
+            self._conn.execute("DELETE FROM posts WHERE public_id = ?", (public_id,))
+            self._conn.execute("DELETE FROM profiles WHERE public_id = ?", (public_id,))
+            self._conn.commit()
+
+
+linkedin_session_pool = LinkedinSessionPool(LINKEDIN_API_RATE_PER_SECOND, LINKEDIN_API_BURST)
+fetch_checkpoints = FetchCheckpointStore(FETCH_CHECKPOINT_PATH)
+proxycurl_client = ProxycurlClient(
+    ProxycurlResponseCache(PROXYCURL_CACHE_PATH, PROXYCURL_CACHE_TTL_SECONDS),
+    PROXYCURL_POOL_SIZE, PROXYCURL_MAX_RETRIES, PROXYCURL_BACKOFF_SECONDS
+)
+ingestion_store = IngestionStore(INGESTION_STORE_PATH) if INGESTION_STORE_ENABLED else None
+
+
 class IngestionAgent:
     """Agent responsible for collecting LinkedIn data from various sources."""
     
-    def __init__(self):
+    def __init__(self, store: Optional[IngestionStore] = None, max_age_seconds: int = INGESTION_MAX_AGE_SECONDS):
         self.audit_log = []
+        self.store = store
+        self.max_age_seconds = max_age_seconds
         logger.info("IngestionAgent initialized")
     
     def process(self, state: LAIEState) -> AgentResponse:
         """Process data ingestion for the given LinkedIn profile."""
         public_id = state["public_id"]
-        data_sources = state["data_sources"]
+        data_sources = credential_store.resolve(state["data_sources"], state.get("credentials_ref"))
         
         logger.info(f"IngestionAgent processing for public_id={public_id}")
         
         try:
             # Attempt data collection
             profile, posts = self._collect_data(public_id, data_sources)
+            response = self._build_response(public_id, profile, posts)
             
-            # Validate data quality
-            quality_score = self._assess_data_quality(profile, posts)
-            
-            # Convert to dict format for state
-            profile_dict = profile.dict() if hasattr(profile, 'dict') else profile
-            posts_list = [post.dict() if hasattr(post, 'dict') else post for post in posts]
-            
-            response = AgentResponse(
-                success=True,
-                data={
-                    "profile": profile_dict,
-                    "posts": posts_list,
-                    "quality_score": quality_score
-                },
-                message=f"Successfully collected data for {public_id}",
-                next_agent="analytics",
-                errors=[]
-            )
-            
-            self._log_action(f"Data ingestion completed for {public_id}")
+        except Exception as e:
+            response = self._build_failure(e)
+        
+        return response
+    
+    async def aprocess(self, state: LAIEState) -> AgentResponse:
+        """Async variant of process; network sources use an async HTTP client."""
+        public_id = state["public_id"]
+        data_sources = credential_store.resolve(state["data_sources"], state.get("credentials_ref"))
+        
+        logger.info(f"IngestionAgent processing for public_id={public_id} (async)")
+        
+        try:
+            profile, posts = await self._acollect_data(public_id, data_sources)
+            response = self._build_response(public_id, profile, posts)
             
         except Exception as e:
-            logger.error("IngestionAgent failed", error=str(e))
-            response = AgentResponse(
-                success=False,
-                data=None,
-                message=f"Data ingestion failed: {str(e)}",
-                next_agent=None,
-                errors=[str(e)]
-            )
+            response = self._build_failure(e)
+        
+        return response
+    
+    def _build_response(self, public_id: str, profile: LinkedInProfile, posts: List[Any]) -> AgentResponse:
+        """Score the collected data and wrap it in an agent response."""
+        # Posts travel as one compact batch from here on; no per-post dict conversion
+        batch = PostBatch.from_posts(posts)
+        
+        # Validate data quality
+        quality_score = self._assess_data_quality(profile, batch)
+        
+        # Convert to dict format for state
+        profile_dict = profile.model_dump(mode="json")
         
+        response = AgentResponse(
+            success=True,
+            data={
+                "profile": profile_dict,
+                "posts": batch,
+                "quality_score": quality_score
+            },
+            message=f"Successfully collected data for {public_id}",
+            next_agent="analytics",
+            errors=[]
+        )
+        
+        self._log_action(f"Data ingestion completed for {public_id}")
         return response
     
+    def _build_failure(self, error: Exception) -> AgentResponse:
+        """Log a failure and wrap it in an agent response."""
+        logger.error("IngestionAgent failed", error=str(error))
+        return AgentResponse(
+            success=False,
+            data=None,
+            message=f"Data ingestion failed: {str(error)}",
+            next_agent=None,
+            errors=[str(error)],
+            transient=is_transient_error(error)
+        )
+    
     def _collect_data(self, public_id: str, data_sources: Dict[str, Any]) -> tuple:
+        """Collect data, serving from the ingestion store while it is fresh for this source."""
+        if self.store is None:
+            return self._collect_from_source(public_id, data_sources)
+        
+        source = self._source_key(data_sources)
+        stored = self._load_fresh(public_id, source, data_sources)
+        if stored is not None:
+            return stored
+        
+        since = self.store.latest_post_date(public_id)
+        profile, posts = self._collect_from_source(public_id, data_sources, since=since)
+        return self._merge_into_store(public_id, source, profile, posts)
+    
+    async def _acollect_data(self, public_id: str, data_sources: Dict[str, Any]) -> tuple:
+        """Async variant of _collect_data; store reads and writes run off the event loop."""
+        if self.store is None:
+            return await self._acollect_from_source(public_id, data_sources)
+        
+        source = self._source_key(data_sources)
+        stored = await asyncio.to_thread(self._load_fresh, public_id, source, data_sources)
+        if stored is not None:
+            return stored
+        
+        since = await asyncio.to_thread(self.store.latest_post_date, public_id)
+        profile, posts = await self._acollect_from_source(public_id, data_sources, since=since)
+        return await asyncio.to_thread(self._merge_into_store, public_id, source, profile, posts)
+    
+    def _collect_from_source(self, public_id: str, data_sources: Dict[str, Any],
+                             since: Optional[datetime] = None) -> tuple:
         """Collect data from available sources."""
         # Priority: GDPR export > Proxycurl > linkedin-api
         
@@ -60,14 +668,202 @@ class IngestionAgent:
             return self._fetch_proxycurl_data(public_id, data_sources["proxycurl_api_key"])
         
         if data_sources.get("linkedin_credentials"):
-            return self._fetch_linkedin_api_data(public_id, data_sources["linkedin_credentials"])
+            return self._fetch_linkedin_api_data(public_id, data_sources["linkedin_credentials"], since=since)
+        
+        raise ValueError("No valid data source provided")
+    
+    async def _acollect_from_source(self, public_id: str, data_sources: Dict[str, Any],
+                                    since: Optional[datetime] = None) -> tuple:
+        """Async variant of _collect_from_source with the same source priority."""
+        if data_sources.get("gdpr_export"):
+            return await asyncio.to_thread(self._parse_gdpr_export, data_sources["gdpr_export"], public_id)
+        
+        if data_sources.get("proxycurl_api_key"):
+            return await self._afetch_proxycurl_data(public_id, data_sources["proxycurl_api_key"])
         
+        if data_sources.get("linkedin_credentials"):
+            # linkedin-api is a blocking client; keep it off the event loop
+            return await asyncio.to_thread(self._fetch_linkedin_api_data, public_id, data_sources["linkedin_credentials"], since)
+        
+        raise ValueError("No valid data source provided")
+    
+    def _source_key(self, data_sources: Dict[str, Any]) -> str:
+        """Identify the source _collect_from_source will use; a GDPR export is keyed by path and mtime."""
+        if data_sources.get("gdpr_export"):
+            path = Path(data_sources["gdpr_export"])
+            mtime = path.stat().st_mtime if path.is_file() else 0
+            return f"gdpr_export:{path}:{mtime}"
+        if data_sources.get("proxycurl_api_key"):
+            return "proxycurl"
+        if data_sources.get("linkedin_credentials"):
+            return "linkedin_api"
         raise ValueError("No valid data source provided")
     
+    def _load_fresh(self, public_id: str, source: str, data_sources: Dict[str, Any]) -> Optional[tuple]:
+        """Return stored (profile, posts) if they came from this source within the staleness bound.
+        
+        data_sources may override the bound with "max_age_seconds", or pass "refresh": True to
+        always go back to the source.
+        """
+        if data_sources.get("refresh"):
+            return None
+        
+        freshness = self.store.freshness(public_id)
+        max_age = data_sources.get("max_age_seconds", self.max_age_seconds)
+        if freshness is None or freshness["source"] != source or time.time() - freshness["fetched_at"] > max_age:
+            return None
+        
+        stored = self.store.load(public_id)
+        if stored is not None:
+            age = time.time() - freshness["fetched_at"]
+            self._log_action(f"Served {public_id} from ingestion store ({len(stored[1])} posts, {age:.0f}s old)")
+        return stored
+    
+    def _merge_into_store(self, public_id: str, source: str, profile: LinkedInProfile,
+                          posts: List[LinkedInPost]) -> tuple:
+        """Merge freshly collected data into the store and return the merged view."""
+        new_posts = self.store.merge(public_id, source, profile, posts)
+        self._log_action(f"Merged {public_id} into ingestion store: {len(posts)} fetched, {new_posts} new")
+        return self.store.load(public_id)
+    
     def _parse_gdpr_export(self, zip_path: str, public_id: str) -> tuple:
-        """Parse GDPR export (simplified implementation)."""
-        # In production, this would parse actual GDPR export
-        # For demo, return mock data
+        """Parse a LinkedIn GDPR data export zip.
+        
+        CSV members are streamed straight out of the archive (never extracted or read whole),
+        so memory stays bounded by the posts inside the analysis window, not the archive size.
+        """
+        if not Path(zip_path).is_file():
+            # Demo notebooks pass a placeholder path; keep them working with synthetic data
+            logger.warning(f"GDPR export not found at {zip_path}, using synthetic demo data")
+            return self._generate_mock_export(public_id)
+        
+        try:
+            with zipfile.ZipFile(zip_path) as archive:
+                members = self._index_export_members(archive)
+                profile = self._parse_export_profile(archive, members, public_id)
+                
+                posts = []
+                for chunk in self._iter_export_post_chunks(archive, members, public_id):
+                    posts.extend(chunk)
+        except zipfile.BadZipFile as e:
+            logger.error("Invalid GDPR export archive", error=str(e))
+            raise ValueError(f"Failed to read GDPR export: {str(e)}")
+        
+        self._log_action(f"Parsed GDPR export for {public_id}: {len(posts)} posts in analysis window")
+        return profile, posts
+    
+    def iter_gdpr_export_posts(self, zip_path: str, public_id: str,
+                               chunk_size: int = GDPR_CHUNK_SIZE) -> Iterator[List[LinkedInPost]]:
+        """Yield the export's in-window posts in chunks of at most chunk_size."""
+        with zipfile.ZipFile(zip_path) as archive:
+            members = self._index_export_members(archive)
+            yield from self._iter_export_post_chunks(archive, members, public_id, chunk_size)
+    
+    def _index_export_members(self, archive: zipfile.ZipFile) -> Dict[str, str]:
+        """Map lower-cased CSV basenames (e.g. "shares.csv") to their archive member names."""
+        return {
+            Path(name).name.lower(): name
+            for name in archive.namelist()
+            if name.lower().endswith(".csv")
+        }
+    
+    def _iter_export_rows(self, archive: zipfile.ZipFile, members: Dict[str, str], filename: str,
+                          header_prefix: Optional[str] = None) -> Iterator[Dict[str, str]]:
+        """Stream rows of one CSV member; header_prefix skips preamble lines before the header."""
+        member = members.get(filename.lower())
+        if member is None:
+            return
+        
+        with archive.open(member) as raw:
+            text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+            if header_prefix:
+                # e.g. Connections.csv starts with a "Notes:" block before its header row
+                lines = (line for line in text)
+                for line in lines:
+                    if line.startswith(header_prefix):
+                        yield from csv.DictReader(itertools.chain([line], lines))
+                        return
+                return
+            yield from csv.DictReader(text)
+    
+    def _parse_export_profile(self, archive: zipfile.ZipFile, members: Dict[str, str],
+                              public_id: str) -> LinkedInProfile:
+        """Build LinkedInProfile from Profile.csv and a streamed count of Connections.csv."""
+        row = next(self._iter_export_rows(archive, members, "Profile.csv"), {})
+        full_name = f"{row.get('First Name', '')} {row.get('Last Name', '')}".strip()
+        connections_count = sum(1 for _ in self._iter_export_rows(archive, members, "Connections.csv", header_prefix="First Name"))
+        
+        return LinkedInProfile(
+            user_id=public_id,
+            full_name=full_name or f"User {public_id}",
+            headline=row.get("Headline") or "Professional",
+            connections_count=connections_count,
+            industry=row.get("Industry") or None,
+            location=row.get("Geo Location") or None,
+            about=row.get("Summary") or None
+        )
+    
+    def _iter_export_post_chunks(self, archive: zipfile.ZipFile, members: Dict[str, str], public_id: str,
+                                 chunk_size: int = GDPR_CHUNK_SIZE) -> Iterator[List[LinkedInPost]]:
+        """Map Shares.csv rows inside the analysis window to LinkedInPost, chunk_size at a time."""
+        chunk = []
+        for row in self._iter_export_rows(archive, members, "Shares.csv"):
+            published_at = self._parse_export_date(row.get("Date", ""))
+            if published_at is None or published_at < ANALYSIS_START_DATE or published_at >= ANALYSIS_END_DATE:
+                continue
+            
+            # The export carries no engagement counts for the member's own shares
+            chunk.append(LinkedInPost(
+                post_id=self._export_post_id(row.get("ShareLink", ""), published_at),
+                user_id=public_id,
+                content=row.get("ShareCommentary", "") or "",
+                content_type=self._export_content_type(row),
+                published_at=published_at
+            ))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        
+        if chunk:
+            yield chunk
+    
+    def _parse_export_date(self, value: str) -> Optional[datetime]:
+        """Parse export timestamps such as "2025-03-04 10:22:33"."""
+        value = value.strip()
+        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    
+    def _export_post_id(self, share_link: str, published_at: datetime) -> str:
+        """Take the activity/share id from a ShareLink URL (urn:li:share:123 / urn%3Ali%3Ashare%3A123)."""
+        urn = unquote(share_link).rstrip("/").split("/")[-1]
+        if ":" in urn:
+            return urn.split(":")[-1]
+        return hashlib.sha1(f"{share_link}|{published_at.isoformat()}".encode("utf-8")).hexdigest()[:16]
+    
+    def _export_content_type(self, row: Dict[str, str]) -> ContentType:
+        """Infer content type from the share's media / shared URL columns."""
+        media_url = (row.get("MediaUrl") or "").lower()
+        shared_url = (row.get("SharedUrl") or "").lower()
+        
+        if media_url:
+            if "video" in media_url:
+                return ContentType.VIDEO
+            if "document" in media_url or media_url.endswith(".pdf"):
+                return ContentType.DOCUMENT
+            return ContentType.IMAGE
+        if "/pulse/" in shared_url:
+            return ContentType.ARTICLE
+        return ContentType.TEXT
+    
+    def _generate_mock_export(self, public_id: str) -> tuple:
+        """Generate synthetic profile and posts for demos without a real export."""
         profile = LinkedInProfile(
             user_id=public_id,
             full_name="Demo User",
@@ -113,37 +909,11 @@ class IngestionAgent:
         return profile, posts
     
     def _fetch_proxycurl_data(self, public_id: str, api_key: str) -> tuple:
-        """Fetch data from Proxycurl API."""
-        import requests
-        
+        """Fetch data from Proxycurl API through the shared pooled, caching client."""
         try:
-            # Proxycurl API endpoint for profile data
-            url = "https://nubela.co/proxycurl/api/v2/linkedin"
-            headers = {
-                'Authorization': f'Bearer {api_key}'
-            }
-            params = {
-                'url': f'https://www.linkedin.com/in/{public_id}',
-                'fallback_to_cache': 'on-error'
-            }
-            
             logger.info(f"Fetching profile data from Proxycurl for public_id={public_id}")
-            response = requests.get(url, headers=headers, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Extract profile information
-            profile = LinkedInProfile(
-                user_id=public_id,
-                full_name=data.get('full_name', f'User {public_id}'),
-                headline=data.get('headline', data.get('occupation', 'Professional')),
-                followers_count=data.get('follower_count', 0),
-                connections_count=data.get('connections', 0),
-                industry=data.get('industry'),
-                location=data.get('city', {}).get('full') if data.get('city') else None,
-                about=data.get('summary')
-            )
+            data = proxycurl_client.fetch_profile(public_id, api_key)
+            profile = self._profile_from_proxycurl(public_id, data)
             
             # Proxycurl doesn't provide posts data, return empty list
             posts = []
@@ -153,34 +923,57 @@ class IngestionAgent:
             
         except requests.exceptions.RequestException as e:
             logger.error("Proxycurl API error", error=str(e))
-            raise ValueError(f"Failed to fetch Proxycurl data: {str(e)}")
+            raise ValueError(f"Failed to fetch Proxycurl data: {str(e)}") from e
         except Exception as e:
             logger.error("Proxycurl data processing error", error=str(e))
-            raise ValueError(f"Failed to process Proxycurl data: {str(e)}")
+            raise ValueError(f"Failed to process Proxycurl data: {str(e)}") from e
     
-    def _fetch_linkedin_api_data(self, public_id: str, credentials: Dict) -> tuple:
-        """Fetch data using linkedin-api."""
+    async def _afetch_proxycurl_data(self, public_id: str, api_key: str) -> tuple:
+        """Fetch data from Proxycurl API through the shared client's pooled async connections."""
         try:
-            from linkedin_api import Linkedin
+            logger.info(f"Fetching profile data from Proxycurl for public_id={public_id}")
+            data = await proxycurl_client.afetch_profile(public_id, api_key)
+            profile = self._profile_from_proxycurl(public_id, data)
             
-            # Initialize LinkedIn client
-            email = credentials.get("email") or os.getenv("LINKEDIN_EMAIL")
-            password = credentials.get("password") or os.getenv("LINKEDIN_PASSWORD")
-            li_at = credentials.get("li_at") or os.getenv("LINKEDIN_LI_AT")
+            # Proxycurl doesn't provide posts data, return empty list
+            posts = []
+            self._log_action(f"Successfully fetched Proxycurl data for {public_id}")
             
-            if li_at:
-                # Use li_at cookie for authentication
-                api = Linkedin("", "", cookies={"li_at": li_at})
-            elif email and password:
-                # Use email/password authentication
-                api = Linkedin(email, password)
-            else:
-                raise ValueError("No valid LinkedIn credentials provided")
+            return profile, posts
+            
+        except httpx.HTTPError as e:
+            logger.error("Proxycurl API error", error=str(e))
+            raise ValueError(f"Failed to fetch Proxycurl data: {str(e)}") from e
+        except Exception as e:
+            logger.error("Proxycurl data processing error", error=str(e))
+            raise ValueError(f"Failed to process Proxycurl data: {str(e)}") from e
+    
+    def _profile_from_proxycurl(self, public_id: str, data: Dict[str, Any]) -> LinkedInProfile:
+        """Map a Proxycurl profile response to LinkedInProfile."""
+        return LinkedInProfile(
+            user_id=public_id,
+            full_name=data.get('full_name', f'User {public_id}'),
+            headline=data.get('headline', data.get('occupation', 'Professional')),
+            followers_count=data.get('follower_count', 0),
+            connections_count=data.get('connections', 0),
+            industry=data.get('industry'),
+            location=data.get('city', {}).get('full') if data.get('city') else None,
+            about=data.get('summary')
+        )
+    
+    def _fetch_linkedin_api_data(self, public_id: str, credentials: Dict, since: Optional[datetime] = None) -> tuple:
+        """Fetch data using linkedin-api, paginating the post feed back to ANALYSIS_START_DATE.
+        
+        With since (the newest post already stored), paging stops once the feed reaches it.
+        """
+        try:
+            # Reuse an authenticated, rate-limited session for these credentials
+            client = linkedin_session_pool.get(credentials)
             
             logger.info(f"Fetching profile data from LinkedIn API for public_id={public_id}")
             
             # Get profile data
-            profile_data = api.get_profile(public_id)
+            profile_data = client.get_profile(public_id)
             
             # Extract profile information
             profile = LinkedInProfile(
@@ -196,60 +989,8 @@ class IngestionAgent:
             
             # Get posts/activity data
             logger.info(f"Fetching posts data from LinkedIn API for public_id={public_id}")
-            urn_id = profile_data.get("public_id") or public_id
-            
-            # Get recent posts (last 365 days)
-            posts_data = api.get_profile_posts(urn_id, post_count=50)  # Get up to 50 recent posts
-            posts = []
-            
-            for post_item in posts_data.get("elements", []):
-                post = post_item.get("update", {}).get("share", {})
-                if not post:
-                    continue
-                
-                # Extract post information
-                post_id = str(post.get("urn", "").split(":")[-1])
-                content = post.get("text", {}).get("text", "")
-                published_at_str = post.get("created", {}).get("time")
-                
-                # Convert timestamp to datetime
-                if published_at_str:
-                    try:
-                        published_at = datetime.fromtimestamp(int(published_at_str) / 1000)
-                    except:
-                        published_at = ANALYSIS_START_DATE
-                else:
-                    published_at = ANALYSIS_START_DATE
-                
-                # Skip posts outside analysis window
-                if published_at < ANALYSIS_START_DATE or published_at >= ANALYSIS_END_DATE:
-                    continue
-                
-                # Get engagement metrics
-                social_counts = post.get("socialDetail", {}).get("totalSocialActivityCounts", {})
-                likes_count = social_counts.get("numLikes", 0)
-                comments_count = social_counts.get("numComments", 0)
-                reposts_count = social_counts.get("numShares", 0)
-                impressions = social_counts.get("numImpressions", 0)
-                
-                # Determine content type
-                content_type = ContentType.TEXT
-                if post.get("content", {}).get("images"):
-                    content_type = ContentType.IMAGE
-                elif post.get("content", {}).get("videos"):
-                    content_type = ContentType.VIDEO
-                
-                posts.append(LinkedInPost(
-                    post_id=post_id,
-                    user_id=public_id,
-                    content=content,
-                    content_type=content_type,
-                    published_at=published_at,
-                    likes_count=likes_count,
-                    comments_count=comments_count,
-                    reposts_count=reposts_count,
-                    impressions=impressions
-                ))
+            urn_id = profile_data.get("urn_id") or profile_data.get("public_id") or public_id
+            posts = self._fetch_linkedin_posts(client, public_id, urn_id, since)
             
             self._log_action(f"Successfully fetched LinkedIn API data for {public_id}: {len(posts)} posts")
             
@@ -257,7 +998,122 @@ class IngestionAgent:
             
         except ImportError as e:
             logger.error("linkedin-api package not installed", error=str(e))
-            raise ValueError("linkedin-api package required for LinkedIn API data fetching")
+            raise ValueError("linkedin-api package required for LinkedIn API data fetching") from e
         except Exception as e:
             logger.error("LinkedIn API error", error=str(e))
-            raise ValueError(f"Failed to fetch LinkedIn API data: {str(e)}")
+            raise ValueError(f"Failed to fetch LinkedIn API data: {str(e)}") from e
+    
+    def _fetch_linkedin_posts(self, client: Any, public_id: str, urn_id: str,
+                              since: Optional[datetime] = None) -> List[LinkedInPost]:
+        """Page through the member's share feed, checkpointing each page.
+        
+        The feed is newest-first, so paging stops once a page ends before ANALYSIS_START_DATE
+        or reaches since, the newest post already in the ingestion store.
+        An interrupted fetch resumes from its last checkpointed cursor on the next call.
+        """
+        fetch_key = f"{public_id}:{ANALYSIS_START_DATE.isoformat()}:{ANALYSIS_END_DATE.isoformat()}"
+        start, pagination_token, posts = fetch_checkpoints.load(fetch_key)
+        seen = {post.post_id for post in posts}
+        if start:
+            logger.info(f"Resuming LinkedIn post fetch for public_id={public_id} at offset {start} ({len(posts)} posts already fetched)")
+        
+        for _ in range(LINKEDIN_API_MAX_PAGES):
+            page = client.get_profile_posts_page(urn_id, start, LINKEDIN_API_PAGE_SIZE, pagination_token)
+            elements = page.get("elements", [])
+            
+            page_posts = []
+            oldest = None
+            for post_item in elements:
+                post = self._parse_linkedin_post(post_item, public_id)
+                if post is None:
+                    continue
+                oldest = post.published_at if oldest is None else min(oldest, post.published_at)
+                
+                # Skip posts outside analysis window, and ones an earlier page already returned
+                if ANALYSIS_START_DATE <= post.published_at < ANALYSIS_END_DATE and post.post_id not in seen:
+                    seen.add(post.post_id)
+                    page_posts.append(post)
+            
+            next_start = start + len(elements)
+            pagination_token = page.get("paginationToken")
+            fetch_checkpoints.save_page(fetch_key, start, page_posts, next_start, pagination_token)
+            posts.extend(page_posts)
+            start = next_start
+            
+            reached_window_start = oldest is not None and oldest < ANALYSIS_START_DATE
+            reached_stored = oldest is not None and since is not None and oldest <= since
+            if not elements or reached_window_start or reached_stored or len(elements) < LINKEDIN_API_PAGE_SIZE:
+                break
+        
+        fetch_checkpoints.clear(fetch_key)
+        return posts
+    
+    def _parse_linkedin_post(self, post_item: Dict[str, Any], public_id: str) -> Optional[LinkedInPost]:
+        """Map one feed element to LinkedInPost; None for elements that are not shares."""
+        post = post_item.get("update", {}).get("share", {})
+        if not post:
+            return None
+        
+        # Extract post information
+        post_id = str(post.get("urn", "").split(":")[-1])
+        content = post.get("text", {}).get("text", "")
+        published_at_str = post.get("created", {}).get("time")
+        
+        # Convert timestamp to datetime
+        if published_at_str:
+            try:
+                published_at = datetime.fromtimestamp(int(published_at_str) / 1000)
+            except:
+                published_at = ANALYSIS_START_DATE
+        else:
+            published_at = ANALYSIS_START_DATE
+        
+        # Get engagement metrics
+        social_counts = post.get("socialDetail", {}).get("totalSocialActivityCounts", {})
+        
+        # Determine content type
+        content_type = ContentType.TEXT
+        if post.get("content", {}).get("images"):
+            content_type = ContentType.IMAGE
+        elif post.get("content", {}).get("videos"):
+            content_type = ContentType.VIDEO
+        
+        return LinkedInPost(
+            post_id=post_id,
+            user_id=public_id,
+            content=content,
+            content_type=content_type,
+            published_at=published_at,
+            likes_count=social_counts.get("numLikes", 0),
+            comments_count=social_counts.get("numComments", 0),
+            reposts_count=social_counts.get("numShares", 0),
+            impressions=social_counts.get("numImpressions", 0)
+        )
+    
+    def _assess_data_quality(self, profile: LinkedInProfile, posts: PostBatch) -> float:
+        """Score collected data from 0 to 1: profile completeness, month coverage and engagement data."""
+        profile_fields = [profile.full_name, profile.headline, profile.industry, profile.location, profile.about]
+        profile_score = sum(1 for value in profile_fields if value) / len(profile_fields)
+        
+        total_months = (ANALYSIS_END_DATE.year - ANALYSIS_START_DATE.year) * 12 + ANALYSIS_END_DATE.month - ANALYSIS_START_DATE.month
+        months_covered = len(set(posts.month_keys()))
+        coverage_score = min(months_covered / total_months, 1.0) if total_months > 0 else 0.0
+        
+        engagement_score = 1.0 if any(posts.impressions) or any(posts.likes_count) else 0.0
+        
+        return round(0.3 * profile_score + 0.5 * coverage_score + 0.2 * engagement_score, 3)
+    
+    def _log_action(self, action: str):
+        """Log agent actions."""
+        timestamp = datetime.utcnow().isoformat()
+        self.audit_log.append({"timestamp": timestamp, "action": action, "agent": "ingestion"})
+        logger.info("agent_action", agent="ingestion", action=action)
+        print(f"IngestionAgent: {action}")
+
+# Initialize ingestion agent
+ingestion_agent = IngestionAgent(store=ingestion_store)
+
+print(" IngestionAgent ready")
+print("   → GDPR export streaming parser")
+print("   → Proxycurl and linkedin-api sources")
+print("   → Local ingestion store with staleness bound")
@@ -1,8 +1,387 @@
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+@dataclass
+class PostColumns:
+    """Posts loaded once into typed NumPy columns for vectorized analytics."""
+    batch: PostBatch
+    timestamps: Any        # datetime64[s] epoch timestamps
+    month_codes: Any       # months since 1970-01
+    day_codes: Any         # days since 1970-01-01
+    weekdays: Any          # 0 = Monday
+    hours: Any
+    content_type_codes: Any
+    content_types: List[str]
+    likes: Any
+    comments: Any
+    reposts: Any
+    impressions: Any
+    
+    @classmethod
+    def from_batch(cls, batch: PostBatch) -> "PostColumns":
+        """Wrap a PostBatch's typed arrays as NumPy columns, without per-post conversion."""
+        def int_column(values: array) -> Any:
+            return np.frombuffer(values, dtype=np.int64) if len(values) else np.zeros(0, dtype=np.int64)
+        
+        timestamps = (int_column(batch.published_us) // 1_000_000).astype("datetime64[s]")
+        day_codes = timestamps.astype("datetime64[D]").astype(np.int64)
+        
+        # Re-code content types against the sorted vocabulary, as np.unique would
+        content_types = sorted(batch.content_types)
+        recode = np.array([content_types.index(ct) for ct in batch.content_types], dtype=np.int64)
+        type_codes = np.frombuffer(batch.content_type, dtype=np.uint8) if len(batch) else np.zeros(0, dtype=np.uint8)
+        
+        return cls(
+            batch=batch,
+            timestamps=timestamps,
+            month_codes=timestamps.astype("datetime64[M]").astype(np.int64),
+            day_codes=day_codes,
+            weekdays=(day_codes + 3) % 7,  # 1970-01-01 was a Thursday
+            hours=(timestamps.astype(np.int64) - day_codes * 86400) // 3600,
+            content_type_codes=recode[type_codes] if len(recode) else np.zeros(0, dtype=np.int64),
+            content_types=content_types,
+            likes=int_column(batch.likes_count),
+            comments=int_column(batch.comments_count),
+            reposts=int_column(batch.reposts_count),
+            impressions=int_column(batch.impressions)
+        )
+    
+    @staticmethod
+    def month_label(month_code: int) -> str:
+        return str(np.datetime64(int(month_code), "M"))
+    
+    def month_labels(self) -> List[str]:
+        """Per-post "%Y-%m" labels, formatted once per distinct month."""
+        unique_codes, inverse = np.unique(self.month_codes, return_inverse=True)
+        labels = [self.month_label(code) for code in unique_codes]
+        return [labels[i] for i in inverse.reshape(-1)]
+
+
+class ColumnarAnalyticsEngine:
+    """Vectorized equivalent of AnalyticsAgent's per-post monthly, content and temporal analytics."""
+    
+    def compute(self, columns: PostColumns, user_id: str,
+                months: Optional[List[str]] = None) -> tuple:
+        """Return (monthly_analytics, content_performance, temporal_patterns) in one group-by pass.
+        
+        Output matches the per-post implementation exactly, including dict ordering
+        (first occurrence) and tie-breaking for best weekday/hour/content type.
+        """
+        engagements = columns.likes + columns.comments + columns.reposts
+        
+        monthly_analytics = self._monthly(columns, engagements, user_id, months)
+        content_performance = self._content_performance(columns, engagements)
+        temporal_patterns = self._temporal(columns)
+        
+        return monthly_analytics, content_performance, temporal_patterns
+    
+    @staticmethod
+    def _first_occurrence(codes: Any) -> tuple:
+        """Distinct codes ordered by first appearance, plus per-row group index and group counts."""
+        unique_codes, first_index, inverse, counts = np.unique(
+            codes, return_index=True, return_inverse=True, return_counts=True
+        )
+        return unique_codes, first_index, inverse.reshape(-1), counts
+    
+    def _monthly(self, columns: PostColumns, engagements: Any, user_id: str,
+                 months: Optional[List[str]]) -> List[Dict[str, Any]]:
+        if months is not None:
+            wanted = [np.datetime64(month, "M").astype(np.int64) for month in months]
+            mask = np.isin(columns.month_codes, wanted)
+        else:
+            mask = np.ones(len(columns.batch), dtype=bool)
+        
+        if not mask.any():
+            return []
+        
+        month_codes = columns.month_codes[mask]
+        ct_codes = columns.content_type_codes[mask]
+        unique_months, _, group, counts = self._first_occurrence(month_codes)
+        n_groups = len(unique_months)
+        
+        def group_sum(values: Any) -> Any:
+            return np.bincount(group, weights=values[mask], minlength=n_groups).astype(np.int64)
+        
+        impressions = group_sum(columns.impressions)
+        likes = group_sum(columns.likes)
+        total_engagements = group_sum(engagements)
+        
+        # content_types per month, keyed in order of first appearance within the month
+        n_types = len(columns.content_types)
+        pairs = group * n_types + ct_codes
+        unique_pairs, pair_first, _, pair_counts = self._first_occurrence(pairs)
+        month_content_types = [dict() for _ in range(n_groups)]
+        for i in np.argsort(pair_first, kind="stable"):
+            g, ct = divmod(int(unique_pairs[i]), n_types)
+            month_content_types[g][columns.content_types[ct]] = int(pair_counts[i])
+        
+        monthly_analytics = []
+        for g, month_code in enumerate(unique_months):  # np.unique sorts, i.e. chronological
+            total_impressions = int(impressions[g])
+            monthly_analytics.append({
+                "user_id": user_id,
+                "month": columns.month_label(month_code),
+                "posts_count": int(counts[g]),
+                "total_impressions": total_impressions,
+                "total_likes": int(likes[g]),
+                "engagement_rate": int(total_engagements[g]) / total_impressions if total_impressions > 0 else 0.0,
+                "content_types": month_content_types[g]
+            })
+        
+        return monthly_analytics
+    
+    def _content_performance(self, columns: PostColumns, engagements: Any) -> Dict[str, Any]:
+        codes = columns.content_type_codes
+        unique_codes, first_index, group, counts = self._first_occurrence(codes)
+        impressions = np.bincount(group, weights=columns.impressions).astype(np.int64)
+        total_engagements = np.bincount(group, weights=engagements).astype(np.int64)
+        
+        content_stats = {}
+        for g in np.argsort(first_index, kind="stable"):
+            count = int(counts[g])
+            total_impressions = int(impressions[g])
+            engagement_total = int(total_engagements[g])
+            content_stats[columns.content_types[int(unique_codes[g])]] = {
+                "count": count,
+                "total_impressions": total_impressions,
+                "total_engagements": engagement_total,
+                "avg_impressions": total_impressions / count,
+                "avg_engagements": engagement_total / count,
+                "engagement_rate": engagement_total / total_impressions if total_impressions > 0 else 0
+            }
+        
+        best_type = max(content_stats.items(), key=lambda x: x[1]["avg_impressions"]) if content_stats else None
+        
+        return {
+            "content_stats": content_stats,
+            "best_performing_type": best_type[0] if best_type else None,
+            "total_posts_analyzed": len(columns.batch)
+        }
+    
+    def _temporal(self, columns: PostColumns) -> Dict[str, Any]:
+        def ordered_counts(codes: Any) -> Dict[int, int]:
+            unique_codes, first_index, _, counts = self._first_occurrence(codes)
+            return {int(unique_codes[i]): int(counts[i]) for i in np.argsort(first_index, kind="stable")}
+        
+        posts_by_weekday = ordered_counts(columns.weekdays)
+        posts_by_hour = ordered_counts(columns.hours)
+        posts_by_month = {
+            columns.month_label(code): count for code, count in ordered_counts(columns.month_codes).items()
+        }
+        
+        total_days = (ANALYSIS_END_DATE - ANALYSIS_START_DATE).days
+        active_days = len(np.unique(columns.day_codes))
+        posting_consistency = active_days / total_days if total_days > 0 else 0
+        
+        best_weekday = max(posts_by_weekday.items(), key=lambda x: x[1])[0] if posts_by_weekday else None
+        best_hour = max(posts_by_hour.items(), key=lambda x: x[1])[0] if posts_by_hour else None
+        
+        return {
+            "posting_consistency": posting_consistency,
+            "active_days": active_days,
+            "total_days": total_days,
+            "best_posting_weekday": WEEKDAY_NAMES[best_weekday] if best_weekday is not None else None,
+            "best_posting_hour": best_hour,
+            "posts_by_month": posts_by_month,
+            "avg_posts_per_day": len(columns.batch) / total_days if total_days > 0 else 0
+        }
+
+
+class DailyRollup:
+    """One user's per-day totals over [start, end), with prefix sums so any window costs two lookups per metric.
+    
+    Days without posts are zero rows, so window queries never touch posts. Coverage (the days
+    the totals are known for) is tracked apart from activity: a window reaching outside it
+    reports fewer covered_days instead of passing those days off as days without posts.
+    """
+    
+    METRICS = ("posts", "impressions", "likes", "comments", "reposts")
+    
+    def __init__(self, days: Dict[date, Dict[str, Any]], start: date, end: date, covered: Optional[tuple] = None):
+        self.start = start
+        self.end = max(end, start)
+        self.covered = covered or (self.start, self.end)
+        
+        rows = [days.get(start + timedelta(days=i)) or {} for i in range((self.end - start).days)]
+        self.prefix = {
+            metric: [0, *itertools.accumulate(row.get(metric, 0) for row in rows)]
+            for metric in self.METRICS
+        }
+        content_types = sorted({content_type for row in rows for content_type in row.get("content_types") or {}})
+        self.content_prefix = {
+            content_type: [0, *itertools.accumulate((row.get("content_types") or {}).get(content_type, 0) for row in rows)]
+            for content_type in content_types
+        }
+    
+    @staticmethod
+    def daily_totals(batch: PostBatch) -> Dict[date, Dict[str, Any]]:
+        """Aggregate a batch into sparse per-day rows, in one pass over the posts."""
+        days = {}
+        for i in range(len(batch)):
+            day = batch.published_at(i).date()
+            row = days.get(day)
+            if row is None:
+                row = days[day] = {"posts": 0, "impressions": 0, "likes": 0, "comments": 0, "reposts": 0, "content_types": {}}
+            row["posts"] += 1
+            row["impressions"] += batch.impressions[i]
+            row["likes"] += batch.likes_count[i]
+            row["comments"] += batch.comments_count[i]
+            row["reposts"] += batch.reposts_count[i]
+            content_type = batch.content_types[batch.content_type[i]]
+            row["content_types"][content_type] = row["content_types"].get(content_type, 0) + 1
+        return days
+    
+    def totals(self, start: date, end: date) -> Dict[str, Any]:
+        """Metrics for [start, end): counts, engagement rate, posts per content type, and how many days are covered."""
+        last = len(self.prefix["posts"]) - 1
+        lo = min(max((start - self.start).days, 0), last)
+        hi = min(max((end - self.start).days, lo), last)
+        
+        totals = {metric: self.prefix[metric][hi] - self.prefix[metric][lo] for metric in self.METRICS}
+        engagements = totals["likes"] + totals["comments"] + totals["reposts"]
+        totals["engagement_rate"] = engagements / totals["impressions"] if totals["impressions"] > 0 else 0.0
+        totals["content_types"] = {
+            content_type: prefix[hi] - prefix[lo]
+            for content_type, prefix in self.content_prefix.items() if prefix[hi] > prefix[lo]
+        }
+        totals["days"] = max((end - start).days, 0)
+        totals["covered_days"] = max((min(end, self.covered[1]) - max(start, self.covered[0])).days, 0)
+        return totals
+    
+    def period_report(self, start: date, end: date, rolling_days: List[int]) -> Dict[str, Any]:
+        """Totals for [start, end), trailing windows ending with it, and year-over-year change."""
+        current = self.totals(start, end)
+        
+        rolling = {}
+        for days in rolling_days:
+            window_start = end - timedelta(days=days)
+            window = self.totals(window_start, end)
+            previous = self.totals(window_start - timedelta(days=days), window_start)
+            rolling[f"{days}d"] = {**window, "change": self._changes(window, previous)}
+        
+        previous_year = self.totals(self.year_earlier(start), self.year_earlier(end))
+        return {
+            "window": {"start": start.isoformat(), "end": end.isoformat()},
+            "totals": current,
+            "rolling": rolling,
+            "year_over_year": {"previous": previous_year, "change": self._changes(current, previous_year)}
+        }
+    
+    @classmethod
+    def _changes(cls, current: Dict[str, Any], previous: Dict[str, Any]) -> Optional[Dict[str, Optional[float]]]:
+        """Relative change per metric, or None when the earlier period is not fully covered."""
+        if previous["covered_days"] < previous["days"]:
+            return None
+        return {
+            metric: (current[metric] - previous[metric]) / previous[metric] if previous[metric] else None
+            for metric in (*cls.METRICS, "engagement_rate")
+        }
+    
+    @staticmethod
+    def year_earlier(day: date) -> date:
+        try:
+            return day.replace(year=day.year - 1)
+        except ValueError:  # 29 February
+            return day.replace(year=day.year - 1, day=28)
+
+
+class DailyRollupStore:
+    """SQLite store of per-user daily rollup rows, kept across runs so later windows need no re-ingestion.
+    
+    Each run replaces the days of its analysis window. Coverage grows while windows overlap
+    or touch; a window disjoint from the stored coverage starts it afresh.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS daily_rollups (
+                public_id TEXT NOT NULL,
+                day TEXT NOT NULL,
+                posts INTEGER NOT NULL,
+                impressions INTEGER NOT NULL,
+                likes INTEGER NOT NULL,
+                comments INTEGER NOT NULL,
+                reposts INTEGER NOT NULL,
+                content_types TEXT NOT NULL,
+                PRIMARY KEY (public_id, day)
+            )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS rollup_coverage (
+                public_id TEXT PRIMARY KEY,
+                start_day TEXT NOT NULL,
+                end_day TEXT NOT NULL
+            )"""
+        )
+        self._conn.commit()
+    
+    def replace(self, public_id: str, days: Dict[date, Dict[str, Any]], start: date, end: date):
+        """Make days the complete daily totals for [start, end) and extend the coverage to it."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM daily_rollups WHERE public_id = ? AND day >= ? AND day < ?",
+                (public_id, start.isoformat(), end.isoformat())
+            )
+            self._conn.executemany(
+                "INSERT INTO daily_rollups VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (public_id, day.isoformat(), *(row[metric] for metric in DailyRollup.METRICS), json.dumps(row["content_types"]))
+                    for day, row in days.items() if start <= day < end
+                ]
+            )
+            row = self._conn.execute(
+                "SELECT start_day, end_day FROM rollup_coverage WHERE public_id = ?", (public_id,)
+            ).fetchone()
+            if row and row[0] <= end.isoformat() and start.isoformat() <= row[1]:
+                start, end = min(start, date.fromisoformat(row[0])), max(end, date.fromisoformat(row[1]))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO rollup_coverage (public_id, start_day, end_day) VALUES (?, ?, ?)",
+                (public_id, start.isoformat(), end.isoformat())
+            )
+            self._conn.commit()
+    
+    def load(self, public_id: str, start: date, end: date) -> DailyRollup:
+        """DailyRollup of the stored days in [start, end)."""
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT day, posts, impressions, likes, comments, reposts, content_types FROM daily_rollups
+                   WHERE public_id = ? AND day >= ? AND day < ?""",
+                (public_id, start.isoformat(), end.isoformat())
+            ).fetchall()
+            coverage = self._conn.execute(
+                "SELECT start_day, end_day FROM rollup_coverage WHERE public_id = ?", (public_id,)
+            ).fetchone()
+        
+        days = {
+            date.fromisoformat(row[0]): {**dict(zip(DailyRollup.METRICS, row[1:6])), "content_types": json.loads(row[6])}
+            for row in rows
+        }
+        covered = (date.fromisoformat(coverage[0]), date.fromisoformat(coverage[1])) if coverage else (start, start)
+        return DailyRollup(days, start, end, covered)
+
+
+daily_rollup_store = DailyRollupStore(ROLLUP_STORE_PATH) if ROLLUP_STORE_ENABLED else None
+
+
 class AnalyticsAgent:
     """Agent responsible for performing deterministic analytics on LinkedIn data."""
     
-    def __init__(self):
+    def __init__(self, engine: str = ANALYTICS_ENGINE, rollup_store: Optional[DailyRollupStore] = None,
+                 rolling_days: List[int] = ROLLING_WINDOW_DAYS):
         self.audit_log = []
+        self.rollup_store = rollup_store
+        self.rolling_days = rolling_days
+        self.use_columnar = engine == "columnar" or (engine == "auto" and np is not None)
+        if self.use_columnar and np is None:
+            raise ImportError("numpy is required for the columnar analytics engine")
+        self.columnar_engine = ColumnarAnalyticsEngine() if self.use_columnar else None
+        self.engine = "columnar" if self.use_columnar else "python"
+        self.process_pool = None  # set by MultiAgentLAIESystem.run_batch to offload CPU work
         logger.info("AnalyticsAgent initialized")
     
     def process(self, state: LAIEState) -> AgentResponse:
@@ -12,26 +391,29 @@ class AnalyticsAgent:
         try:
             # Extract data from state
             profile_data = state.get("raw_profile")
-            posts_data = state.get("raw_posts", [])
+            posts = post_store.get(state.get("posts_ref"))
             
-            if not profile_data or not posts_data:
+            if not profile_data or not len(posts):
                 raise ValueError("Insufficient data for analytics")
             
-            # Convert to model objects
-            profile = LinkedInProfile(**profile_data)
-            posts = [LinkedInPost(**post_data) for post_data in posts_data]
+            previous_analysis = state.get("previous_analysis") or {}
             
-            # Perform analytics
-            monthly_analytics = self._compute_monthly_analytics(profile, posts)
-            content_performance = self._compute_content_performance(posts)
-            temporal_patterns = self._compute_temporal_patterns(posts)
+            if self.process_pool is not None:
+                results = self._compute_in_pool(profile_data, posts, previous_analysis)
+            else:
+                results = self._compute(profile_data, posts, previous_analysis)
+            monthly_analytics, content_performance, temporal_patterns, month_fingerprints, changed_months = results
+            period_metrics = self._period_metrics(state["public_id"], posts)
             
             response = AgentResponse(
                 success=True,
                 data={
-                    "monthly_analytics": [ma.dict() if hasattr(ma, 'dict') else ma for ma in monthly_analytics],
+                    "monthly_analytics": monthly_analytics,
                     "content_performance": content_performance,
-                    "temporal_patterns": temporal_patterns
+                    "temporal_patterns": temporal_patterns,
+                    "month_fingerprints": month_fingerprints,
+                    "changed_months": changed_months,
+                    "period_metrics": period_metrics
                 },
                 message="Analytics computation completed successfully",
                 next_agent="monthly_analysis",
@@ -47,11 +429,100 @@ class AnalyticsAgent:
                 data=None,
                 message=f"Analytics computation failed: {str(e)}",
                 next_agent=None,
-                errors=[str(e)]
+                errors=[str(e)],
+                transient=is_transient_error(e)
             )
         
         return response
     
+    async def aprocess(self, state: LAIEState) -> AgentResponse:
+        """Async variant of process; analytics is CPU-bound, so it runs off the event loop."""
+        return await asyncio.to_thread(self.process, state)
+    
+    def window_metrics(self, public_id: str, start: date, end: date) -> Optional[Dict[str, Any]]:
+        """Metrics for any [start, end) from the stored daily rollups, without re-ingesting or re-scanning posts."""
+        if self.rollup_store is None:
+            return None
+        return self.rollup_store.load(public_id, start, end).totals(start, end)
+    
+    def _period_metrics(self, public_id: str, posts: Union[PostBatch, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Refresh the user's daily rollups from this run's posts and answer the period queries from them."""
+        start, end = ANALYSIS_START_DATE.date(), ANALYSIS_END_DATE.date()
+        days = DailyRollup.daily_totals(PostBatch.from_posts(posts))
+        
+        # Earliest day any query reaches: last year's window, or the period before the longest rolling window
+        history_start = min(DailyRollup.year_earlier(start), end - timedelta(days=2 * max(self.rolling_days, default=0)))
+        if self.rollup_store is None:
+            rollup = DailyRollup(days, history_start, end, covered=(start, end))
+        else:
+            self.rollup_store.replace(public_id, days, start, end)
+            rollup = self.rollup_store.load(public_id, history_start, end)
+        return rollup.period_report(start, end, self.rolling_days)
+    
+    def _compute(self, profile_data: Dict[str, Any], posts: Union[PostBatch, List[Dict[str, Any]]],
+                 previous_analysis: Dict[str, Any]) -> tuple:
+        """Run analytics with the configured engine in the current process."""
+        batch = PostBatch.from_posts(posts)
+        if self.use_columnar:
+            return self._compute_columnar(profile_data, batch, previous_analysis)
+        return self._compute_per_post(profile_data, batch, previous_analysis)
+    
+    def _compute_in_pool(self, profile_data: Dict[str, Any], batch: PostBatch,
+                         previous_analysis: Dict[str, Any]) -> tuple:
+        """Run analytics in the worker process pool, falling back to in-process if the pool broke
+        or the job could not be pickled; errors raised by the analytics themselves propagate."""
+        try:
+            future = self.process_pool.submit(run_analytics_job, self.engine, profile_data, batch, previous_analysis)
+            return future.result()
+        except Exception as e:
+            if not _is_pool_error(e):
+                raise
+            logger.warning(f"Analytics process pool unavailable, computing in-process: {e}")
+            return self._compute(profile_data, batch, previous_analysis)
+    
+    def _compute_per_post(self, profile_data: Dict[str, Any], batch: PostBatch,
+                          previous_analysis: Dict[str, Any]) -> tuple:
+        """Run analytics over LinkedInPost views, one post at a time."""
+        # Convert to model objects
+        profile = LinkedInProfile(**profile_data)
+        posts = list(batch)
+        
+        # Only re-aggregate months whose posts changed since the previous run
+        month_fingerprints = self._compute_month_fingerprints(batch.month_keys(), self._fingerprint_rows(batch))
+        changed_months = self._find_changed_months(month_fingerprints, previous_analysis)
+        changed_posts = [post for post in posts if post.published_at.strftime("%Y-%m") in changed_months]
+        
+        # Perform analytics
+        fresh_analytics = self._compute_monthly_analytics(profile, changed_posts)
+        monthly_analytics = self._splice_monthly_analytics(
+            [ma.dict() if hasattr(ma, 'dict') else ma for ma in fresh_analytics],
+            previous_analysis.get("monthly_analytics") or [],
+            month_fingerprints
+        )
+        content_performance = self._compute_content_performance(posts)
+        temporal_patterns = self._compute_temporal_patterns(posts)
+        
+        return monthly_analytics, content_performance, temporal_patterns, month_fingerprints, changed_months
+    
+    def _compute_columnar(self, profile_data: Dict[str, Any], batch: PostBatch,
+                          previous_analysis: Dict[str, Any]) -> tuple:
+        """Run analytics over typed columns with the vectorized engine."""
+        columns = PostColumns.from_batch(batch)
+        
+        month_fingerprints = self._compute_month_fingerprints(columns.month_labels(), self._fingerprint_rows(batch))
+        changed_months = self._find_changed_months(month_fingerprints, previous_analysis)
+        
+        fresh_analytics, content_performance, temporal_patterns = self.columnar_engine.compute(
+            columns, profile_data["user_id"], months=changed_months
+        )
+        monthly_analytics = self._splice_monthly_analytics(
+            fresh_analytics,
+            previous_analysis.get("monthly_analytics") or [],
+            month_fingerprints
+        )
+        
+        return monthly_analytics, content_performance, temporal_patterns, month_fingerprints, changed_months
+    
     def _compute_monthly_analytics(self, profile: LinkedInProfile, posts: List[LinkedInPost]) -> List[MonthlyActivity]:
         """Compute monthly activity analytics."""
         monthly_data = defaultdict(lambda: {
@@ -92,6 +563,60 @@ class AnalyticsAgent:
         
         return monthly_activities
     
+    @staticmethod
+    def _fingerprint_rows(batch: PostBatch) -> List[tuple]:
+        """Per post, the fields that, when changed, invalidate its month."""
+        return [
+            (
+                batch.post_id[i],
+                batch.content_types[batch.content_type[i]],
+                batch.published_at(i).isoformat(),
+                batch.likes_count[i],
+                batch.comments_count[i],
+                batch.reposts_count[i],
+                batch.impressions[i],
+                batch.content[i]
+            )
+            for i in range(len(batch))
+        ]
+    
+    def _compute_month_fingerprints(self, month_keys: List[str], rows: List[tuple]) -> Dict[str, str]:
+        """Hash each month's posts and engagement counts so unchanged months can be detected."""
+        month_rows = defaultdict(list)
+        
+        for month_key, row in zip(month_keys, rows):
+            month_rows[month_key].append(row)
+        
+        return {
+            month_key: hashlib.sha256(json.dumps(sorted(rows)).encode("utf-8")).hexdigest()
+            for month_key, rows in month_rows.items()
+        }
+    
+    def _find_changed_months(self, month_fingerprints: Dict[str, str], previous_analysis: Dict[str, Any]) -> List[str]:
+        """Return months that were added, modified or removed since the previous analysis."""
+        previous_fingerprints = previous_analysis.get("month_fingerprints") or {}
+        previous_months = {ma.get("month") for ma in previous_analysis.get("monthly_analytics") or []}
+        
+        changed = {
+            month_key for month_key, fingerprint in month_fingerprints.items()
+            if previous_fingerprints.get(month_key) != fingerprint or month_key not in previous_months
+        }
+        changed.update(set(previous_fingerprints) - set(month_fingerprints))
+        
+        return sorted(changed)
+    
+    def _splice_monthly_analytics(self, fresh_analytics: List[Dict[str, Any]],
+                                  previous_analytics: List[Dict[str, Any]],
+                                  month_fingerprints: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Merge freshly computed months into the previous monthly analytics, in month order."""
+        fresh_by_month = {ma["month"]: ma for ma in fresh_analytics}
+        previous_by_month = {ma["month"]: ma for ma in previous_analytics}
+        
+        return [
+            fresh_by_month[month_key] if month_key in fresh_by_month else previous_by_month[month_key]
+            for month_key in sorted(month_fingerprints)
+        ]
+    
     def _compute_content_performance(self, posts: List[LinkedInPost]) -> Dict[str, Any]:
         """Compute content type performance analytics."""
         if not posts:
@@ -154,13 +679,11 @@ class AnalyticsAgent:
         best_weekday = max(posts_by_weekday.items(), key=lambda x: x[1])[0] if posts_by_weekday else None
         best_hour = max(posts_by_hour.items(), key=lambda x: x[1])[0] if posts_by_hour else None
         
-        weekday_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-        
         return {
             "posting_consistency": posting_consistency,
             "active_days": active_days,
             "total_days": total_days,
-            "best_posting_weekday": weekday_names[best_weekday] if best_weekday is not None else None,
+            "best_posting_weekday": WEEKDAY_NAMES[best_weekday] if best_weekday is not None else None,
             "best_posting_hour": best_hour,
             "posts_by_month": dict(posts_by_month),
             "avg_posts_per_day": len(posts) / total_days if total_days > 0 else 0
@@ -170,12 +693,28 @@ class AnalyticsAgent:
         """Log agent actions."""
         timestamp = datetime.utcnow().isoformat()
         self.audit_log.append({"timestamp": timestamp, "action": action, "agent": "analytics"})
+        logger.info("agent_action", agent="analytics", action=action)
         print(f"AnalyticsAgent: {action}")
 
+def _is_pool_error(error: Exception) -> bool:
+    """Whether error came from the process pool itself (a dead worker, an unpicklable job) rather than the job."""
+    if isinstance(error, (BrokenProcessPool, pickle.PicklingError)):
+        return True
+    # Unpicklable objects (locks, local functions) surface as TypeError/AttributeError
+    return isinstance(error, (TypeError, AttributeError)) and "pickle" in str(error)
+
+
+def run_analytics_job(engine: str, profile_data: Dict[str, Any], batch: PostBatch,
+                      previous_analysis: Dict[str, Any]) -> tuple:
+    """Process-pool entry point: compute one profile's analytics in a worker process."""
+    return AnalyticsAgent(engine=engine)._compute(profile_data, batch, previous_analysis)
+
 # Initialize analytics agent
-analytics_agent = AnalyticsAgent()
+analytics_agent = AnalyticsAgent(rollup_store=daily_rollup_store)
 
 print(" AnalyticsAgent ready")
 print("   → Monthly activity aggregation")
 print("   → Content performance analysis")
 print("   → Temporal pattern recognition")
+print(f"   → Daily rollups with prefix sums: rolling {', '.join(f'{days}d' for days in analytics_agent.rolling_days)} windows and year-over-year")
+print(f"   → Engine: {'columnar (NumPy)' if analytics_agent.use_columnar else 'per-post'}")
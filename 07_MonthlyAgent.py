@@ -1,62 +1,410 @@
 class MonthlyAnalysisAgent:
     """Agent responsible for creating detailed month-wise activity analysis using AI."""
     
-    def __init__(self):
+    def __init__(self, max_concurrency: int = MONTHLY_NOTE_CONCURRENCY, notes_mode: str = MONTHLY_NOTES_MODE,
+                 batch_token_budget: int = MONTHLY_BATCH_TOKEN_BUDGET, llm_client: Optional[Runnable] = None,
+                 retry_attempts: int = CALL_RETRY_ATTEMPTS, trivial_month_max_posts: int = TRIVIAL_MONTH_MAX_POSTS):
         self.audit_log = []
+        self.llm = llm_client or llm  # gateway-backed shared LLM unless a client is injected
+        self.max_concurrency = max_concurrency
+        self.retry_attempts = retry_attempts  # per month; only unusable replies are asked again
+        self.notes_mode = notes_mode
+        self.trivial_month_max_posts = trivial_month_max_posts  # quieter months get a templated note
+        self.batch_token_budget = batch_token_budget
         logger.info("MonthlyAnalysisAgent initialized")
     
-    def process(self, state: LAIEState) -> AgentResponse:
-        """Generate detailed month-wise activity notes using AI."""
+    def process(self, state: LAIEState, on_note: Optional[Callable[[MonthlyNote, bool], None]] = None,
+                completed_notes: Optional[Dict[str, MonthlyNote]] = None) -> AgentResponse:
+        """Generate detailed month-wise activity notes using AI.
+        
+        on_note, if given, is called with (note, reused) as soon as each note is available.
+        completed_notes (by month) were generated by an earlier attempt of this run and are reused as-is.
+        """
         logger.info("MonthlyAnalysisAgent processing")
         
         try:
-            monthly_analytics = state.get("monthly_analytics", [])
-            profile_data = state.get("raw_profile", {})
-            
-            if not monthly_analytics:
-                raise ValueError("No monthly analytics data available")
+            monthly_analytics, profile_data, months_to_generate, previous_notes = self._plan_months(state, completed_notes)
+            self._emit_reused(monthly_analytics, months_to_generate, previous_notes, on_note)
+            templated_notes, months_to_generate = self._template_quiet_months(
+                months_to_generate, profile_data, state.get("activity_level"), on_note
+            )
             
             # Generate AI-powered monthly notes
-            monthly_notes = []
-            for month_data in monthly_analytics:
-                note = self._generate_monthly_note(month_data, profile_data)
-                monthly_notes.append(note)
+            if self.notes_mode == "multi_month":
+                generated_notes = self._generate_monthly_notes_multi(months_to_generate, profile_data, on_note)
+            elif self.max_concurrency > 1:
+                generated_notes = self._generate_monthly_notes_batch(months_to_generate, profile_data, on_note)
+            else:
+                generated_notes = []
+                for month_data in months_to_generate:
+                    note = self._generate_monthly_note(month_data, profile_data)
+                    generated_notes.append(note)
+                    if on_note:
+                        on_note(note, False)
             
-            response = AgentResponse(
-                success=True,
-                data=monthly_notes,
-                message=f"Generated {len(monthly_notes)} monthly activity notes",
-                next_agent="summary",
-                errors=[]
-            )
+            response = self._build_response(monthly_analytics, templated_notes + generated_notes, previous_notes)
             
-            self._log_action(f"Generated {len(monthly_notes)} monthly analysis notes")
+        except Exception as e:
+            response = self._build_failure(e)
+        
+        return response
+    
+    async def aprocess(self, state: LAIEState, on_note: Optional[Callable[[MonthlyNote, bool], None]] = None,
+                       completed_notes: Optional[Dict[str, MonthlyNote]] = None) -> AgentResponse:
+        """Async variant of process built on self.llm.ainvoke."""
+        logger.info("MonthlyAnalysisAgent processing (async)")
+        
+        try:
+            monthly_analytics, profile_data, months_to_generate, previous_notes = self._plan_months(state, completed_notes)
+            self._emit_reused(monthly_analytics, months_to_generate, previous_notes, on_note)
+            templated_notes, months_to_generate = self._template_quiet_months(
+                months_to_generate, profile_data, state.get("activity_level"), on_note
+            )
+            if self.notes_mode == "multi_month":
+                generated_notes = await self._agenerate_monthly_notes_multi(months_to_generate, profile_data, on_note)
+            else:
+                generated_notes = await self._agenerate_monthly_notes(months_to_generate, profile_data, on_note)
+            response = self._build_response(monthly_analytics, templated_notes + generated_notes, previous_notes)
             
         except Exception as e:
-            logger.error("MonthlyAnalysisAgent failed", error=str(e))
-            response = AgentResponse(
-                success=False,
-                data=None,
-                message=f"Monthly analysis failed: {str(e)}",
-                next_agent=None,
-                errors=[str(e)]
+            response = self._build_failure(e)
+        
+        return response
+    
+    def _plan_months(self, state: LAIEState, completed_notes: Optional[Dict[str, MonthlyNote]] = None) -> tuple:
+        """Work out which months need a new note and which can reuse the previous analysis or an earlier attempt."""
+        monthly_analytics = state.get("monthly_analytics", [])
+        profile_data = state.get("raw_profile", {})
+        
+        if not monthly_analytics:
+            raise ValueError("No monthly analytics data available")
+        
+        # Reuse notes for months that did not change since the previous analysis; fallback notes
+        # from a failed LLM call are always regenerated
+        changed_months = state.get("changed_months")
+        previous_notes = {
+            note["month"]: note
+            for note in (state.get("previous_analysis") or {}).get("monthly_notes") or []
+            if not note.get("fallback")
+        }
+        completed_notes = {month: note for month, note in (completed_notes or {}).items() if not note.get("fallback")}
+        months_to_generate = [
+            month_data for month_data in monthly_analytics
+            if month_data.get("month") not in completed_notes and (
+                changed_months is None
+                or month_data.get("month") in changed_months
+                or month_data.get("month") not in previous_notes
             )
+        ]
+        
+        return monthly_analytics, profile_data, months_to_generate, {**previous_notes, **completed_notes}
+    
+    def _emit_reused(self, monthly_analytics: List[Dict[str, Any]], months_to_generate: List[Dict[str, Any]],
+                     previous_notes: Dict[str, MonthlyNote],
+                     on_note: Optional[Callable[[MonthlyNote, bool], None]]):
+        """Hand reused notes to on_note up front; they need no LLM call."""
+        if not on_note:
+            return
+        pending = {month_data.get("month") for month_data in months_to_generate}
+        for month_data in monthly_analytics:
+            if month_data.get("month") not in pending:
+                on_note(previous_notes[month_data.get("month")], True)
+    
+    def _template_quiet_months(self, months_to_generate: List[Dict[str, Any]], profile_data: Dict[str, Any],
+                               activity_level: Optional[str],
+                               on_note: Optional[Callable[[MonthlyNote, bool], None]]) -> tuple:
+        """Write template notes for months too quiet to be worth an LLM call.
+        
+        Returns (templated_notes, months that still need the LLM). In a low-activity profile
+        every month is templated.
+        """
+        profile_name = profile_data.get("full_name", "Professional")
+        templated_notes, llm_months = [], []
+        for month_data in months_to_generate:
+            if activity_level == ActivityLevel.LOW or month_data.get("posts_count", 0) <= self.trivial_month_max_posts:
+                note = self._create_template_note(month_data.get("month", "unknown"), month_data, profile_name)
+                templated_notes.append(note)
+                if on_note:
+                    on_note(note, False)
+            else:
+                llm_months.append(month_data)
+        
+        if templated_notes:
+            logger.info(f"Templated {len(templated_notes)} quiet monthly notes, {len(llm_months)} left for the LLM")
+        return templated_notes, llm_months
+    
+    def _build_response(self, monthly_analytics: List[Dict[str, Any]], generated_notes: List[MonthlyNote],
+                        previous_notes: Dict[str, MonthlyNote]) -> AgentResponse:
+        """Splice generated and reused notes back into month order."""
+        generated_by_month = {note["month"]: note for note in generated_notes}
+        monthly_notes = [
+            generated_by_month.get(month_data.get("month")) or previous_notes[month_data.get("month")]
+            for month_data in monthly_analytics
+        ]
         
+        response = AgentResponse(
+            success=True,
+            data=monthly_notes,
+            message=f"Generated {len(generated_notes)} monthly activity notes ({len(monthly_notes) - len(generated_notes)} reused)",
+            next_agent="summary",
+            errors=[]
+        )
+        
+        self._log_action(f"Generated {len(generated_notes)} of {len(monthly_notes)} monthly analysis notes")
         return response
     
+    def _build_failure(self, error: Exception) -> AgentResponse:
+        """Log a failure and wrap it in an agent response."""
+        logger.error("MonthlyAnalysisAgent failed", error=str(error))
+        return AgentResponse(
+            success=False,
+            data=None,
+            message=f"Monthly analysis failed: {str(error)}",
+            next_agent=None,
+            errors=[str(error)],
+            transient=is_transient_error(error)
+        )
+    
     def _generate_monthly_note(self, month_data: Dict[str, Any], profile_data: Dict[str, Any]) -> MonthlyNote:
         """Generate a comprehensive monthly activity note using AI."""
         month = month_data.get("month", "unknown")
+        profile_name = profile_data.get("full_name", "Professional")
+        prompt = self._build_monthly_prompt(month_data, profile_name)
+        
+        try:
+            structured = self.llm.with_structured_output(MonthlyNoteOutput)
+            output = call_with_retry(
+                lambda: structured.invoke([HumanMessage(content=prompt)]), f"monthly note {month}", self.retry_attempts
+            )
+            structured_note = self._build_note(output, month)
+            
+        except Exception as e:
+            logger.warning(f"AI analysis failed for {month}: {e}")
+            structured_note = self._create_fallback_note(month, month_data, profile_name)
+        
+        return structured_note
+    
+    def _generate_monthly_notes_batch(self, monthly_analytics: List[Dict[str, Any]], profile_data: Dict[str, Any],
+                                      on_note: Optional[Callable[[MonthlyNote, bool], None]] = None,
+                                      attempt: int = 1) -> List[MonthlyNote]:
+        """Generate all monthly notes concurrently, keeping month order and per-month fallbacks.
+        
+        Months whose reply is still unusable after its repairs are asked again together, up to
+        retry_attempts; only those months are sent again. Transient errors were already retried
+        by the gateway, so those months get their fallback note.
+        """
+        profile_name = profile_data.get("full_name", "Professional")
+        prompts = [
+            [HumanMessage(content=self._build_monthly_prompt(month_data, profile_name))]
+            for month_data in monthly_analytics
+        ]
+        
+        # Results arrive in completion order so each note can be streamed as soon as it exists;
+        # exceptions (including replies still invalid after repairs) are returned, not raised
+        monthly_notes = [None] * len(monthly_analytics)
+        retry_indexes = []
+        for index, output in self.llm.with_structured_output(MonthlyNoteOutput).batch_as_completed(
+            prompts, config={"max_concurrency": self.max_concurrency}, return_exceptions=True
+        ):
+            month_data = monthly_analytics[index]
+            month = month_data.get("month", "unknown")
+            if isinstance(output, Exception) and attempt < self.retry_attempts and is_output_error(output):
+                retry_indexes.append(index)
+                continue
+            try:
+                if isinstance(output, Exception):
+                    raise output
+                note = self._build_note(output, month)
+            except Exception as e:
+                logger.warning(f"AI analysis failed for {month}: {e}")
+                note = self._create_fallback_note(month, month_data, profile_name)
+            monthly_notes[index] = note
+            if on_note:
+                on_note(note, False)
+        
+        if retry_indexes:
+            for _ in retry_indexes:
+                telemetry.count_retry()
+            logger.warning(f"Re-requesting {len(retry_indexes)} monthly notes with unusable replies (attempt {attempt}/{self.retry_attempts - 1})")
+            retried = self._generate_monthly_notes_batch(
+                [monthly_analytics[index] for index in retry_indexes], profile_data, on_note, attempt + 1
+            )
+            for index, note in zip(retry_indexes, retried):
+                monthly_notes[index] = note
+        
+        return monthly_notes
+    
+    async def _agenerate_monthly_note(self, month_data: Dict[str, Any], profile_data: Dict[str, Any]) -> MonthlyNote:
+        """Async variant of _generate_monthly_note."""
+        month = month_data.get("month", "unknown")
+        profile_name = profile_data.get("full_name", "Professional")
+        prompt = self._build_monthly_prompt(month_data, profile_name)
+        
+        try:
+            structured = self.llm.with_structured_output(MonthlyNoteOutput)
+            output = await acall_with_retry(
+                lambda: structured.ainvoke([HumanMessage(content=prompt)]), f"monthly note {month}", self.retry_attempts
+            )
+            structured_note = self._build_note(output, month)
+        except Exception as e:
+            logger.warning(f"AI analysis failed for {month}: {e}")
+            structured_note = self._create_fallback_note(month, month_data, profile_name)
+        
+        return structured_note
+    
+    async def _agenerate_monthly_notes(self, monthly_analytics: List[Dict[str, Any]], profile_data: Dict[str, Any],
+                                       on_note: Optional[Callable[[MonthlyNote, bool], None]] = None) -> List[MonthlyNote]:
+        """Generate monthly notes on the event loop, at most max_concurrency in flight, in month order."""
+        semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+        
+        async def generate(month_data: Dict[str, Any]) -> MonthlyNote:
+            async with semaphore:
+                note = await self._agenerate_monthly_note(month_data, profile_data)
+            if on_note:
+                on_note(note, False)
+            return note
+        
+        return list(await asyncio.gather(*(generate(month_data) for month_data in monthly_analytics)))
+    
+    def _generate_monthly_notes_multi(self, monthly_analytics: List[Dict[str, Any]], profile_data: Dict[str, Any],
+                                      on_note: Optional[Callable[[MonthlyNote, bool], None]] = None) -> List[MonthlyNote]:
+        """Generate notes several months per request; months missing or invalid in a reply get per-month calls.
+        
+        A chunk whose request failed transiently (after the gateway's own retries) gets fallback
+        notes instead, since asking again month by month would only multiply the failing calls.
+        """
+        profile_name = profile_data.get("full_name", "Professional")
+        chunks = self._plan_month_chunks(monthly_analytics, profile_name)
+        if not chunks:
+            return []
+        prompts = [[HumanMessage(content=self._build_multi_month_prompt(chunk, profile_name))] for chunk in chunks]
+        
+        generated = {}
+        for index, output in self.llm.with_structured_output(MonthlyNotesOutput).batch_as_completed(
+            prompts, config={"max_concurrency": self.max_concurrency}, return_exceptions=True,
+            max_tokens=self._multi_month_max_tokens(chunks)
+        ):
+            for note in self._collect_multi_month_notes(output, chunks[index], profile_name):
+                generated[note["month"]] = note
+                if on_note:
+                    on_note(note, False)
+        
+        missing = [month_data for month_data in monthly_analytics if month_data.get("month") not in generated]
+        if missing:
+            logger.warning(f"Multi-month notes incomplete, generating {len(missing)} months individually")
+        return [*generated.values(), *self._generate_monthly_notes_batch(missing, profile_data, on_note)]
+    
+    async def _agenerate_monthly_notes_multi(self, monthly_analytics: List[Dict[str, Any]], profile_data: Dict[str, Any],
+                                             on_note: Optional[Callable[[MonthlyNote, bool], None]] = None) -> List[MonthlyNote]:
+        """Async variant of _generate_monthly_notes_multi."""
+        profile_name = profile_data.get("full_name", "Professional")
+        chunks = self._plan_month_chunks(monthly_analytics, profile_name)
+        if not chunks:
+            return []
+        semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+        structured = self.llm.with_structured_output(MonthlyNotesOutput)
+        max_tokens = self._multi_month_max_tokens(chunks)
+        
+        async def generate(chunk: List[Dict[str, Any]]) -> List[MonthlyNote]:
+            prompt = self._build_multi_month_prompt(chunk, profile_name)
+            async with semaphore:
+                try:
+                    output = await structured.ainvoke([HumanMessage(content=prompt)], max_tokens=max_tokens)
+                except Exception as e:
+                    output = e
+            notes = self._collect_multi_month_notes(output, chunk, profile_name)
+            if on_note:
+                for note in notes:
+                    on_note(note, False)
+            return notes
+        
+        generated = {
+            note["month"]: note
+            for notes in await asyncio.gather(*(generate(chunk) for chunk in chunks))
+            for note in notes
+        }
+        missing = [month_data for month_data in monthly_analytics if month_data.get("month") not in generated]
+        if missing:
+            logger.warning(f"Multi-month notes incomplete, generating {len(missing)} months individually")
+        return [*generated.values(), *await self._agenerate_monthly_notes(missing, profile_data, on_note)]
+    
+    def _plan_month_chunks(self, monthly_analytics: List[Dict[str, Any]], profile_name: str) -> List[List[Dict[str, Any]]]:
+        """Split months into requests whose prompt plus expected completion fits batch_token_budget."""
+        header_tokens = count_tokens(self._build_multi_month_prompt([], profile_name))
+        chunks, chunk, used = [], [], header_tokens
+        for month_data in monthly_analytics:
+            cost = count_tokens(self._month_line(month_data)) + MONTHLY_NOTE_COMPLETION_TOKENS
+            if chunk and (used + cost > self.batch_token_budget or len(chunk) >= MONTHLY_BATCH_MAX_MONTHS):
+                chunks.append(chunk)
+                chunk, used = [], header_tokens
+            chunk.append(month_data)
+            used += cost
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+    
+    @staticmethod
+    def _multi_month_max_tokens(chunks: List[List[Dict[str, Any]]]) -> int:
+        # The deployment default (2000) is sized for one note; let the largest chunk finish
+        return max(2000, MONTHLY_NOTE_COMPLETION_TOKENS * max(len(chunk) for chunk in chunks))
+    
+    def _collect_multi_month_notes(self, output: Any, chunk: List[Dict[str, Any]], profile_name: str) -> List[MonthlyNote]:
+        """Validate each returned note on its own; drop failed requests, unknown months and invalid items.
+        
+        A transient failure gives every month of the chunk its fallback note.
+        """
+        if isinstance(output, Exception):
+            logger.warning(f"Multi-month analysis failed for {chunk[0].get('month')}..{chunk[-1].get('month')}: {output}")
+            if is_transient_error(output):
+                return [
+                    self._create_fallback_note(month_data.get("month", "unknown"), month_data, profile_name)
+                    for month_data in chunk
+                ]
+            return []
+        
+        requested = {month_data.get("month") for month_data in chunk}
+        notes = {}
+        for item in output.notes:
+            try:
+                parsed = MonthlyNoteItemOutput.model_validate(item)
+            except ValidationError as e:
+                logger.warning(f"Invalid note for {item.get('month', 'unknown')}: {e.error_count()} validation errors")
+                continue
+            if parsed.month in requested and parsed.month not in notes:
+                notes[parsed.month] = self._build_note(parsed, parsed.month)
+        return list(notes.values())
+    
+    def _month_line(self, month_data: Dict[str, Any]) -> str:
+        return (
+            f"MONTH {month_data.get('month', 'unknown')}: posts {month_data.get('posts_count', 0)}, "
+            f"impressions {month_data.get('total_impressions', 0):,}, likes {month_data.get('total_likes', 0)}, "
+            f"engagement rate {month_data.get('engagement_rate', 0):.1%}, content types {month_data.get('content_types', {})}"
+        )
+    
+    def _build_multi_month_prompt(self, monthly_analytics: List[Dict[str, Any]], profile_name: str) -> str:
+        """Render one prompt covering several months; the instructions are paid for once."""
+        month_lines = "\n".join(self._month_line(month_data) for month_data in monthly_analytics)
+        return f"""As a LinkedIn analytics expert, create a comprehensive monthly activity note for {profile_name} for each month below.
+
+{month_lines}
+
+Reply with a JSON object following the provided schema, with one entry in "notes" per month above (set "month" to
+the month as given): activity summary, key achievements, content performance analysis, engagement highlights,
+recommendations for next month and AI insights.
+
+Keep the analysis professional, data-driven, and actionable. Focus on patterns and opportunities."""
+    
+    def _build_monthly_prompt(self, month_data: Dict[str, Any], profile_name: str) -> str:
+        """Render the monthly analysis prompt for a single month."""
+        month = month_data.get("month", "unknown")
         posts_count = month_data.get("posts_count", 0)
         impressions = month_data.get("total_impressions", 0)
         likes = month_data.get("total_likes", 0)
         engagement_rate = month_data.get("engagement_rate", 0)
         content_types = month_data.get("content_types", {})
         
-        profile_name = profile_data.get("full_name", "Professional")
-        
         # Create AI prompt for monthly analysis
-        prompt = f"""As a LinkedIn analytics expert, create a comprehensive monthly activity note for {profile_name} in {month}.
+        return f"""As a LinkedIn analytics expert, create a comprehensive monthly activity note for {profile_name} in {month}.
         
         KEY METRICS:
 - Posts: {posts_count}
@@ -65,98 +413,22 @@ class MonthlyAnalysisAgent:
 - Engagement Rate: {engagement_rate:.1%}
 - Content Types: {content_types}
 
-Please provide:
-
-1. ACTIVITY SUMMARY: A 2-3 sentence overview of the month's LinkedIn activity
-
-2. KEY ACHIEVEMENTS: 3-4 bullet points highlighting the most important accomplishments or engagement moments
-
-3. CONTENT PERFORMANCE: Analysis of which content types performed best and why
-
-4. ENGAGEMENT HIGHLIGHTS: Notable engagement patterns or viral moments
-
-5. RECOMMENDATIONS: 2-3 actionable suggestions for the next month
-
-6. AI INSIGHTS: Strategic observations about audience behavior and content strategy
+Reply with a JSON object following the provided schema: activity summary, key achievements,
+content performance analysis, engagement highlights, recommendations for next month and AI insights.
 
 Keep the analysis professional, data-driven, and actionable. Focus on patterns and opportunities."""
-        
-        try:
-            response = llm.invoke([HumanMessage(content=prompt)])
-            ai_analysis = response.content
-            
-            # Parse the AI response into structured format
-            structured_note = self._parse_ai_response(ai_analysis, month, month_data)
-            
-        except Exception as e:
-            logger.warning(f"AI analysis failed for {month}: {e}")
-            structured_note = self._create_fallback_note(month, month_data, profile_name)
-        
-        return structured_note
     
-    def _parse_ai_response(self, ai_response: str, month: str, month_data: Dict[str, Any]) -> MonthlyNote:
-        """Parse AI response into structured monthly note format."""
-        # Simple parsing logic - in production, use more sophisticated parsing
-        lines = ai_response.split('\n')
-        
-        # Extract sections (simplified)
-        activity_summary = ""
-        key_achievements = []
-        content_performance = {}
-        engagement_highlights = []
-        recommendations = []
-        ai_insights = ""
-        
-        current_section = None
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            if "ACTIVITY SUMMARY" in line.upper() or "1." in line:
-                current_section = "summary"
-                continue
-            elif "KEY ACHIEVEMENTS" in line.upper() or "2." in line:
-                current_section = "achievements"
-                continue
-            elif "CONTENT PERFORMANCE" in line.upper() or "3." in line:
-                current_section = "content"
-                continue
-            elif "ENGAGEMENT HIGHLIGHTS" in line.upper() or "4." in line:
-                current_section = "engagement"
-                continue
-            elif "RECOMMENDATIONS" in line.upper() or "5." in line:
-                current_section = "recommendations"
-                continue
-            elif "AI INSIGHTS" in line.upper() or "6." in line:
-                current_section = "insights"
-                continue
-            
-            # Add content to current section
-            if current_section == "summary":
-                if not activity_summary:
-                    activity_summary = line
-                else:
-                    activity_summary += " " + line
-            elif current_section == "achievements" and line.startswith(("-", "•")):
-                key_achievements.append(line.lstrip("-• "))
-            elif current_section == "content":
-                content_performance["analysis"] = content_performance.get("analysis", "") + line + " "
-            elif current_section == "engagement" and line.startswith(("-", "•")):
-                engagement_highlights.append(line.lstrip("-• "))
-            elif current_section == "recommendations" and line.startswith(("-", "•")):
-                recommendations.append(line.lstrip("-• "))
-            elif current_section == "insights":
-                ai_insights += line + " "
-        
+    def _build_note(self, output: MonthlyNoteOutput, month: str) -> MonthlyNote:
+        """Turn a validated structured-output reply into a MonthlyNote."""
         return MonthlyNote(
             month=month,
-            activity_summary=activity_summary.strip(),
-            key_achievements=key_achievements[:4],  # Limit to 4
-            content_performance=content_performance,
-            engagement_highlights=engagement_highlights[:3],  # Limit to 3
-            recommendations=recommendations[:3],  # Limit to 3
-            ai_insights=ai_insights.strip()
+            activity_summary=output.activity_summary.strip(),
+            key_achievements=output.key_achievements[:4],  # Limit to 4
+            content_performance=output.content_performance,
+            engagement_highlights=output.engagement_highlights[:3],  # Limit to 3
+            recommendations=output.recommendations[:3],  # Limit to 3
+            ai_insights=output.ai_insights.strip(),
+            fallback=False
         )
     
     def _create_fallback_note(self, month: str, month_data: Dict[str, Any], profile_name: str) -> MonthlyNote:
@@ -168,13 +440,52 @@ Keep the analysis professional, data-driven, and actionable. Focus on patterns a
             content_performance={"analysis": f"Primary content type: {max(month_data.get('content_types', {}), key=month_data.get('content_types', {}).get, default='text')}"},
             engagement_highlights=[f"{month_data.get('total_likes', 0)} total likes received"],
             recommendations=["Continue current content strategy", "Experiment with different posting times"],
-            ai_insights="Analysis generated with limited data. Consider providing more detailed metrics for deeper insights."
+            ai_insights="Analysis generated with limited data. Consider providing more detailed metrics for deeper insights.",
+            fallback=True
+        )
+    
+    def _create_template_note(self, month: str, month_data: Dict[str, Any], profile_name: str) -> MonthlyNote:
+        """Deterministic note for a quiet month, worded from its own metrics; no LLM call."""
+        posts_count = month_data.get("posts_count", 0)
+        if posts_count == 0:
+            return MonthlyNote(
+                month=month,
+                activity_summary=f"{profile_name} did not publish on LinkedIn in {month}.",
+                key_achievements=[],
+                content_performance={"analysis": "No posts this month"},
+                engagement_highlights=[],
+                recommendations=["Publish at least one post to stay visible to your network"],
+                ai_insights="Templated note: there was no activity to analyze this month.",
+                fallback=False
+            )
+        
+        impressions = month_data.get("total_impressions", 0)
+        engagement_rate = month_data.get("engagement_rate", 0)
+        content_types = month_data.get("content_types") or {}
+        main_type = max(content_types, key=content_types.get, default="text")
+        posts = "post" if posts_count == 1 else "posts"
+        
+        if engagement_rate >= 0.05:
+            format_tip = f"Your {main_type} content resonated; publish more in this format"
+        else:
+            format_tip = f"Try a format other than {main_type} to lift engagement"
+        
+        return MonthlyNote(
+            month=month,
+            activity_summary=f"{profile_name} published {posts_count} {posts} in {month} ({main_type}), reaching {impressions:,} impressions.",
+            key_achievements=[f"{engagement_rate:.1%} engagement rate on {posts_count} {posts}"],
+            content_performance={"analysis": f"Primary content type: {main_type}", "content_types": content_types},
+            engagement_highlights=[f"{month_data.get('total_likes', 0):,} total likes received"],
+            recommendations=[format_tip, "Post at least weekly so your content keeps reaching your network"],
+            ai_insights=f"Templated note: {posts_count} {posts} this month is too little activity for AI analysis.",
+            fallback=False
         )
     
     def _log_action(self, action: str):
         """Log agent actions."""
         timestamp = datetime.utcnow().isoformat()
         self.audit_log.append({"timestamp": timestamp, "action": action, "agent": "monthly_analysis"})
+        logger.info("agent_action", agent="monthly_analysis", action=action)
         print(f"MonthlyAnalysisAgent: {action}")
 
 # Initialize monthly analysis agent
@@ -182,5 +493,9 @@ monthly_analysis_agent = MonthlyAnalysisAgent()
 
 print(" MonthlyAnalysisAgent ready")
 print("   → AI-powered monthly activity notes")
-print("   → Structured analysis format")
+print(f"   → Concurrent note generation (max_concurrency={monthly_analysis_agent.max_concurrency})")
+print("   → JSON-schema structured output with repair retries")
+print(f"   → Notes mode: {monthly_analysis_agent.notes_mode} (multi_month packs months into budgeted requests)")
 print("   → Fallback handling for API failures")
+print(f"   → Templated notes for months with at most {monthly_analysis_agent.trivial_month_max_posts} post(s), no LLM call")
+print("   → Notes streamed as they complete")
@@ -1,36 +1,387 @@
+# Durable checkpoints for laie_graph runs
+class SqliteCheckpointSaver(BaseCheckpointSaver):
+    """LangGraph checkpointer backed by a local SQLite file.
+    
+    Channel values are stored once per channel version (zlib-compressed), so a checkpoint
+    only adds blobs for the channels its step changed rather than a copy of the whole
+    LAIEState. Alongside the checkpoints it keeps a runs table (which run belongs to which
+    profile and whether it finished) and the monthly notes each run has completed so far,
+    so a resumed monthly_analysis only generates the months that are still missing.
+    
+    Only a profile's latest run can be resumed, so starting a run deletes that profile's
+    earlier unfinished ones; runs older than max_age_seconds are deleted as well.
+    """
+    
+    def __init__(self, path: Path, max_age_seconds: int = CHECKPOINT_MAX_AGE_SECONDS):
+        super().__init__()
+        self.path = Path(path)
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """CREATE TABLE IF NOT EXISTS checkpoints (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL,
+                checkpoint_id TEXT NOT NULL,
+                parent_checkpoint_id TEXT,
+                checkpoint_type TEXT NOT NULL,
+                checkpoint BLOB NOT NULL,
+                metadata_type TEXT NOT NULL,
+                metadata BLOB NOT NULL,
+                PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+            );
+            CREATE TABLE IF NOT EXISTS blobs (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL,
+                channel TEXT NOT NULL,
+                version TEXT NOT NULL,
+                value_type TEXT NOT NULL,
+                value BLOB,
+                PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+            );
+            CREATE TABLE IF NOT EXISTS writes (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL,
+                checkpoint_id TEXT NOT NULL,
+                task_id TEXT NOT NULL,
+                idx INTEGER NOT NULL,
+                channel TEXT NOT NULL,
+                value_type TEXT NOT NULL,
+                value BLOB,
+                task_path TEXT NOT NULL,
+                PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+            );
+            CREATE TABLE IF NOT EXISTS runs (
+                thread_id TEXT PRIMARY KEY,
+                public_id TEXT NOT NULL,
+                status TEXT NOT NULL,
+                started_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_runs_public_id ON runs(public_id, started_at);
+            CREATE TABLE IF NOT EXISTS run_notes (
+                thread_id TEXT NOT NULL,
+                month TEXT NOT NULL,
+                note TEXT NOT NULL,
+                PRIMARY KEY (thread_id, month)
+            );"""
+        )
+        self._conn.commit()
+    
+    def _dumps(self, value: Any) -> tuple:
+        value_type, data = self.serde.dumps_typed(value)
+        return value_type, zlib.compress(data, 1)
+    
+    def _loads(self, value_type: str, data: bytes) -> Any:
+        return self.serde.loads_typed((value_type, zlib.decompress(data)))
+    
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = get_checkpoint_id(config)
+        query = "SELECT checkpoint_id, parent_checkpoint_id, checkpoint_type, checkpoint, metadata_type, metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?"
+        params = [thread_id, checkpoint_ns]
+        if checkpoint_id:
+            query += " AND checkpoint_id = ?"
+            params.append(checkpoint_id)
+        with self._lock:
+            row = self._conn.execute(query + " ORDER BY checkpoint_id DESC LIMIT 1", params).fetchone()
+        return self._to_tuple(thread_id, checkpoint_ns, row) if row else None
+    
+    def list(self, config: Optional[RunnableConfig], *, filter: Optional[Dict[str, Any]] = None,
+             before: Optional[RunnableConfig] = None, limit: Optional[int] = None) -> Iterator[CheckpointTuple]:
+        query = "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, checkpoint_type, checkpoint, metadata_type, metadata FROM checkpoints WHERE 1 = 1"
+        params = []
+        if config:
+            query += " AND thread_id = ?"
+            params.append(config["configurable"]["thread_id"])
+            if config["configurable"].get("checkpoint_ns") is not None:
+                query += " AND checkpoint_ns = ?"
+                params.append(config["configurable"]["checkpoint_ns"])
+            if get_checkpoint_id(config):
+                query += " AND checkpoint_id = ?"
+                params.append(get_checkpoint_id(config))
+        if before and get_checkpoint_id(before):
+            query += " AND checkpoint_id < ?"
+            params.append(get_checkpoint_id(before))
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY checkpoint_id DESC", params).fetchall()
+        
+        for thread_id, checkpoint_ns, *row in rows:
+            if limit is not None and limit <= 0:
+                break
+            checkpoint_tuple = self._to_tuple(thread_id, checkpoint_ns, row)
+            if filter and any(checkpoint_tuple.metadata.get(key) != value for key, value in filter.items()):
+                continue
+            if limit is not None:
+                limit -= 1
+            yield checkpoint_tuple
+    
+    def put(self, config: RunnableConfig, checkpoint: Checkpoint, metadata: CheckpointMetadata,
+            new_versions: ChannelVersions) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint = checkpoint.copy()
+        values = checkpoint.pop("channel_values")
+        
+        # Only channels written in this step get a new blob; the rest are shared with earlier checkpoints
+        blobs = [
+            (thread_id, checkpoint_ns, channel, str(version),
+             *(self._dumps(values[channel]) if channel in values else ("empty", None)))
+            for channel, version in new_versions.items()
+        ]
+        checkpoint_type, checkpoint_blob = self._dumps(checkpoint)
+        metadata_type, metadata_blob = self._dumps(get_checkpoint_metadata(config, metadata))
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?, ?)", blobs)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (thread_id, checkpoint_ns, checkpoint["id"], config["configurable"].get("checkpoint_id"),
+                 checkpoint_type, checkpoint_blob, metadata_type, metadata_blob)
+            )
+            self._conn.commit()
+        
+        return {"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": checkpoint["id"]}}
+    
+    def put_writes(self, config: RunnableConfig, writes: List[tuple], task_id: str, task_path: str = ""):
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        rows = [
+            (thread_id, checkpoint_ns, checkpoint_id, task_id, WRITES_IDX_MAP.get(channel, idx), channel,
+             *self._dumps(value), task_path)
+            for idx, (channel, value) in enumerate(writes)
+        ]
+        # Special writes (errors, interrupts; negative idx) replace earlier ones, regular writes keep the first attempt's
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", [row for row in rows if row[4] < 0])
+            self._conn.executemany("INSERT OR IGNORE INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", [row for row in rows if row[4] >= 0])
+            self._conn.commit()
+    
+    def delete_thread(self, thread_id: str):
+        with self._lock:
+            for table in ("checkpoints", "blobs", "writes", "run_notes"):
+                self._conn.execute(f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+            self._conn.commit()
+    
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return self.get_tuple(config)
+    
+    async def alist(self, config: Optional[RunnableConfig], *, filter: Optional[Dict[str, Any]] = None,
+                    before: Optional[RunnableConfig] = None, limit: Optional[int] = None) -> AsyncIterator[CheckpointTuple]:
+        for checkpoint_tuple in self.list(config, filter=filter, before=before, limit=limit):
+            yield checkpoint_tuple
+    
+    async def aput(self, config: RunnableConfig, checkpoint: Checkpoint, metadata: CheckpointMetadata,
+                   new_versions: ChannelVersions) -> RunnableConfig:
+        return self.put(config, checkpoint, metadata, new_versions)
+    
+    async def aput_writes(self, config: RunnableConfig, writes: List[tuple], task_id: str, task_path: str = ""):
+        self.put_writes(config, writes, task_id, task_path)
+    
+    async def adelete_thread(self, thread_id: str):
+        self.delete_thread(thread_id)
+    
+    def get_next_version(self, current: Optional[str], channel: None = None) -> str:
+        # Random suffix keeps versions unique when a run is resumed from an earlier checkpoint
+        current_version = int(str(current).split(".")[0]) if current is not None else 0
+        return f"{current_version + 1:032}.{random.random():016}"
+    
+    def _to_tuple(self, thread_id: str, checkpoint_ns: str, row: tuple) -> CheckpointTuple:
+        checkpoint_id, parent_checkpoint_id, checkpoint_type, checkpoint_blob, metadata_type, metadata_blob = row
+        checkpoint = self._loads(checkpoint_type, checkpoint_blob)
+        with self._lock:
+            blob_rows = [
+                self._conn.execute(
+                    "SELECT value_type, value FROM blobs WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ? AND version = ?",
+                    (thread_id, checkpoint_ns, channel, str(version))
+                ).fetchone()
+                for channel, version in checkpoint["channel_versions"].items()
+            ]
+            write_rows = self._conn.execute(
+                "SELECT task_id, idx, channel, value_type, value, task_path FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                (thread_id, checkpoint_ns, checkpoint_id)
+            ).fetchall()
+        
+        checkpoint["channel_values"] = {
+            channel: self._loads(blob[0], blob[1])
+            for channel, blob in zip(checkpoint["channel_versions"], blob_rows)
+            if blob is not None and blob[0] != "empty"
+        }
+        write_rows.sort(key=lambda write: writes_sort_key(write[5], write[0], write[1]))
+        return CheckpointTuple(
+            config={"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": checkpoint_id}},
+            checkpoint=checkpoint,
+            metadata=self._loads(metadata_type, metadata_blob),
+            parent_config=(
+                {"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": parent_checkpoint_id}}
+                if parent_checkpoint_id else None
+            ),
+            pending_writes=[(task_id, channel, self._loads(value_type, value)) for task_id, _, channel, value_type, value, _ in write_rows]
+        )
+    
+    def start_run(self, thread_id: str, public_id: str):
+        self.prune_runs(public_id)
+        now = datetime.utcnow().isoformat()
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?)", (thread_id, public_id, "running", now, now))
+            self._conn.commit()
+    
+    def prune_runs(self, public_id: Optional[str] = None):
+        """Delete public_id's runs that can no longer be resumed (all but a new latest one) and every expired run."""
+        cutoff = (datetime.utcnow() - timedelta(seconds=self.max_age_seconds)).isoformat()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT thread_id FROM runs WHERE public_id = ? OR updated_at < ?", (public_id, cutoff)
+            ).fetchall()
+        for (thread_id,) in rows:
+            self.delete_thread(thread_id)
+        with self._lock:
+            self._conn.executemany("DELETE FROM runs WHERE thread_id = ?", rows)
+            self._conn.commit()
+    
+    def finish_run(self, thread_id: str, success: bool):
+        """Mark a run finished; a successful run no longer needs its checkpoints."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE runs SET status = ?, updated_at = ? WHERE thread_id = ?",
+                ("completed" if success else "failed", datetime.utcnow().isoformat(), thread_id)
+            )
+            self._conn.commit()
+        if success:
+            self.delete_thread(thread_id)
+    
+    def resumable_run(self, public_id: str) -> Optional[str]:
+        """Thread id of public_id's latest run if it failed or was interrupted (and has not expired)."""
+        self.prune_runs()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT thread_id, status FROM runs WHERE public_id = ? ORDER BY started_at DESC LIMIT 1", (public_id,)
+            ).fetchone()
+        return row[0] if row and row[1] != "completed" else None
+    
+    def save_note(self, thread_id: str, note: MonthlyNote):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO run_notes VALUES (?, ?, ?)", (thread_id, note["month"], json.dumps(note, default=str))
+            )
+            self._conn.commit()
+    
+    def load_notes(self, thread_id: str) -> Dict[str, MonthlyNote]:
+        """Monthly notes this run already generated, by month."""
+        with self._lock:
+            rows = self._conn.execute("SELECT month, note FROM run_notes WHERE thread_id = ?", (thread_id,)).fetchall()
+        return {month: json.loads(note) for month, note in rows}
+
+
+laie_checkpointer = SqliteCheckpointSaver(CHECKPOINT_PATH) if CHECKPOINT_ENABLED else None
+
+
 # Define the LangGraph workflow
+def _span_fields(span: Dict[str, Any]) -> Dict[str, Any]:
+    """Timing and LLM usage of a node span, for its audit_trail entry."""
+    return {key: span[key] for key in ("duration_ms", *Telemetry.ROLLUP_KEYS)}
+
+
+class TransientNodeError(RuntimeError):
+    """A node failed with a transient error while it still has retries left; its RetryPolicy re-runs it."""
+
+
+def _node_attempt() -> int:
+    """1-based attempt number of the running node (1 outside a graph run)."""
+    try:
+        return get_runtime().execution_info.node_attempt
+    except Exception:
+        return 1
+
+
+def _raise_if_transient(node: str, response: AgentResponse):
+    """Turn a transient agent failure into TransientNodeError unless this is the node's last attempt.
+    
+    The last attempt keeps the failure as a regular error, so the run ends in error_handler.
+    """
+    if not response["success"] and response.get("transient") and _node_attempt() < NODE_RETRY_MAX_ATTEMPTS:
+        raise TransientNodeError(f"{node}: {response['message']}")
+
+
+def _retry_fields(state: LAIEState) -> Dict[str, Any]:
+    """retry_count for the state update: node re-runs so far in this run."""
+    return {"retry_count": (state.get("retry_count") or 0) + _node_attempt() - 1}
+
+
+def _should_retry_node(error: Exception) -> bool:
+    """RetryPolicy.retry_on: only transient failures re-run a node; each re-run is counted."""
+    if not isinstance(error, TransientNodeError):
+        return False
+    telemetry.count_retry()
+    logger.warning(f"Re-running graph node after transient failure (attempt {_node_attempt()}/{NODE_RETRY_MAX_ATTEMPTS}): {error}")
+    return True
+
+
+# Transient failures re-run just the failed node (data errors go straight to error_handler);
+# notes checkpointed by the failed attempt are reused, so only unfinished months are regenerated
+node_retry_policy = RetryPolicy(
+    initial_interval=RETRY_INITIAL_SECONDS,
+    backoff_factor=2.0,
+    max_interval=RETRY_MAX_SECONDS,
+    max_attempts=NODE_RETRY_MAX_ATTEMPTS,
+    jitter=True,
+    retry_on=_should_retry_node
+)
+
+
 def ingestion_node(state: LAIEState) -> LAIEState:
     """Ingestion agent node."""
-    response = ingestion_agent.process(state)
-    
+    with telemetry.span("node.ingestion", public_id=state["public_id"]) as span:
+        response = ingestion_agent.process(state)
+    _raise_if_transient("ingestion", response)
+    return {**_apply_ingestion_response(state, response, span), **_retry_fields(state)}
+
+
+async def aingestion_node(state: LAIEState) -> LAIEState:
+    """Ingestion agent node (async)."""
+    with telemetry.span("node.ingestion", public_id=state["public_id"]) as span:
+        response = await ingestion_agent.aprocess(state)
+    _raise_if_transient("ingestion", response)
+    return {**_apply_ingestion_response(state, response, span), **_retry_fields(state)}
+
+
+def _apply_ingestion_response(state: LAIEState, response: AgentResponse, span: Dict[str, Any]) -> LAIEState:
+    """State update (delta only) for the ingestion agent response."""
     if response["success"]:
         data = response["data"]
+        # Posts go to post_store; state keeps only the handle
+        posts_ref = state.get("posts_ref") or post_store.new_handle(state["public_id"])
+        post_store.put(posts_ref, data["posts"])
         return {
-            **state,
             "raw_profile": data["profile"],
-            "raw_posts": data["posts"],
+            "posts_ref": posts_ref,
             "data_quality_score": data["quality_score"],
+            "activity_level": ActivityLevel.for_posts(len(data["posts"])).value,
             "current_agent": "analytics",
             "next_agent": response["next_agent"],
-            "messages": state["messages"] + [AIMessage(content=response["message"])],
-            "audit_trail": state["audit_trail"] + [{
+            "messages": [AIMessage(content=response["message"])],
+            "audit_trail": [{
                 "agent": "ingestion",
                 "action": "data_collection",
                 "timestamp": datetime.utcnow().isoformat(),
-                "success": True
+                "success": True,
+                **_span_fields(span)
             }]
         }
     else:
         return {
-            **state,
-            "errors": state["errors"] + response["errors"],
-            "messages": state["messages"] + [AIMessage(content=f"Ingestion failed: {response['message']}")],
-            "audit_trail": state["audit_trail"] + [{
+            "errors": response["errors"],
+            "messages": [AIMessage(content=f"Ingestion failed: {response['message']}")],
+            "audit_trail": [{
                 "agent": "ingestion",
                 "action": "data_collection",
                 "timestamp": datetime.utcnow().isoformat(),
                 "success": False,
-                "error": response["message"]
+                "error": response["message"],
+                **_span_fields(span)
             }]
         }
 
@@ -38,70 +389,139 @@ def ingestion_node(state: LAIEState) -> LAIEState:
 
 def analytics_node(state: LAIEState) -> LAIEState:
     """Analytics agent node."""
-    response = analytics_agent.process(state)
-    
+    with telemetry.span("node.analytics", public_id=state["public_id"]) as span:
+        response = analytics_agent.process(state)
+    _raise_if_transient("analytics", response)
+    return {**_apply_analytics_response(state, response, span), **_retry_fields(state)}
+
+
+async def aanalytics_node(state: LAIEState) -> LAIEState:
+    """Analytics agent node (async)."""
+    with telemetry.span("node.analytics", public_id=state["public_id"]) as span:
+        response = await analytics_agent.aprocess(state)
+    _raise_if_transient("analytics", response)
+    return {**_apply_analytics_response(state, response, span), **_retry_fields(state)}
+
+
+def _apply_analytics_response(state: LAIEState, response: AgentResponse, span: Dict[str, Any]) -> LAIEState:
+    """State update (delta only) for the analytics agent response."""
     if response["success"]:
         data = response["data"]
         return {
-            **state,
             "monthly_analytics": data["monthly_analytics"],
             "content_performance": data["content_performance"],
             "temporal_patterns": data["temporal_patterns"],
+            "month_fingerprints": data["month_fingerprints"],
+            "changed_months": data["changed_months"],
+            "period_metrics": data["period_metrics"],
             "current_agent": "monthly_analysis",
             "next_agent": response["next_agent"],
-            "messages": state["messages"] + [AIMessage(content=response["message"])],
-            "audit_trail": state["audit_trail"] + [{
+            "messages": [AIMessage(content=response["message"])],
+            "audit_trail": [{
                 "agent": "analytics",
                 "action": "analytics_computation",
                 "timestamp": datetime.utcnow().isoformat(),
-                "success": True
+                "success": True,
+                **_span_fields(span)
             }]
         }
     else:
         return {
-            **state,
-            "errors": state["errors"] + response["errors"],
-            "messages": state["messages"] + [AIMessage(content=f"Analytics failed: {response['message']}")],
-            "audit_trail": state["audit_trail"] + [{
+            "errors": response["errors"],
+            "messages": [AIMessage(content=f"Analytics failed: {response['message']}")],
+            "audit_trail": [{
                 "agent": "analytics",
                 "action": "analytics_computation",
                 "timestamp": datetime.utcnow().isoformat(),
                 "success": False,
-                "error": response["message"]
+                "error": response["message"],
+                **_span_fields(span)
             }]
         }
 
 
 
+def _stream_writer() -> Callable[[Any], None]:
+    """LangGraph's custom stream writer, or a no-op when the graph is not being streamed."""
+    try:
+        return get_stream_writer()
+    except Exception:
+        return lambda chunk: None
+
+
+def _start_monthly_stream(state: LAIEState) -> tuple:
+    """Emit the report skeleton and return (skeleton, on_note, completed_notes) for streaming monthly notes.
+    
+    In a checkpointed run each generated note is saved as it arrives, and notes saved by an
+    earlier attempt of the same run come back as completed_notes so they are not regenerated.
+    """
+    writer = _stream_writer()
+    run_id = state.get("run_id") if laie_checkpointer else None
+    completed_notes = laie_checkpointer.load_notes(run_id) if run_id else {}
+    report_skeleton = summary_agent.build_report_skeleton(
+        state.get("raw_profile") or {}, state.get("monthly_analytics") or []
+    )
+    writer({"event": "report_skeleton", "report": report_skeleton})
+    
+    total = len(state.get("monthly_analytics") or [])
+    emitted = []
+    
+    def on_note(note: MonthlyNote, reused: bool):
+        if run_id and not reused:
+            laie_checkpointer.save_note(run_id, note)
+        emitted.append(note["month"])
+        writer({"event": "monthly_note", "note": note, "reused": reused, "completed": len(emitted), "total": total})
+    
+    return report_skeleton, on_note, completed_notes
+
+
 def monthly_analysis_node(state: LAIEState) -> LAIEState:
     """Monthly analysis agent node."""
-    response = monthly_analysis_agent.process(state)
-    
+    with telemetry.span("node.monthly_analysis", public_id=state["public_id"]) as span:
+        report_skeleton, on_note, completed_notes = _start_monthly_stream(state)
+        response = monthly_analysis_agent.process(state, on_note=on_note, completed_notes=completed_notes)
+    _raise_if_transient("monthly_analysis", response)
+    return {**_apply_monthly_analysis_response(state, response, span, report_skeleton), **_retry_fields(state)}
+
+
+async def amonthly_analysis_node(state: LAIEState) -> LAIEState:
+    """Monthly analysis agent node (async)."""
+    with telemetry.span("node.monthly_analysis", public_id=state["public_id"]) as span:
+        report_skeleton, on_note, completed_notes = _start_monthly_stream(state)
+        response = await monthly_analysis_agent.aprocess(state, on_note=on_note, completed_notes=completed_notes)
+    _raise_if_transient("monthly_analysis", response)
+    return {**_apply_monthly_analysis_response(state, response, span, report_skeleton), **_retry_fields(state)}
+
+
+def _apply_monthly_analysis_response(state: LAIEState, response: AgentResponse, span: Dict[str, Any],
+                                     report_skeleton: Optional[Dict[str, Any]] = None) -> LAIEState:
+    """State update (delta only) for the monthly analysis agent response."""
     if response["success"]:
         return {
-            **state,
+            "report_skeleton": report_skeleton,
             "monthly_notes": response["data"],
             "current_agent": "summary",
             "next_agent": response["next_agent"],
-            "messages": state["messages"] + [AIMessage(content=response["message"])],
-            "audit_trail": state["audit_trail"] + [{
+            "messages": [AIMessage(content=response["message"])],
+            "audit_trail": [{
                 "agent": "monthly_analysis",
                 "action": "monthly_notes_generation",
                 "timestamp": datetime.utcnow().isoformat(),
-                "success": True
+                "success": True,
+                **_span_fields(span)
             }]
         }
     else:
         return {
-            **state,
-            "errors": state["errors"] + response["errors"],
-            "messages": state["messages"] + [AIMessage(content=f"Monthly analysis failed: {response['message']}")],
-            "audit_trail": state["audit_trail"] + [{
+            "errors": response["errors"],
+            "messages": [AIMessage(content=f"Monthly analysis failed: {response['message']}")],
+            "audit_trail": [{
                 "agent": "monthly_analysis",
                 "action": "monthly_notes_generation",
                 "timestamp": datetime.utcnow().isoformat(),
                 "success": False,
-                "error": response["message"]
+                "error": response["message"],
+                **_span_fields(span)
             }]
         }
 
@@ -110,44 +530,62 @@ def monthly_analysis_node(state: LAIEState) -> LAIEState:
 
 def summary_node(state: LAIEState) -> LAIEState:
     """Summary agent node."""
-    response = summary_agent.process(state)
-    
+    with telemetry.span("node.summary", public_id=state["public_id"]) as span:
+        response = summary_agent.process(state)
+    _raise_if_transient("summary", response)
+    return {**_apply_summary_response(state, response, span), **_retry_fields(state)}
+
+
+async def asummary_node(state: LAIEState) -> LAIEState:
+    """Summary agent node (async)."""
+    with telemetry.span("node.summary", public_id=state["public_id"]) as span:
+        response = await summary_agent.aprocess(state)
+    _raise_if_transient("summary", response)
+    return {**_apply_summary_response(state, response, span), **_retry_fields(state)}
+
+
+def _apply_summary_response(state: LAIEState, response: AgentResponse, span: Dict[str, Any]) -> LAIEState:
+    """State update (delta only) for the summary agent response."""
     if response["success"]:
         data = response["data"]
         return {
-            **state,
             "executive_summary": data["executive_summary"],
             "recommendations": data["recommendations"],
+            "narrative_fallback": data["narrative_fallback"],
             "final_report": data["final_report"],
             "current_agent": "complete",
             "next_agent": None,
-            "messages": state["messages"] + [AIMessage(content=response["message"])],
-            "audit_trail": state["audit_trail"] + [{
+            "messages": [AIMessage(content=response["message"])],
+            "audit_trail": [{
                 "agent": "summary",
                 "action": "final_report_generation",
                 "timestamp": datetime.utcnow().isoformat(),
-                "success": True
+                "success": True,
+                **_span_fields(span)
             }]
         }
     else:
         return {
-            **state,
-            "errors": state["errors"] + response["errors"],
-            "messages": state["messages"] + [AIMessage(content=f"Summary failed: {response['message']}")],
-            "audit_trail": state["audit_trail"] + [{
+            "errors": response["errors"],
+            "messages": [AIMessage(content=f"Summary failed: {response['message']}")],
+            "audit_trail": [{
                 "agent": "summary",
                 "action": "final_report_generation",
                 "timestamp": datetime.utcnow().isoformat(),
                 "success": False,
-                "error": response["message"]
+                "error": response["message"],
+                **_span_fields(span)
             }]
         }
 
 
 
 def route_based_on_success(state: LAIEState) -> str:
-    """Route to next agent or handle errors."""
-    if state["errors"] and len(state["errors"]) > 0 and state["retry_count"] >= 3:
+    """Route to next agent or handle errors.
+    
+    Transient failures were already retried by the node's RetryPolicy, so any error here is final.
+    """
+    if state.get("errors"):
         return "error_handler"
     
     next_agent = state.get("next_agent")
@@ -161,6 +599,13 @@ def route_based_on_success(state: LAIEState) -> str:
         return "end"
 
 
+def route_after_ingestion(state: LAIEState) -> str:
+    """Route by activity level: profiles without posts skip analytics and monthly notes."""
+    if not state.get("errors") and state.get("activity_level") == ActivityLevel.EMPTY:
+        return "summary"
+    return route_based_on_success(state)
+
+
 def error_handler_node(state: LAIEState) -> LAIEState:
     """Handle errors and create fallback report."""
     logger.error("Workflow failed with errors", errors=state["errors"])
@@ -177,7 +622,6 @@ def error_handler_node(state: LAIEState) -> LAIEState:
     }
     
     return {
-        **state,
         "final_report": fallback_report,
-        "messages": state["messages"] + [AIMessage(content="Workflow completed with errors - see final_report for details")]
+        "messages": [AIMessage(content="Workflow completed with errors - see final_report for details")]
     }
@@ -4,21 +4,29 @@ workflow = StateGraph(LAIEState)
 
 
 
-# Add nodes
-workflow.add_node("ingestion", ingestion_node)
-workflow.add_node("analytics", analytics_node)
-workflow.add_node("monthly_analysis", monthly_analysis_node)
-workflow.add_node("summary", summary_node)
+# Add nodes (sync for laie_graph.invoke, async for laie_graph.ainvoke); transient failures re-run the node
+workflow.add_node("ingestion", RunnableLambda(ingestion_node, afunc=aingestion_node), retry_policy=node_retry_policy)
+workflow.add_node("analytics", RunnableLambda(analytics_node, afunc=aanalytics_node), retry_policy=node_retry_policy)
+workflow.add_node("monthly_analysis", RunnableLambda(monthly_analysis_node, afunc=amonthly_analysis_node), retry_policy=node_retry_policy)
+workflow.add_node("summary", RunnableLambda(summary_node, afunc=asummary_node), retry_policy=node_retry_policy)
 workflow.add_node("error_handler", error_handler_node)
 
 # Add edges
-workflow.add_edge("ingestion", "analytics")
-workflow.add_edge("analytics", "monthly_analysis")
-workflow.add_edge("monthly_analysis", "summary")
-workflow.add_edge("summary", END)
 workflow.add_edge("error_handler", END)
 
-# Add conditional edges
+# Add conditional edges (every agent node routes failures to error_handler)
+workflow.add_conditional_edges(
+    "ingestion",
+    route_after_ingestion,
+    {
+        "analytics": "analytics",
+        "summary": "summary",
+        "error_handler": "error_handler",
+        "end": END
+    }
+)
+
+
 workflow.add_conditional_edges(
     "analytics",
     route_based_on_success,
@@ -41,6 +49,16 @@ workflow.add_conditional_edges(
 )
 
 
+workflow.add_conditional_edges(
+    "summary",
+    route_based_on_success,
+    {
+        "error_handler": "error_handler",
+        "end": END
+    }
+)
+
+
 # Set entry point
 workflow.set_entry_point("ingestion")
 
@@ -53,8 +71,11 @@ laie_graph = workflow.compile()
 
 print("   → 4 agent nodes: ingestion → analytics → monthly_analysis → summary")
 print("   → Conditional routing based on success/failure")
+print("   → Activity routing: profiles without posts go straight to summary")
 print("   → Error handling and recovery")
+print(f"   → Transient node failures retried up to {NODE_RETRY_MAX_ATTEMPTS} attempts with backoff")
 print("   → Complete state management")
+print("   → Async nodes for laie_graph.ainvoke")
 
 from IPython.display import Image, display
 
@@ -1,18 +1,112 @@
+class AnalysisStore:
+    """SQLite store of each profile's last successful analysis, used for incremental re-runs."""
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS analyses (
+                public_id TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )"""
+        )
+        self._conn.commit()
+    
+    def load(self, public_id: str) -> Optional[Dict[str, Any]]:
+        """Return the previous analysis outputs for public_id, trimmed to the months the current window shares.
+        
+        Rolling windows move every day, so rather than requiring the exact window the previous months are
+        kept when both windows cover them in full; partially covered months are recomputed, and the
+        narrative (which names the period) is only reused for an identical window.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM analyses WHERE public_id = ?", (public_id,)).fetchone()
+        if row is None:
+            return None
+        
+        payload = json.loads(row[0])
+        window = [ANALYSIS_START_DATE.isoformat(), ANALYSIS_END_DATE.isoformat()]
+        if payload.get("analysis_window") == window:
+            return payload
+        
+        try:
+            previous_start, previous_end = (datetime.fromisoformat(bound) for bound in payload["analysis_window"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        shared = self._full_months(previous_start, previous_end) & self._full_months(ANALYSIS_START_DATE, ANALYSIS_END_DATE)
+        
+        return {
+            **payload,
+            "month_fingerprints": {
+                month: fingerprint for month, fingerprint in (payload.get("month_fingerprints") or {}).items()
+                if month in shared
+            },
+            "monthly_analytics": [ma for ma in payload.get("monthly_analytics") or [] if ma.get("month") in shared],
+            "monthly_notes": [note for note in payload.get("monthly_notes") or [] if note.get("month") in shared],
+            "executive_summary": None,
+            "recommendations": [],
+            "final_report": None
+        }
+    
+    @staticmethod
+    def _full_months(start: datetime, end: datetime) -> set:
+        """"%Y-%m" labels of the calendar months lying entirely inside [start, end)."""
+        months = set()
+        year, month = start.year, start.month
+        if start != datetime(year, month, 1):
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        while True:
+            next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+            if datetime(next_year, next_month, 1) > end:
+                return months
+            months.add(f"{year:04d}-{month:02d}")
+            year, month = next_year, next_month
+    
+    def save(self, public_id: str, result_state: Dict[str, Any]):
+        """Persist the outputs an incremental re-run needs to splice unchanged months."""
+        payload = {
+            "analysis_window": [ANALYSIS_START_DATE.isoformat(), ANALYSIS_END_DATE.isoformat()],
+            "month_fingerprints": result_state.get("month_fingerprints") or {},
+            "monthly_analytics": result_state.get("monthly_analytics") or [],
+            "monthly_notes": result_state.get("monthly_notes") or [],
+            "executive_summary": result_state.get("executive_summary"),
+            "recommendations": result_state.get("recommendations") or [],
+            "narrative_fallback": bool(result_state.get("narrative_fallback")),
+            "final_report": result_state.get("final_report")
+        }
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analyses (public_id, payload, updated_at) VALUES (?, ?, ?)",
+                (public_id, json.dumps(payload, default=str), datetime.utcnow().isoformat())
+            )
+            self._conn.commit()
+
+
 class MultiAgentLAIESystem:
     """Main orchestrator for the Multi-Agent LAIE system using LangGraph."""
     
     def __init__(self):
-        self.graph = laie_graph
+        # Checkpointed runs get their own compiled graph; laie_graph itself stays checkpoint-free
+        self.checkpointer = laie_checkpointer
+        self.graph = workflow.compile(checkpointer=laie_checkpointer) if laie_checkpointer else laie_graph
+        self.analysis_store = AnalysisStore(ANALYSIS_STORE_PATH)
         self.audit_log = []
+        self.last_batch_stats = None
         logger.info("MultiAgentLAIESystem initialized")
     
-    def run_analysis(self, public_id: str, data_sources: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def run_analysis(self, public_id: str, data_sources: Optional[Dict[str, Any]] = None,
+                     incremental: bool = False, resume: bool = False) -> Dict[str, Any]:
         """
         Run the complete multi-agent LAIE analysis.
         
         Args:
             public_id: LinkedIn public profile identifier
             data_sources: Dictionary of available data sources
+            incremental: Reuse the previous analysis and only recompute changed months
+            resume: Continue public_id's last failed or interrupted run from its last completed node
         
         Returns:
             Complete analysis results
@@ -20,71 +114,398 @@ class MultiAgentLAIESystem:
         # FIX: Remove logger.info with keyword argument
         logger.info(f"Starting multi-agent LAIE analysis for public_id={public_id}")
         
-        # Prepare initial state
-        initial_state = LAIEState(
-            public_id=public_id,
-            data_sources=data_sources or {},
-            messages=[HumanMessage(content=f"Analyze LinkedIn activity for {public_id}")],
-            current_agent="ingestion",
-            errors=[],
-            retry_count=0,
-            audit_trail=[]
-        )
+        # Prepare initial state (None when resuming from a checkpoint)
+        graph_input, config, run_id, refs = self._start_run(public_id, data_sources, incremental, resume)
         
         try:
             # Execute the LangGraph workflow
             print(f"\n Starting Multi-Agent LAIE Analysis for {public_id}")
             print("=" * 60)
             
-            result_state = self.graph.invoke(initial_state)
+            with telemetry.span("analysis", public_id=public_id):
+                result_state = self.graph.invoke(graph_input, config)
+            return self._finish_run(run_id, self._build_result(public_id, result_state))
             
-            # Process results
-            success = len(result_state.get("errors", [])) == 0
-            final_report = result_state.get("final_report")
+        except Exception as e:
+            return self._build_failure(public_id, e)
+        finally:
+            self._release_refs(refs)
+    
+    async def arun_analysis(self, public_id: str, data_sources: Optional[Dict[str, Any]] = None,
+                            incremental: bool = False, resume: bool = False) -> Dict[str, Any]:
+        """
+        Async variant of run_analysis; runs laie_graph.ainvoke on the caller's event loop.
+        
+        Args:
+            public_id: LinkedIn public profile identifier
+            data_sources: Dictionary of available data sources
+            incremental: Reuse the previous analysis and only recompute changed months
+            resume: Continue public_id's last failed or interrupted run from its last completed node
+        
+        Returns:
+            Complete analysis results
+        """
+        logger.info(f"Starting multi-agent LAIE analysis for public_id={public_id} (async)")
+        graph_input, config, run_id, refs = self._start_run(public_id, data_sources, incremental, resume)
+        
+        try:
+            async with proxycurl_client.async_session():
+                with telemetry.span("analysis", public_id=public_id):
+                    result_state = await self.graph.ainvoke(graph_input, config)
+            return self._finish_run(run_id, self._build_result(public_id, result_state))
             
-            result = {
-                "success": success,
-                "public_id": public_id,
-                "analysis_timestamp": datetime.utcnow().isoformat(),
-                "data_quality_score": result_state.get("data_quality_score", 0.0),
-                "agent_workflow": {
-                    "total_agents": 4,
-                    "agents_executed": len(result_state.get("audit_trail", [])),
-                    "final_agent": result_state.get("current_agent", "unknown")
-                },
-                "results": {
-                    "profile": result_state.get("raw_profile"),
-                    "monthly_analytics": result_state.get("monthly_analytics", []),
-                    "monthly_notes": result_state.get("monthly_notes", []),
-                    "executive_summary": result_state.get("executive_summary", ""),
-                    "recommendations": result_state.get("recommendations", []),
-                    "final_report": final_report
-                } if success else None,
-                "errors": result_state.get("errors", []),
-                "audit_trail": result_state.get("audit_trail", []),
-                "agent_messages": [msg.content for msg in result_state.get("messages", [])]
+        except Exception as e:
+            return self._build_failure(public_id, e)
+        finally:
+            self._release_refs(refs)
+    
+    def stream_analysis(self, public_id: str, data_sources: Optional[Dict[str, Any]] = None,
+                        incremental: bool = False, resume: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Run the analysis and yield progress events as they happen.
+        
+        Events are dicts with an "event" key:
+            node_completed   - a graph node finished ("node")
+            report_skeleton  - profile summary, analysis period and aggregate metrics ("report")
+            monthly_note     - one MonthlyNote, as soon as it is generated ("note", "reused", "completed", "total")
+            result           - the same dict run_analysis returns; always the last event
+        """
+        logger.info(f"Streaming multi-agent LAIE analysis for public_id={public_id}")
+        graph_input, config, run_id, refs = self._start_run(public_id, data_sources, incremental, resume)
+        result_state = graph_input or {}
+        
+        try:
+            for mode, chunk in self.graph.stream(graph_input, config, stream_mode=["custom", "updates", "values"]):
+                if mode == "values":
+                    result_state = chunk
+                else:
+                    yield self._stream_event(mode, chunk)
+            result = self._finish_run(run_id, self._build_result(public_id, result_state))
+        except Exception as e:
+            result = self._build_failure(public_id, e)
+        finally:
+            self._release_refs(refs)
+        
+        yield {"event": "result", "result": result}
+    
+    async def astream_analysis(self, public_id: str, data_sources: Optional[Dict[str, Any]] = None,
+                               incremental: bool = False, resume: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Async variant of stream_analysis built on laie_graph.astream."""
+        logger.info(f"Streaming multi-agent LAIE analysis for public_id={public_id} (async)")
+        graph_input, config, run_id, refs = self._start_run(public_id, data_sources, incremental, resume)
+        result_state = graph_input or {}
+        
+        try:
+            async with proxycurl_client.async_session():
+                async for mode, chunk in self.graph.astream(graph_input, config, stream_mode=["custom", "updates", "values"]):
+                    if mode == "values":
+                        result_state = chunk
+                    else:
+                        yield self._stream_event(mode, chunk)
+            result = self._finish_run(run_id, self._build_result(public_id, result_state))
+        except Exception as e:
+            result = self._build_failure(public_id, e)
+        finally:
+            self._release_refs(refs)
+        
+        yield {"event": "result", "result": result}
+    
+    def _stream_event(self, mode: str, chunk: Any) -> Dict[str, Any]:
+        """Normalize a LangGraph stream chunk into a caller-facing event."""
+        if mode == "custom":
+            return chunk
+        return {"event": "node_completed", "node": next(iter(chunk), None)}
+    
+    def _start_run(self, public_id: str, data_sources: Optional[Dict[str, Any]], incremental: bool,
+                   resume: bool) -> tuple:
+        """(graph input, graph config, run_id, (posts_ref, credentials_ref)) for a new run, or for resuming public_id's last unfinished one."""
+        if self.checkpointer is None:
+            initial_state = self._initial_state(public_id, data_sources, incremental)
+            return initial_state, None, None, (initial_state["posts_ref"], initial_state["credentials_ref"])
+        
+        resume_point = self._resume_point(public_id, data_sources) if resume else None
+        if resume_point:
+            return (None, *resume_point)
+        
+        run_id = f"{public_id}:{uuid.uuid4().hex[:12]}"
+        self.checkpointer.start_run(run_id, public_id)
+        initial_state = self._initial_state(public_id, data_sources, incremental, run_id)
+        refs = (initial_state["posts_ref"], initial_state["credentials_ref"])
+        return initial_state, {"configurable": {"thread_id": run_id}}, run_id, refs
+    
+    def _resume_point(self, public_id: str, data_sources: Optional[Dict[str, Any]] = None) -> Optional[tuple]:
+        """(config, run_id, (posts_ref, credentials_ref)) continuing public_id's last failed or interrupted run, or None.
+        
+        Secrets are never checkpointed: ones passed in data_sources are registered under the run's
+        credentials_ref again, and without them a run still waiting on ingestion is not resumable.
+        """
+        run_id = self.checkpointer.resumable_run(public_id)
+        if run_id is None:
+            return None
+        
+        secrets = credential_store.secrets_of(data_sources or {})
+        for snapshot in self.graph.get_state_history({"configurable": {"thread_id": run_id}}):
+            # Newest first: the latest checkpoint with work left, taken before any node failed
+            # (the input checkpoint is skipped: restarting from scratch is not a resume)
+            if not snapshot.next or "__start__" in snapshot.next or any(not entry.get("success", True) for entry in snapshot.values.get("audit_trail") or []):
+                continue
+            # Posts only live in this process's post_store; after a restart, analytics needs ingestion again
+            if "analytics" in snapshot.next and snapshot.values.get("posts_ref") not in post_store:
+                continue
+            credentials_ref = snapshot.values.get("credentials_ref")
+            if credentials_ref and secrets:
+                credential_store.put(credentials_ref, secrets)
+            elif "ingestion" in snapshot.next and credentials_ref and credentials_ref not in credential_store:
+                continue
+            logger.info(f"Resuming run {run_id} at {', '.join(snapshot.next)}")
+            return snapshot.config, run_id, (snapshot.values.get("posts_ref"), credentials_ref)
+        return None
+    
+    @staticmethod
+    def _release_refs(refs: tuple):
+        """Drop a finished run's posts and secrets from their process-local stores."""
+        posts_ref, credentials_ref = refs
+        post_store.release(posts_ref)
+        credential_store.release(credentials_ref)
+    
+    def _finish_run(self, run_id: Optional[str], result: Dict[str, Any]) -> Dict[str, Any]:
+        """Record a checkpointed run's outcome; failed runs stay resumable."""
+        if run_id:
+            self.checkpointer.finish_run(run_id, result["success"])
+            result["run_id"] = run_id
+        return result
+    
+    def _initial_state(self, public_id: str, data_sources: Optional[Dict[str, Any]],
+                       incremental: bool, run_id: Optional[str] = None) -> LAIEState:
+        """Build the initial graph state for one profile."""
+        # Secrets stay in credential_store: graph state, and so every checkpoint, holds only their handle
+        data_sources, credentials_ref = credential_store.split(public_id, data_sources or {})
+        return LAIEState(
+            public_id=public_id,
+            data_sources=data_sources,
+            credentials_ref=credentials_ref,
+            run_id=run_id,
+            posts_ref=post_store.new_handle(public_id),
+            messages=[HumanMessage(content=f"Analyze LinkedIn activity for {public_id}")],
+            current_agent="ingestion",
+            errors=[],
+            retry_count=0,
+            audit_trail=[],
+            previous_analysis=self.analysis_store.load(public_id) if incremental else None
+        )
+    
+    def _build_result(self, public_id: str, result_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn the final graph state into the public result dict."""
+        # Process results
+        success = len(result_state.get("errors", [])) == 0
+        final_report = result_state.get("final_report")
+        
+        result = {
+            "success": success,
+            "public_id": public_id,
+            "analysis_timestamp": datetime.utcnow().isoformat(),
+            "data_quality_score": result_state.get("data_quality_score", 0.0),
+            "agent_workflow": {
+                "total_agents": 4,
+                "agents_executed": len(result_state.get("audit_trail", [])),
+                "final_agent": result_state.get("current_agent", "unknown")
+            },
+            "results": {
+                "profile": result_state.get("raw_profile"),
+                "monthly_analytics": result_state.get("monthly_analytics", []),
+                "period_metrics": result_state.get("period_metrics"),
+                "monthly_notes": result_state.get("monthly_notes", []),
+                "executive_summary": result_state.get("executive_summary", ""),
+                "recommendations": result_state.get("recommendations", []),
+                "final_report": final_report
+            } if success else None,
+            "changed_months": result_state.get("changed_months", []),
+            "errors": result_state.get("errors", []),
+            "audit_trail": result_state.get("audit_trail", []),
+            "agent_messages": [msg.content for msg in result_state.get("messages", [])]
+        }
+        
+        if success:
+            self.analysis_store.save(public_id, result_state)
+            print("\n Multi-Agent Analysis Completed Successfully!")
+            print(f" Data Quality Score: {result['data_quality_score']:.1%}")
+            print(f" Monthly Notes Generated: {len(result['results']['monthly_notes'])}")
+            print(f" Recommendations: {len(result['results']['recommendations'])}")
+        else:
+            print("\n Analysis Completed with Errors")
+            print(f" Errors: {len(result['errors'])}")
+        
+        self._log_completion(success, public_id)
+        return result
+    
+    def _build_failure(self, public_id: str, error: Exception) -> Dict[str, Any]:
+        """Result dict for a run that raised before producing a final state."""
+        logger.error("Multi-agent analysis failed", error=str(error))
+        return {
+            "success": False,
+            "public_id": public_id,
+            "error": str(error),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    
+    def run_batch(self, profiles: Iterable[Union[str, Dict[str, Any]]],
+                  max_concurrency: int = BATCH_MAX_CONCURRENCY,
+                  data_sources: Optional[Dict[str, Any]] = None,
+                  incremental: bool = False,
+                  analytics_workers: int = BATCH_ANALYTICS_WORKERS) -> Iterator[Dict[str, Any]]:
+        """
+        Run analyses for many profiles at once, yielding each result as it finishes.
+        
+        Args:
+            profiles: public_ids, or dicts with "public_id" and optional "data_sources"
+            max_concurrency: Maximum number of profiles in flight
+            data_sources: Default data sources for profiles that do not specify their own
+            incremental: Passed through to run_analysis
+            analytics_workers: Worker processes for the analytics stage (0 = in-process)
+        
+        Yields:
+            run_analysis results, in completion order, tagged with "batch_index"
+        """
+        jobs = self._normalize_batch(profiles, data_sources)
+        stats = self._start_batch_stats(len(jobs), max_concurrency)
+        
+        with self._analytics_pool(analytics_workers), ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = {
+                executor.submit(self._run_batch_item, index, public_id, sources, incremental): index
+                for index, (public_id, sources) in enumerate(jobs)
             }
-            
-            if success:
-                print("\n Multi-Agent Analysis Completed Successfully!")
-                print(f" Data Quality Score: {result['data_quality_score']:.1%}")
-                print(f" Monthly Notes Generated: {len(result['results']['monthly_notes'])}")
-                print(f" Recommendations: {len(result['results']['recommendations'])}")
+            for future in as_completed(futures):
+                result = future.result()
+                self._record_batch_result(stats, result)
+                yield result
+        
+        self._finish_batch_stats(stats)
+    
+    async def arun_batch(self, profiles: Iterable[Union[str, Dict[str, Any]]],
+                         max_concurrency: int = BATCH_MAX_CONCURRENCY,
+                         data_sources: Optional[Dict[str, Any]] = None,
+                         incremental: bool = False,
+                         analytics_workers: int = BATCH_ANALYTICS_WORKERS) -> AsyncIterator[Dict[str, Any]]:
+        """Async variant of run_batch: every profile runs arun_analysis on this event loop."""
+        jobs = self._normalize_batch(profiles, data_sources)
+        stats = self._start_batch_stats(len(jobs), max_concurrency)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run_one(index: int, public_id: str, sources: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._arun_batch_item(index, public_id, sources, incremental)
+        
+        # Profiles share one pooled Proxycurl client, closed once the batch is done
+        async with proxycurl_client.async_session():
+            with self._analytics_pool(analytics_workers):
+                tasks = [asyncio.create_task(run_one(index, public_id, sources)) for index, (public_id, sources) in enumerate(jobs)]
+                for next_done in asyncio.as_completed(tasks):
+                    result = await next_done
+                    self._record_batch_result(stats, result)
+                    yield result
+        
+        self._finish_batch_stats(stats)
+    
+    def _normalize_batch(self, profiles: Iterable[Union[str, Dict[str, Any]]],
+                         data_sources: Optional[Dict[str, Any]]) -> List[tuple]:
+        """Turn batch input into (public_id, data_sources) pairs."""
+        jobs = []
+        for profile in profiles:
+            if isinstance(profile, str):
+                jobs.append((profile, data_sources or {}))
             else:
-                print("\n Analysis Completed with Errors")
-                print(f" Errors: {len(result['errors'])}")
-            
-            self._log_completion(success, public_id)
-            return result
-            
+                jobs.append((profile["public_id"], profile.get("data_sources") or data_sources or {}))
+        return jobs
+    
+    def _run_batch_item(self, index: int, public_id: str, data_sources: Dict[str, Any],
+                        incremental: bool) -> Dict[str, Any]:
+        """Run one profile of a batch; failures are returned, never raised."""
+        started = time.monotonic()
+        try:
+            result = self.run_analysis(public_id, data_sources, incremental=incremental)
         except Exception as e:
-            logger.error("Multi-agent analysis failed", error=str(e))
-            return {
-                "success": False,
-                "public_id": public_id,
-                "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            logger.error("Batch profile failed", public_id=public_id, error=str(e))
+            result = self._build_failure(public_id, e)
+        result["batch_index"] = index
+        result["elapsed_seconds"] = time.monotonic() - started
+        return result
+    
+    async def _arun_batch_item(self, index: int, public_id: str, data_sources: Dict[str, Any],
+                               incremental: bool) -> Dict[str, Any]:
+        """Async variant of _run_batch_item."""
+        started = time.monotonic()
+        try:
+            result = await self.arun_analysis(public_id, data_sources, incremental=incremental)
+        except Exception as e:
+            logger.error("Batch profile failed", public_id=public_id, error=str(e))
+            result = self._build_failure(public_id, e)
+        result["batch_index"] = index
+        result["elapsed_seconds"] = time.monotonic() - started
+        return result
+    
+    @contextmanager
+    def _analytics_pool(self, workers: int):
+        """Attach a process pool to the analytics agent for the duration of a batch."""
+        if workers <= 0 or analytics_agent.process_pool is not None:
+            yield
+            return
+        
+        pool = ProcessPoolExecutor(max_workers=workers)
+        # Start the workers now, before the batch threads exist, so they fork from a quiet process
+        pool.submit(os.getpid).result()
+        analytics_agent.process_pool = pool
+        try:
+            yield
+        finally:
+            analytics_agent.process_pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _start_batch_stats(self, total: int, max_concurrency: int) -> Dict[str, Any]:
+        logger.info(f"Starting batch analysis for {total} profiles (max_concurrency={max_concurrency})")
+        self.last_batch_stats = {
+            "total": total,
+            "completed": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "max_concurrency": max_concurrency,
+            "started_at": datetime.utcnow().isoformat(),
+            "elapsed_seconds": 0.0,
+            "profiles_per_second": 0.0,
+            "llm_calls": 0,
+            "upstream_llm_calls": 0,
+            "upstream_calls_per_profile": 0.0,
+            "_started": time.monotonic()
+        }
+        return self.last_batch_stats
+    
+    def _record_batch_result(self, stats: Dict[str, Any], result: Dict[str, Any]):
+        stats["completed"] += 1
+        stats["succeeded" if result.get("success") else "failed"] += 1
+        stats["elapsed_seconds"] = time.monotonic() - stats["_started"]
+        stats["profiles_per_second"] = stats["completed"] / stats["elapsed_seconds"] if stats["elapsed_seconds"] > 0 else 0.0
+        # Calls served from the response cache or coalesced with an identical in-flight call never reach the API
+        for entry in result.get("audit_trail") or []:
+            stats["llm_calls"] += entry.get("llm_calls", 0)
+            stats["upstream_llm_calls"] += entry.get("llm_calls", 0) - entry.get("cache_hits", 0) - entry.get("coalesced", 0)
+        stats["upstream_calls_per_profile"] = stats["upstream_llm_calls"] / stats["completed"]
+    
+    def _finish_batch_stats(self, stats: Dict[str, Any]):
+        stats.pop("_started", None)
+        logger.info(
+            "Batch analysis completed",
+            total=stats["total"],
+            succeeded=stats["succeeded"],
+            failed=stats["failed"],
+            elapsed_seconds=round(stats["elapsed_seconds"], 2),
+            profiles_per_second=round(stats["profiles_per_second"], 2),
+            upstream_calls_per_profile=round(stats["upstream_calls_per_profile"], 2)
+        )
+        self.audit_log.append({
+            "timestamp": datetime.utcnow().isoformat(),
+            "action": "batch_completed",
+            "status": "success" if stats["failed"] == 0 else "partial",
+            **{k: v for k, v in stats.items() if k != "started_at"}
+        })
     
     def get_workflow_status(self) -> Dict[str, Any]:
         """Get current workflow status and agent states."""
@@ -97,6 +518,10 @@ class MultiAgentLAIESystem:
                 "summary": "ready"
             },
             "langgraph_compiled": True,
+            "stage_latency": telemetry.percentiles(),
+            "llm_deployments": llm_gateway.status(),
+            "llm_single_flight": llm_single_flight.stats() if llm_single_flight else None,
+            "last_batch": {k: v for k, v in (self.last_batch_stats or {}).items() if not k.startswith("_")} or None,
             "last_audit_entries": self.audit_log[-5:] if self.audit_log else []
         }
     
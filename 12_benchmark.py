@@ -0,0 +1,311 @@
+# Benchmark harness: the full pipeline against a local fake LLM and synthetic GDPR exports
+
+_benchmark_llm_lock = threading.Lock()
+
+BENCHMARK_MONTHLY_NOTE = json.dumps({
+    "activity_summary": "Steady publishing month with consistent engagement across formats.",
+    "key_achievements": ["Maintained a regular posting cadence", "Grew average engagement per post"],
+    "content_performance": {"analysis": "Text posts drove most impressions."},
+    "engagement_highlights": ["Comment threads were longer than usual"],
+    "recommendations": ["Post earlier in the week", "Reuse the best-performing format"],
+    "ai_insights": "Momentum is building; keep the cadence."
+})
+
+BENCHMARK_RECOMMENDATIONS = json.dumps({"recommendations": [
+    "Publish two posts per week on Tuesdays and Thursdays",
+    "Lead with the content type that earns the highest average impressions",
+    "Reply to comments within the first hour",
+    "Turn the strongest month's topics into a series",
+    "Add a question to the end of each post"
+]})
+
+BENCHMARK_SUMMARY = (
+    "The profile published consistently through the year, with engagement concentrated in "
+    "a few strong months and clear room to grow reach with a steadier cadence."
+)
+
+
+class BenchmarkChatModel(BaseChatModel):
+    """Deterministic local chat model for benchmarks.
+    
+    Replies are canned per requested schema (monthly note, recommendations, else executive summary)
+    and arrive after latency ± jitter seconds, seeded by the prompt so runs are repeatable.
+    """
+    
+    latency: float = 0.05
+    jitter: float = 0.0
+    seed: int = 0
+    calls: int = 0
+    prompt_chars: int = 0
+    
+    @property
+    def _llm_type(self) -> str:
+        return "laie-benchmark"
+    
+    def _reply(self, messages: List[BaseMessage], response_format: Optional[Dict[str, Any]] = None) -> str:
+        # Structured calls are recognised by the schema they request
+        schema_name = ((response_format or {}).get("json_schema") or {}).get("name")
+        if schema_name == "MonthlyNoteOutput":
+            return BENCHMARK_MONTHLY_NOTE
+        if schema_name == "MonthlyNotesOutput":
+            months = [line.split(":", 1)[0][len("MONTH "):] for line in messages[-1].content.splitlines() if line.startswith("MONTH ")]
+            return json.dumps({"notes": [{**json.loads(BENCHMARK_MONTHLY_NOTE), "month": month} for month in months]})
+        if schema_name == "RecommendationsOutput":
+            return BENCHMARK_RECOMMENDATIONS
+        return BENCHMARK_SUMMARY
+    
+    def _delay(self, messages: List[BaseMessage]) -> float:
+        prompt = "".join(str(message.content) for message in messages)
+        with _benchmark_llm_lock:
+            self.calls += 1
+            self.prompt_chars += len(prompt)
+        rnd = random.Random(f"{self.seed}:{prompt}")
+        return max(0.0, self.latency + rnd.uniform(-self.jitter, self.jitter))
+    
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs) -> ChatResult:
+        time.sleep(self._delay(messages))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self._reply(messages, kwargs.get("response_format"))))])
+    
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs) -> ChatResult:
+        await asyncio.sleep(self._delay(messages))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self._reply(messages, kwargs.get("response_format"))))])
+
+
+def _analysis_months() -> int:
+    return (ANALYSIS_END_DATE.year - ANALYSIS_START_DATE.year) * 12 + ANALYSIS_END_DATE.month - ANALYSIS_START_DATE.month
+
+
+def write_synthetic_gdpr_export(path: Path, public_id: str, posts_per_month: int, seed: int = 0) -> Path:
+    """Write a LinkedIn GDPR-style export zip (Profile.csv, Connections.csv, Shares.csv) for the analysis window."""
+    rnd = random.Random(f"{seed}:{public_id}")
+    path = Path(path)
+    
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(
+            "Profile.csv",
+            "First Name,Last Name,Headline,Summary,Industry,Geo Location\n"
+            f"Bench,{public_id},Benchmark Profile,Synthetic profile for benchmarks,Software,Remote\n"
+        )
+        
+        connections = io.StringIO()
+        connections.write("Notes:\nSynthetic connections\n\nFirst Name,Last Name,URL,Email Address,Company,Position,Connected On\n")
+        for i in range(50 * posts_per_month):
+            connections.write(f"C{i},L{i},,,Co,Role,01 Jan 2024\n")
+        archive.writestr("Connections.csv", connections.getvalue())
+        
+        shares = io.StringIO()
+        writer = csv.writer(shares)
+        writer.writerow(["Date", "ShareLink", "ShareCommentary", "SharedUrl", "MediaUrl", "Visibility"])
+        total_seconds = int((ANALYSIS_END_DATE - ANALYSIS_START_DATE).total_seconds())
+        for i in range(posts_per_month * _analysis_months()):
+            published_at = ANALYSIS_START_DATE + timedelta(seconds=rnd.randrange(total_seconds))
+            media_url = rnd.choice(["", "", "https://media.licdn.com/image.jpg", "https://media.licdn.com/video.mp4"])
+            writer.writerow([
+                published_at.strftime("%Y-%m-%d %H:%M:%S"),
+                f"https://www.linkedin.com/feed/update/urn%3Ali%3Ashare%3A{i}",
+                f"Benchmark post {i} about topic {rnd.randrange(20)}",
+                "",
+                media_url,
+                "MEMBER_NETWORK"
+            ])
+        archive.writestr("Shares.csv", shares.getvalue())
+    
+    return path
+
+
+@contextmanager
+def benchmark_environment(fake_llm: BenchmarkChatModel, system: "MultiAgentLAIESystem", quiet: bool = True):
+    """
+    Give the LLM agents the fake LLM (uncached, still instrumented) and bypass the ingestion store so every run does the full work.
+    
+    The analysis store, daily rollup store and checkpointer system and the agents write to are
+    swapped for fresh ones in a temporary directory, so benchmarks neither read nor pollute the
+    real stores under .laie_cache.
+    """
+    global laie_checkpointer
+    agents = (monthly_analysis_agent, summary_agent)
+    original_llms, original_store = [agent.llm for agent in agents], ingestion_agent.store
+    original_stores = (system.analysis_store, system.checkpointer, system.graph,
+                       analytics_agent.rollup_store, laie_checkpointer)
+    benchmark_llm = CachedChatModel(fake_llm, None, "benchmark")
+    for agent in agents:
+        agent.llm = benchmark_llm
+    ingestion_agent.store = None
+    
+    with tempfile.TemporaryDirectory(prefix="laie-benchmark-", ignore_cleanup_errors=True) as state_dir:
+        state_dir = Path(state_dir)
+        system.analysis_store = AnalysisStore(state_dir / "analyses.sqlite")
+        if analytics_agent.rollup_store is not None:
+            analytics_agent.rollup_store = DailyRollupStore(state_dir / "rollups.sqlite")
+        if system.checkpointer is not None:
+            laie_checkpointer = system.checkpointer = SqliteCheckpointSaver(state_dir / "checkpoints.sqlite")
+            system.graph = workflow.compile(checkpointer=laie_checkpointer)
+        try:
+            if quiet:
+                # Agents print progress; keep benchmark output readable
+                with contextlib.redirect_stdout(io.StringIO()):
+                    yield
+            else:
+                yield
+        finally:
+            for agent, original_llm in zip(agents, original_llms):
+                agent.llm = original_llm
+            ingestion_agent.store = original_store
+            (system.analysis_store, system.checkpointer, system.graph,
+             analytics_agent.rollup_store, laie_checkpointer) = original_stores
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Process high-water RSS in MB (None where the resource module is unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _time_nodes(system: "MultiAgentLAIESystem", public_id: str, data_sources: Dict[str, Any]) -> Dict[str, float]:
+    """Wall seconds per graph node, from the gaps between streamed node completions."""
+    node_seconds = {}
+    last = time.perf_counter()
+    for event in system.stream_analysis(public_id, data_sources):
+        if event["event"] == "node_completed":
+            now = time.perf_counter()
+            node_seconds[event["node"]] = node_seconds.get(event["node"], 0.0) + now - last
+            last = now
+        elif event["event"] == "result" and not event["result"].get("success"):
+            raise RuntimeError(f"Benchmark run failed: {event['result'].get('errors') or event['result'].get('error')}")
+    return node_seconds
+
+
+def _time_run(system: "MultiAgentLAIESystem", public_id: str, data_sources: Dict[str, Any]) -> Dict[str, float]:
+    """Wall and CPU seconds for one run_analysis call."""
+    wall, cpu = time.perf_counter(), time.process_time()
+    result = system.run_analysis(public_id, data_sources)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    if not result.get("success"):
+        raise RuntimeError(f"Benchmark run failed: {result.get('errors') or result.get('error')}")
+    return {"wall_seconds": wall, "cpu_seconds": cpu}
+
+
+def run_benchmarks(scales: Iterable[int] = (1, 10, 100), repeats: int = 3,
+                   posts_per_month: int = 4, llm_latency: float = 0.05, llm_jitter: float = 0.02,
+                   seed: int = 7, output_path: Optional[Path] = BENCHMARK_BASELINE_PATH,
+                   quiet: bool = True) -> Dict[str, Any]:
+    """
+    Benchmark run_analysis end to end and per graph node at several post volumes.
+    
+    Args:
+        scales: Post-volume multipliers of posts_per_month (1x, 10x, 100x by default)
+        repeats: Timed runs per scale; medians are reported
+        posts_per_month: Posts per month at 1x
+        llm_latency: Fake LLM latency per call, in seconds
+        llm_jitter: Uniform jitter added to each call's latency, in seconds
+        seed: Seed for synthetic data and LLM jitter
+        output_path: Where to write the JSON results (None to skip writing)
+        quiet: Suppress agent progress prints during runs
+    
+    Returns:
+        {"meta": ..., "scales": {"1x": {...}, ...}} with wall/CPU seconds, per-node seconds,
+        peak traced Python memory, process peak RSS and LLM call counts
+    """
+    report = {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat(),
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "analytics_engine": analytics_agent.engine,
+            "repeats": repeats,
+            "posts_per_month": posts_per_month,
+            "llm_latency": llm_latency,
+            "llm_jitter": llm_jitter,
+            "seed": seed
+        },
+        "scales": {}
+    }
+    system = MultiAgentLAIESystem()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in scales:
+            public_id = f"benchmark-{scale}x"
+            export_path = write_synthetic_gdpr_export(Path(tmp) / f"{public_id}.zip", public_id, posts_per_month * scale, seed)
+            data_sources = {"gdpr_export": str(export_path)}
+            
+            runs, node_runs, llm_calls = [], [], []
+            for _ in range(repeats):
+                fake_llm = BenchmarkChatModel(latency=llm_latency, jitter=llm_jitter, seed=seed)
+                with benchmark_environment(fake_llm, system, quiet):
+                    node_runs.append(_time_nodes(system, public_id, data_sources))
+                    calls_before = fake_llm.calls
+                    runs.append(_time_run(system, public_id, data_sources))
+                    llm_calls.append(fake_llm.calls - calls_before)
+            
+            # One extra, untimed pass under tracemalloc for peak Python allocations
+            with benchmark_environment(BenchmarkChatModel(latency=0.0, seed=seed), system, quiet):
+                tracemalloc.start()
+                system.run_analysis(public_id, data_sources)
+                peak_traced = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            
+            report["scales"][f"{scale}x"] = {
+                "posts": posts_per_month * scale * _analysis_months(),
+                "wall_seconds": statistics.median(run["wall_seconds"] for run in runs),
+                "cpu_seconds": statistics.median(run["cpu_seconds"] for run in runs),
+                "node_seconds": {
+                    node: statistics.median(node_run.get(node, 0.0) for node_run in node_runs)
+                    for node in node_runs[0]
+                },
+                "llm_calls": max(llm_calls),
+                "peak_traced_mb": peak_traced / (1024 * 1024),
+                "peak_rss_mb": _peak_rss_mb()
+            }
+            logger.info(f"Benchmark {scale}x: {report['scales'][f'{scale}x']['wall_seconds']:.3f}s wall")
+    
+    if output_path:
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(report, indent=2))
+    
+    return report
+
+
+def compare_benchmarks(current: Dict[str, Any], baseline: Union[Dict[str, Any], Path, str],
+                       tolerance: float = 0.2) -> List[Dict[str, Any]]:
+    """
+    List regressions of current vs baseline: metrics that grew by more than tolerance.
+    
+    Compares wall/CPU seconds, per-node seconds, LLM calls and peak traced memory for every
+    scale present in both reports.
+    """
+    if not isinstance(baseline, dict):
+        baseline = json.loads(Path(baseline).read_text())
+    
+    regressions = []
+    for scale, current_stats in current["scales"].items():
+        baseline_stats = baseline["scales"].get(scale)
+        if not baseline_stats:
+            continue
+        
+        metrics = {key: (baseline_stats.get(key), current_stats.get(key))
+                   for key in ("wall_seconds", "cpu_seconds", "llm_calls", "peak_traced_mb")}
+        for node, seconds in current_stats.get("node_seconds", {}).items():
+            metrics[f"node_seconds.{node}"] = (baseline_stats.get("node_seconds", {}).get(node), seconds)
+        
+        for metric, (before, after) in metrics.items():
+            if before and after is not None and after > before * (1 + tolerance):
+                regressions.append({
+                    "scale": scale,
+                    "metric": metric,
+                    "baseline": before,
+                    "current": after,
+                    "change": after / before - 1
+                })
+    
+    return regressions
+
+
+print(" Benchmark harness ready")
+print("   → run_benchmarks(): 1x/10x/100x synthetic GDPR exports, fake LLM")
+print("   → compare_benchmarks(): regressions against a JSON baseline")
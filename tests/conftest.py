@@ -0,0 +1,45 @@
+"""Load the notebook cells (00_import.py ... 12_benchmark.py) into one module, as the notebook runs them."""
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="session")
+def laie(tmp_path_factory):
+    """The cells' shared namespace, configured with a fixed window and every store under a temp dir."""
+    state_dir = tmp_path_factory.mktemp("laie_state")
+    env = {
+        "AI_FOUNDRY_PROJECT_ENDPOINT": "https://laie-tests.openai.azure.com",
+        "AI_FOUNDRY_API_KEY": "test-key",
+        "LAIE_ANALYSIS_ROLLING_DAYS": "0",
+        "LAIE_ANALYSIS_START_DATE": "2025-01-01",
+        "LAIE_ANALYSIS_END_DATE": "2026-01-01",
+        "LAIE_LINKEDIN_API_PAGE_SIZE": "2",
+        "LAIE_LLM_CACHE_ENABLED": "false",
+        "LAIE_INGESTION_STORE_ENABLED": "false",
+        "LAIE_LLM_CACHE_PATH": str(state_dir / "llm_cache.sqlite"),
+        "LAIE_CHECKPOINT_PATH": str(state_dir / "checkpoints.sqlite"),
+        "LAIE_ANALYSIS_STORE_PATH": str(state_dir / "analyses.sqlite"),
+        "LAIE_ROLLUP_STORE_PATH": str(state_dir / "rollups.sqlite"),
+        "LAIE_INGESTION_STORE_PATH": str(state_dir / "ingestion.sqlite"),
+        "LAIE_FETCH_CHECKPOINT_PATH": str(state_dir / "fetch_checkpoints.sqlite"),
+        "LAIE_PROXYCURL_CACHE_PATH": str(state_dir / "proxycurl_cache.sqlite"),
+        "LAIE_BENCHMARK_BASELINE_PATH": str(state_dir / "baseline.json"),
+    }
+    patch = pytest.MonkeyPatch()
+    for name, value in env.items():
+        patch.setenv(name, value)
+
+    module = types.ModuleType("laie")
+    sys.modules["laie"] = module
+    for path in sorted(REPO.glob("[0-9][0-9]_*.py")):
+        exec(compile(path.read_text(encoding="utf-8"), str(path), "exec"), module.__dict__)
+
+    yield module
+
+    patch.undo()
+    sys.modules.pop("laie", None)
@@ -0,0 +1,78 @@
+"""Benchmark comparison against the committed baseline in benchmarks/baseline.json."""
+import copy
+import json
+
+import pytest
+
+from conftest import REPO
+
+BASELINE = REPO / "benchmarks" / "baseline.json"
+
+
+def report(wall_seconds=1.0, llm_calls=13, node_seconds=None):
+    return {"scales": {"1x": {
+        "wall_seconds": wall_seconds,
+        "cpu_seconds": 0.5,
+        "llm_calls": llm_calls,
+        "peak_traced_mb": 2.0,
+        "node_seconds": node_seconds or {"analytics": 0.1},
+    }}}
+
+
+def test_within_tolerance_is_not_a_regression(laie):
+    assert laie.compare_benchmarks(report(wall_seconds=1.15), report(), tolerance=0.2) == []
+
+
+def test_growth_beyond_tolerance_is_reported(laie):
+    regressions = laie.compare_benchmarks(
+        report(wall_seconds=1.5, node_seconds={"analytics": 0.3}), report(), tolerance=0.2
+    )
+
+    assert {(r["scale"], r["metric"]) for r in regressions} == {("1x", "wall_seconds"), ("1x", "node_seconds.analytics")}
+    wall = next(r for r in regressions if r["metric"] == "wall_seconds")
+    assert wall["baseline"] == 1.0 and wall["current"] == 1.5
+    assert wall["change"] == pytest.approx(0.5)
+
+
+def test_scales_and_metrics_missing_from_the_baseline_are_skipped(laie):
+    current = report(llm_calls=40, node_seconds={"analytics": 0.1, "new_node": 9.0})
+    current["scales"]["1000x"] = copy.deepcopy(current["scales"]["1x"])
+
+    assert [r["metric"] for r in laie.compare_benchmarks(current, report())] == ["llm_calls"]
+
+
+def test_baseline_loads_from_a_path(laie, tmp_path):
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps(report()))
+
+    assert laie.compare_benchmarks(report(llm_calls=20), path)[0]["metric"] == "llm_calls"
+    assert laie.compare_benchmarks(report(), str(path)) == []
+
+
+def test_committed_baseline_covers_every_scale(laie):
+    baseline = json.loads(BASELINE.read_text())
+
+    assert set(baseline["scales"]) == {"1x", "10x", "100x"}
+    for stats in baseline["scales"].values():
+        assert {"wall_seconds", "cpu_seconds", "llm_calls", "peak_traced_mb", "node_seconds"} <= set(stats)
+    assert laie.compare_benchmarks(baseline, BASELINE) == []
+
+
+def test_llm_calls_do_not_regress_against_the_committed_baseline(laie):
+    # Timings depend on the machine; the number of LLM calls per run does not
+    current = laie.run_benchmarks(scales=(1,), repeats=1, llm_latency=0.0, llm_jitter=0.0, output_path=None)
+
+    regressions = laie.compare_benchmarks(current, BASELINE, tolerance=0.0)
+    assert [r for r in regressions if r["metric"] == "llm_calls"] == []
+
+
+def test_benchmarks_leave_the_configured_stores_untouched(laie):
+    system = laie.MultiAgentLAIESystem()
+    stores = (system.analysis_store, system.checkpointer, laie.analytics_agent.rollup_store, laie.laie_checkpointer)
+
+    with laie.benchmark_environment(laie.BenchmarkChatModel(latency=0.0), system):
+        assert system.analysis_store is not stores[0]
+        assert system.analysis_store.path.parent != laie.ANALYSIS_STORE_PATH.parent
+        assert laie.laie_checkpointer is system.checkpointer is not stores[1]
+
+    assert (system.analysis_store, system.checkpointer, laie.analytics_agent.rollup_store, laie.laie_checkpointer) == stores
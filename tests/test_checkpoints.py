@@ -0,0 +1,100 @@
+"""Graph checkpoints: no data-source secrets on disk, and unresumable runs are pruned."""
+import zlib
+
+import pytest
+
+PASSWORD, LI_AT, API_KEY = "hunter2-password", "AQEDAR-li-at-cookie", "pc-secret-api-key"
+
+
+def checkpoint_bytes(checkpointer, thread_id):
+    """Every stored value of thread_id, decompressed where compressed."""
+    rows = []
+    for table, column in (("blobs", "value"), ("writes", "value"), ("checkpoints", "checkpoint")):
+        rows += checkpointer._conn.execute(f"SELECT {column} FROM {table} WHERE thread_id = ?", (thread_id,)).fetchall()
+    values = []
+    for (value,) in rows:
+        try:
+            values.append(zlib.decompress(value))
+        except (zlib.error, TypeError):
+            values.append(value or b"")
+    return b"".join(values)
+
+
+def thread_ids(checkpointer, public_id):
+    rows = checkpointer._conn.execute(
+        "SELECT DISTINCT thread_id FROM checkpoints WHERE thread_id LIKE ?", (f"{public_id}:%",)
+    ).fetchall()
+    return {thread_id for (thread_id,) in rows}
+
+
+SOURCES = {
+    "linkedin_credentials": {"email": "jane@example.com", "password": PASSWORD, "li_at": LI_AT},
+    "proxycurl_api_key": API_KEY,
+}
+
+
+@pytest.fixture
+def seen_sources(laie, monkeypatch):
+    """Fail ingestion straight away (after the initial state is checkpointed), recording the sources it got."""
+    seen = {}
+
+    def collect(public_id, data_sources, since=None):
+        seen.update(data_sources)
+        raise ValueError("source unavailable")
+
+    monkeypatch.setattr(laie.ingestion_agent, "_collect_from_source", collect)
+    return seen
+
+
+@pytest.fixture
+def system(laie, seen_sources):
+    return laie.MultiAgentLAIESystem()
+
+
+def test_failed_run_checkpoints_hold_no_secrets(laie, system):
+    result = system.run_analysis("secret-jane", SOURCES)
+
+    assert not result["success"]
+    stored = checkpoint_bytes(system.checkpointer, result["run_id"])
+    assert stored  # the run was checkpointed
+    for secret in (PASSWORD, LI_AT, API_KEY):
+        assert secret.encode() not in stored
+    # Nothing outlives the run in the process either
+    assert len(laie.credential_store._secrets) == 0
+
+
+def test_ingestion_still_receives_the_secrets(system, seen_sources):
+    system.run_analysis("secret-ingest", SOURCES)
+
+    assert seen_sources["linkedin_credentials"]["password"] == PASSWORD
+    assert seen_sources["proxycurl_api_key"] == API_KEY
+
+
+def test_new_run_prunes_the_profiles_earlier_unfinished_runs(system):
+    first = system.run_analysis("prune-jane", SOURCES)
+    second = system.run_analysis("prune-jane", SOURCES)
+
+    assert thread_ids(system.checkpointer, "prune-jane") == {second["run_id"]}
+    assert system.checkpointer.resumable_run("prune-jane") == second["run_id"]
+    assert first["run_id"] != second["run_id"]
+
+
+def test_expired_runs_are_pruned(system, monkeypatch):
+    result = system.run_analysis("expired-jane", SOURCES)
+    monkeypatch.setattr(system.checkpointer, "max_age_seconds", -1)
+
+    assert system.checkpointer.resumable_run("expired-jane") is None
+    assert thread_ids(system.checkpointer, "expired-jane") == set()
+    assert result["run_id"]
+
+
+def test_resuming_takes_the_secrets_again_from_the_caller(laie, system):
+    result = system.run_analysis("resume-jane", SOURCES)
+
+    # Without the sources a run still waiting on ingestion cannot resume
+    assert system._resume_point("resume-jane") is None
+
+    config, run_id, (posts_ref, credentials_ref) = system._resume_point("resume-jane", SOURCES)
+    assert run_id == result["run_id"]
+    assert laie.credential_store.resolve({}, credentials_ref) == SOURCES
+    laie.credential_store.release(credentials_ref)
@@ -0,0 +1,104 @@
+"""linkedin-api ingestion: replaying recorded responses and resuming checkpointed fetches."""
+import json
+from datetime import datetime
+
+import pytest
+
+
+def share(post_id, published_at):
+    """One feed element as get_profile_posts_page returns it."""
+    return {"update": {"share": {
+        "urn": f"urn:li:share:{post_id}",
+        "text": {"text": f"post {post_id}"},
+        "created": {"time": int(published_at.timestamp() * 1000)},
+    }}}
+
+
+@pytest.fixture
+def recording(tmp_path):
+    """A replay file with four pages of two posts; the last page crosses ANALYSIS_START_DATE."""
+    path = tmp_path / "recording.json"
+    path.write_text(json.dumps({
+        "profiles": {"jane": {"firstName": "Jane", "lastName": "Doe", "headline": "Engineer", "urn_id": "urn-jane"}},
+        "pages": {"urn-jane": [
+            {"elements": [share(1, datetime(2025, 12, 20)), share(2, datetime(2025, 11, 3))]},
+            {"elements": [share(3, datetime(2025, 9, 14)), share(4, datetime(2025, 6, 1))]},
+            {"elements": [share(5, datetime(2025, 3, 9)), share(6, datetime(2025, 2, 2))]},
+            {"elements": [share(7, datetime(2025, 1, 5)), share(8, datetime(2024, 12, 30))]},
+        ]},
+    }))
+    return path
+
+
+class FlakyClient:
+    """Wraps a RecordedLinkedinClient, failing once at fail_at and recording the offsets requested."""
+
+    def __init__(self, client, fail_at=None):
+        self.client = client
+        self.fail_at = fail_at
+        self.starts = []
+
+    def get_profile_posts_page(self, urn_id, start, count, pagination_token=None):
+        self.starts.append(start)
+        if start == self.fail_at:
+            self.fail_at = None
+            raise ConnectionError("connection reset")
+        return self.client.get_profile_posts_page(urn_id, start, count, pagination_token)
+
+
+def post_ids(posts):
+    return [post.post_id for post in posts]
+
+
+def test_replay_fetches_profile_and_windowed_posts(laie, recording):
+    profile, posts = laie.ingestion_agent._fetch_linkedin_api_data("jane", {"replay_file": str(recording)})
+
+    assert profile.full_name == "Jane Doe"
+    assert profile.headline == "Engineer"
+    # Post 8 predates the window; paging stops on the page that reaches it
+    assert post_ids(posts) == ["1", "2", "3", "4", "5", "6", "7"]
+
+
+def test_interrupted_fetch_resumes_from_checkpoint(laie, recording):
+    client = FlakyClient(laie.RecordedLinkedinClient(str(recording)), fail_at=4)
+
+    with pytest.raises(ConnectionError):
+        laie.ingestion_agent._fetch_linkedin_posts(client, "resume", "urn-jane")
+    posts = laie.ingestion_agent._fetch_linkedin_posts(client, "resume", "urn-jane")
+
+    assert client.starts == [0, 2, 4, 4, 6]
+    assert post_ids(posts) == ["1", "2", "3", "4", "5", "6", "7"]
+
+
+def test_finished_fetch_clears_its_checkpoint(laie, recording):
+    client = FlakyClient(laie.RecordedLinkedinClient(str(recording)))
+    laie.ingestion_agent._fetch_linkedin_posts(client, "finished", "urn-jane")
+    laie.ingestion_agent._fetch_linkedin_posts(client, "finished", "urn-jane")
+
+    assert client.starts == [0, 2, 4, 6] * 2
+
+
+def test_stale_checkpoint_is_discarded(laie, recording, monkeypatch):
+    client = FlakyClient(laie.RecordedLinkedinClient(str(recording)), fail_at=4)
+    with pytest.raises(ConnectionError):
+        laie.ingestion_agent._fetch_linkedin_posts(client, "stale", "urn-jane")
+
+    monkeypatch.setattr(laie.fetch_checkpoints, "max_age_seconds", -1)
+    posts = laie.ingestion_agent._fetch_linkedin_posts(client, "stale", "urn-jane")
+
+    assert client.starts == [0, 2, 4, 0, 2, 4, 6]
+    assert post_ids(posts) == ["1", "2", "3", "4", "5", "6", "7"]
+
+
+def test_posts_repeated_across_pages_are_returned_once(laie, tmp_path):
+    # A post published while paging shifts the feed, so the next page repeats the previous page's last post
+    path = tmp_path / "shifted.json"
+    path.write_text(json.dumps({"profiles": {}, "pages": {"urn-shift": [
+        {"elements": [share(1, datetime(2025, 8, 1)), share(2, datetime(2025, 7, 1))]},
+        {"elements": [share(2, datetime(2025, 7, 1)), share(3, datetime(2025, 6, 1))]},
+        {"elements": [share(4, datetime(2024, 11, 1))]},
+    ]}}))
+
+    posts = laie.ingestion_agent._fetch_linkedin_posts(laie.RecordedLinkedinClient(str(path)), "shift", "urn-shift")
+
+    assert post_ids(posts) == ["1", "2", "3"]
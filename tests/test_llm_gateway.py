@@ -0,0 +1,199 @@
+"""LLMGateway failover, circuit breaking and AIMD concurrency against fake deployments."""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+PROMPT = [HumanMessage(content="Summarize March")]
+
+
+class StatusError(Exception):
+    """An API error carrying an HTTP status (and optional response headers), as openai's errors do."""
+
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+class FakeModel:
+    """Chat model that plays back a script of replies and exceptions, then keeps replying."""
+
+    temperature = 0.2
+
+    def __init__(self, name, *script, latency=0.0):
+        self.name = name
+        self.script = list(script)
+        self.latency = latency
+        self.calls = 0
+
+    def _next(self):
+        self.calls += 1
+        outcome = self.script.pop(0) if self.script else f"reply from {self.name}"
+        if isinstance(outcome, Exception):
+            raise outcome
+        return AIMessage(content=outcome)
+
+    def invoke(self, input, config=None, **kwargs):
+        time.sleep(self.latency)
+        return self._next()
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        await asyncio.sleep(self.latency)
+        return self._next()
+
+
+@pytest.fixture
+def make_gateway(laie):
+    def make(*models, max_retries=3, **deployment_kwargs):
+        deployments = [
+            laie.LLMDeployment(model.name, model, rpm=10_000, tpm=10_000_000, max_concurrency=4, **deployment_kwargs)
+            for model in models
+        ]
+        return laie.LLMGateway(deployments, max_retries=max_retries, backoff_seconds=0)
+    return make
+
+
+def test_transient_failure_fails_over_to_next_deployment(make_gateway):
+    primary, secondary = FakeModel("primary", StatusError(503)), FakeModel("secondary")
+    # One failure opens the primary's circuit, so the retry has to go elsewhere
+    gateway = make_gateway(primary, secondary, failure_threshold=1)
+
+    response = gateway.invoke(PROMPT)
+
+    assert response.content == "reply from secondary"
+    assert response.response_metadata["deployment"] == "secondary"
+    assert gateway.status()["primary"]["circuit"] == "open"
+    assert [d.in_flight for d in gateway.deployments] == [0, 0]
+
+
+def test_non_transient_error_is_raised_without_retry(make_gateway):
+    primary, secondary = FakeModel("primary", StatusError(400)), FakeModel("secondary")
+    gateway = make_gateway(primary, secondary)
+
+    with pytest.raises(StatusError):
+        gateway.invoke(PROMPT)
+
+    assert (primary.calls, secondary.calls) == (1, 0)
+    # Bad input is not the deployment's fault
+    assert gateway.status()["primary"]["failures"] == 0
+
+
+def test_retries_are_bounded(make_gateway):
+    model = FakeModel("only", *[StatusError(500)] * 5)
+    gateway = make_gateway(model, max_retries=2, failure_threshold=10)
+
+    with pytest.raises(StatusError):
+        gateway.invoke(PROMPT)
+
+    assert model.calls == 3
+
+
+def test_circuit_opens_after_consecutive_failures_and_recovers(make_gateway):
+    primary = FakeModel("primary", StatusError(502), StatusError(502))
+    secondary = FakeModel("secondary")
+    gateway = make_gateway(primary, secondary, max_retries=0, failure_threshold=2, reset_seconds=0.2)
+
+    for _ in range(2):
+        with pytest.raises(StatusError):
+            gateway.invoke(PROMPT)
+    assert gateway.status()["primary"]["circuit"] == "open"
+    assert gateway.status()["primary"]["circuit_opens"] == 1
+
+    # While open every call goes to the secondary
+    for _ in range(3):
+        assert gateway.invoke(PROMPT).response_metadata["deployment"] == "secondary"
+    assert primary.calls == 2
+
+    # After reset_seconds one trial request reaches the primary and, succeeding, closes the circuit
+    time.sleep(0.25)
+    gateway.deployments[1].in_flight = gateway.deployments[1].max_concurrency  # keep the secondary busy
+    assert gateway.invoke(PROMPT).response_metadata["deployment"] == "primary"
+    assert gateway.status()["primary"]["circuit"] == "closed"
+
+
+def test_throttling_halves_concurrency_and_success_grows_it_back(make_gateway):
+    primary = FakeModel("primary", StatusError(429, {"retry-after-ms": "100"}))
+    secondary = FakeModel("secondary")
+    gateway = make_gateway(primary, secondary)
+    deployment = gateway.deployments[0]
+
+    assert gateway.invoke(PROMPT).response_metadata["deployment"] == "secondary"
+    assert deployment.status()["throttled"] == 1
+    assert deployment.concurrency_limit == 2.0
+    # Blocked for Retry-After, then it admits requests again
+    assert deployment.try_acquire(1, time.monotonic()) > 0
+    time.sleep(0.15)
+
+    gateway.deployments[1].in_flight = gateway.deployments[1].max_concurrency
+    gateway.invoke(PROMPT)
+    assert deployment.concurrency_limit == pytest.approx(2.5)
+    assert deployment.status()["failures"] == 0
+
+
+def test_cancelled_call_frees_its_slot(make_gateway):
+    model = FakeModel("only", latency=1.0)
+    gateway = make_gateway(model)
+
+    async def cancel_mid_call():
+        task = asyncio.create_task(gateway.ainvoke(PROMPT))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_mid_call())
+
+    status = gateway.status()["only"]
+    assert status["in_flight"] == 0
+    assert status["failures"] == 0
+
+
+def test_cached_reply_is_keyed_on_the_serving_deployment(laie, make_gateway, tmp_path):
+    primary, secondary = FakeModel("primary", StatusError(503)), FakeModel("secondary")
+    gateway = make_gateway(primary, secondary, failure_threshold=1)
+    cache = laie.LLMResponseCache(tmp_path / "cache.sqlite", ttl_seconds=3600, max_entries=100)
+    model = laie.CachedChatModel(gateway, cache, "primary")
+
+    model.invoke(PROMPT)
+    keys = model._cache_keys(PROMPT)
+    assert cache.get(keys["primary"]) is None
+    assert cache.get(keys["secondary"]) == "reply from secondary"
+
+    # A repeat is served from the secondary's entry without another upstream call
+    repeat = model.invoke(PROMPT)
+    assert repeat.response_metadata == {"cache_hit": True, "deployment": "secondary"}
+    assert secondary.calls == 1
+
+    model.forget(PROMPT)
+    assert cache.get(keys["secondary"]) is None
+
+
+def test_quota_reserves_each_deployments_own_completion_limit(make_gateway, monkeypatch):
+    primary, secondary = FakeModel("primary"), FakeModel("secondary")
+    primary.max_tokens, secondary.max_tokens = 2000, 500
+    gateway = make_gateway(primary, secondary)
+    reserved = []
+
+    def recording(deployment, saturated):
+        acquire = deployment.try_acquire
+
+        def try_acquire(tokens, now):
+            reserved.append((deployment.name, tokens))
+            return 1.0 if saturated else acquire(tokens, now)
+        return try_acquire
+
+    # The primary reports itself saturated, so every call asks both deployments
+    for deployment in gateway.deployments:
+        monkeypatch.setattr(deployment, "try_acquire", recording(deployment, deployment.name == "primary"))
+    prompt_tokens = gateway._prompt_tokens(PROMPT)
+
+    assert gateway.invoke(PROMPT).response_metadata["deployment"] == "secondary"
+    assert reserved == [("primary", prompt_tokens + 2000), ("secondary", prompt_tokens + 500)]
+
+    # An explicit max_tokens takes precedence over the models' own
+    reserved.clear()
+    gateway.invoke(PROMPT, max_tokens=300)
+    assert reserved == [("primary", prompt_tokens + 300), ("secondary", prompt_tokens + 300)]
@@ -0,0 +1,63 @@
+"""Multi-month note generation: how failed chunk requests are handled."""
+from types import SimpleNamespace
+
+PROFILE = {"full_name": "Jane Doe"}
+
+
+class StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class FailingLLM:
+    """Structured-output client whose every request fails with error, counting the requests."""
+
+    def __init__(self, error):
+        self.error = error
+        self.requests = 0
+
+    def with_structured_output(self, schema):
+        return self
+
+    def batch_as_completed(self, prompts, config=None, return_exceptions=False, **kwargs):
+        for index, _ in enumerate(prompts):
+            self.requests += 1
+            yield index, self.error
+
+
+def months(count):
+    return [
+        {"month": f"2025-{m:02d}", "posts_count": 5, "total_impressions": 1000, "total_likes": 40,
+         "engagement_rate": 0.04, "content_types": {"text": 5}}
+        for m in range(1, count + 1)
+    ]
+
+
+def test_transient_chunk_failure_gets_fallback_notes_without_per_month_calls(laie):
+    client = FailingLLM(StatusError(503))
+    agent = laie.MonthlyAnalysisAgent(llm_client=client, notes_mode="multi_month", retry_attempts=1)
+
+    notes = agent._generate_monthly_notes_multi(months(4), PROFILE)
+
+    assert client.requests == 1
+    assert [note["month"] for note in notes] == ["2025-01", "2025-02", "2025-03", "2025-04"]
+    assert all(note["fallback"] for note in notes)
+
+
+def test_unusable_chunk_reply_falls_back_to_per_month_calls(laie):
+    client = FailingLLM(laie.StructuredOutputError("no notes in reply"))
+    agent = laie.MonthlyAnalysisAgent(llm_client=client, notes_mode="multi_month", retry_attempts=1)
+
+    notes = agent._generate_monthly_notes_multi(months(3), PROFILE)
+
+    assert client.requests == 1 + 3
+    assert len(notes) == 3 and all(note["fallback"] for note in notes)
+
+
+def test_invalid_items_in_a_reply_are_dropped_for_per_month_calls(laie):
+    agent = laie.MonthlyAnalysisAgent(llm_client=FailingLLM(None))
+    chunk = months(2)
+    reply = SimpleNamespace(notes=[{"month": "2025-01"}])  # missing every other field
+
+    assert agent._collect_multi_month_notes(reply, chunk, PROFILE["full_name"]) == []